@@ -0,0 +1,41 @@
+"""AWS Lambda handler for LexLang.
+
+The pipeline is created once per container, outside the handler, and its
+processors are only built when a request first needs them. Set
+PIPELINE_PROFILE=light for tokenization/normalization-only functions.
+"""
+
+import json
+import logging
+import os
+
+from src.config import load_config
+from src.core.pipeline import Pipeline
+from src.exceptions import LexLangError
+
+logger = logging.getLogger()
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+
+config = load_config(os.getenv("LEXLANG_CONFIG", "configs/default.yaml"))
+pipeline = Pipeline(config)
+
+
+def lambda_handler(event, context):
+    """Process the text of an API Gateway (or direct) invocation."""
+    body = event.get("body", event)
+    if isinstance(body, str):
+        body = json.loads(body or "{}")
+
+    try:
+        results = pipeline.process(
+            text=body.get("text", ""),
+            dialect=body.get("dialect", "auto"),
+            tasks=body.get("tasks"),
+            output_format="dict"
+        )
+        return {"statusCode": 200,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps(results, ensure_ascii=False)}
+    except LexLangError as e:
+        logger.error(f"Processing error: {e}")
+        return {"statusCode": 400, "body": json.dumps({"detail": str(e)})}
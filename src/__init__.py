@@ -4,18 +4,23 @@ __version__ = "1.0.0"
 __author__ = "LexLang Team"
 __email__ = "contact@lexlang.org"
 
-from .core import Pipeline
-from .core.tokenizer import EweTokenizer
-from .core.normalizer import TextNormalizer
-from .core.pos_tagger import POSTagger
-from .core.tonal_processor import TonalProcessor
-from .core.dialect_handler import DialectDetector
+import importlib
 
-__all__ = [
-    "Pipeline",
-    "EweTokenizer", 
-    "TextNormalizer",
-    "POSTagger",
-    "TonalProcessor",
-    "DialectDetector"
-]
+# Public names are imported on first access, so that `import src` (and the
+# CLI) does not pay for loading every processor up front.
+_EXPORTS = {
+    "Pipeline": ".core",
+    "EweTokenizer": ".core.tokenizer",
+    "TextNormalizer": ".core.normalizer",
+    "POSTagger": ".core.pos_tagger",
+    "TonalProcessor": ".core.tonal_processor",
+    "DialectDetector": ".core.dialect_handler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,9 @@ Authentication utilities for LexLang API.
 This module provides a basic API key authentication mechanism.
 """
 
-from fastapi import Security, HTTPException, status
+from fastapi import Depends, Security, HTTPException, status
 from fastapi.security import APIKeyHeader
+import json
 import os
 import logging
 
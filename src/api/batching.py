@@ -0,0 +1,117 @@
+"""
+Micro-batching of concurrent API requests.
+
+Most API traffic is many short texts, and per-call overhead dominates the
+model stages. ``RequestBatcher`` holds each request for at most
+``max_wait`` seconds, so that concurrent requests with the same dialect,
+tasks and output format run through one ``Pipeline.process_many`` call. Each
+caller then gets back its own result or error.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import LexLangConfig
+from .executor import PipelineExecutor
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[str, Tuple[str, ...], str]
+
+
+class RequestBatcher:
+    """
+    Coalesces concurrent ``process`` calls into batched pipeline calls.
+
+    A batch is flushed when it reaches ``max_batch`` requests or when its
+    oldest request has waited ``max_wait`` seconds, whichever comes first.
+    Admission control is delegated to the ``PipelineExecutor`` and counted
+    in batches: opening a batch reserves one executor slot, which the batch
+    holds until its pipeline call returns. Requests joining an open batch
+    are always accepted, so a request is only rejected when it arrives and
+    no slot is left for a new batch.
+    """
+
+    def __init__(self, executor: PipelineExecutor, max_batch: int = 32,
+                 max_wait: float = 0.005):
+        self.executor = executor
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self._pending: Dict[BatchKey, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self._tasks = set()
+        self._stats = {"requests": 0, "batches": 0}
+
+    @classmethod
+    def from_config(cls, executor: PipelineExecutor,
+                    config: LexLangConfig) -> "RequestBatcher":
+        max_batch = config.api.batch_max_size or config.processing.batch_size
+        return cls(executor, max_batch=max_batch,
+                   max_wait=config.api.batch_max_wait_ms / 1000.0)
+
+    async def process(self, text: str, dialect: str = "auto",
+                      tasks: Optional[List[str]] = None,
+                      output_format: str = "json"):
+        """Same contract as ``Pipeline.process``, served from a shared batch."""
+        if tasks is None:
+            from ..core.pipeline import DEFAULT_TASKS
+            tasks = DEFAULT_TASKS
+        key = (dialect, tuple(tasks), output_format)
+        if key not in self._pending:
+            self.executor.admit()
+            self._pending[key] = []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending[key]
+        batch.append((text, future))
+        self._stats["requests"] += 1
+
+        if len(batch) >= self.max_batch:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+
+        result = await future
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _flush(self, key: BatchKey):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        self._stats["batches"] += 1
+        task = asyncio.ensure_future(self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: BatchKey, batch: List[Tuple[str, asyncio.Future]]):
+        dialect, tasks, output_format = key
+        try:
+            results = await self.executor.run(
+                "process_many",
+                texts=[text for text, _ in batch],
+                dialect=dialect,
+                tasks=list(tasks),
+                output_format=output_format
+            )
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} requests failed: {e}")
+            results = [e] * len(batch)
+        finally:
+            self.executor.release()
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["mean_batch_size"] = (stats["requests"] / stats["batches"]
+                                    if stats["batches"] else 0.0)
+        return stats
@@ -0,0 +1,134 @@
+"""
+Bounded execution of pipeline calls for the API.
+
+Pipeline work is CPU-bound, so running it directly inside an ``async`` route
+blocks the event loop and stalls every other request. ``PipelineExecutor``
+runs it on a thread or process pool instead and admits at most
+``max_concurrency + max_queue`` requests at a time; beyond that it refuses
+work immediately so that clients can back off and retry.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from ..config import LexLangConfig
+from ..core import parallel
+from ..exceptions import ConfigurationError, ServiceOverloadedError
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def _call_in_worker(method: str, kwargs: Dict[str, Any]):
+    return getattr(parallel._worker_pipeline, method)(**kwargs)
+
+
+class PipelineExecutor:
+    """
+    Runs ``Pipeline.process`` calls off the event loop.
+
+    With ``kind="thread"`` calls share the given pipeline (and its caches);
+    with ``kind="process"`` each worker process builds its own pipeline once,
+    which sidesteps the GIL at the cost of per-worker memory.
+    """
+
+    def __init__(self, pipeline, config: LexLangConfig):
+        api = config.api
+        if api.executor not in EXECUTOR_KINDS:
+            raise ConfigurationError(
+                f"Unknown API executor '{api.executor}', expected one of {EXECUTOR_KINDS}")
+        self.pipeline = pipeline
+        self.kind = api.executor
+        self.max_concurrency = max(1, api.max_concurrency)
+        self.max_queue = max(0, api.max_queue)
+        self.retry_after = api.retry_after
+        self._config = config
+        self._pool: Optional[Executor] = None
+        self._admitted = 0
+        self._rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_concurrency + self.max_queue
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    initializer=parallel._init_worker,
+                    initargs=(self._config, self.pipeline.get_model_versions(),
+                              self.pipeline.profile))
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="lexlang-api")
+        return self._pool
+
+    def admit(self, count: int = 1):
+        """Reserve room for ``count`` requests, or raise ``ServiceOverloadedError``.
+
+        Every successful call must be matched by ``release(count)``.
+        """
+        if self._admitted + count > self.capacity:
+            self._rejected += count
+            raise ServiceOverloadedError(
+                f"Server busy: {self._admitted} requests in progress",
+                retry_after=self.retry_after)
+        self._admitted += count
+
+    def release(self, count: int = 1):
+        self._admitted -= count
+
+    async def run(self, method: str, **kwargs):
+        """Run ``Pipeline.<method>(**kwargs)`` on the pool, without admission."""
+        loop = asyncio.get_running_loop()
+        if self.kind == "process":
+            call = functools.partial(_call_in_worker, method, kwargs)
+        else:
+            call = functools.partial(getattr(self.pipeline, method), **kwargs)
+        return await loop.run_in_executor(self._get_pool(), call)
+
+    async def process(self, **kwargs):
+        """Run ``Pipeline.process(**kwargs)`` on the pool.
+
+        Raises ``ServiceOverloadedError`` without queueing when the executor
+        is already holding ``capacity`` requests.
+        """
+        self.admit()
+        try:
+            return await self.run("process", **kwargs)
+        finally:
+            self.release()
+
+    def restart_workers(self):
+        """Start fresh worker processes after ``Pipeline.reload_model``.
+
+        Process workers hold their own pipelines, so a model swapped in the
+        parent only reaches them through new workers, started with the
+        parent's model versions. Calls already submitted finish on the old
+        workers, which then exit. Thread pools share the parent's pipeline
+        and need no restart.
+        """
+        if self.kind != "process" or self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        pool.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._admitted,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
@@ -5,6 +5,7 @@ This module sets up cross-origin resource sharing (CORS) and potentially other m
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from typing import Any
 import logging
 
 logger = logging.getLogger(__name__)
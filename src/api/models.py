@@ -6,12 +6,19 @@ These models define the data structures for communication with the LexLang API.
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
+class GeoLocation(BaseModel):
+    """Where a text comes from, used as a prior for dialect detection."""
+    lat: Optional[float] = Field(None, ge=-90, le=90, example=5.92, description="Latitude in degrees.")
+    lon: Optional[float] = Field(None, ge=-180, le=180, example=0.99, description="Longitude in degrees.")
+    region: Optional[str] = Field(None, example="GH-TV", description="Region code, used when no coordinates are given or no survey point is near them.")
+
 class ProcessRequest(BaseModel):
     """Request model for text processing."""
     text: str = Field(..., example="Ɖeka, eve, etɔ̃.", description="Input text to be processed.")
     dialect: Optional[str] = Field("auto", example="anlo", description="Target dialect for processing (e.g., 'anlo', 'inland', 'ho', 'kpando', or 'auto' for automatic detection).")
-    tasks: Optional[List[str]] = Field(["tokenize", "normalize", "pos"], example=["tokenize", "normalize", "tone"], description="List of processing tasks to perform (e.g., 'tokenize', 'normalize', 'pos', 'tone', 'dialect', 'morphology', 'embeddings').")
-    output_format: Optional[str] = Field("json", example="json", description="Desired output format ('json', 'text', 'conllu').")
+    tasks: Optional[List[str]] = Field(["tokenize", "normalize", "pos"], example=["tokenize", "normalize", "tone"], description="List of processing tasks to perform (e.g., 'tokenize', 'normalize', 'pos', 'tone', 'dialect', 'morphology', 'embeddings', or 'offsets' for token character offsets and spacing).")
+    output_format: Optional[str] = Field("json", example="json", description="Desired output format ('json', 'jsonl', 'text', 'conllu', or binary 'msgpack', 'npz', 'arrow').")
+    location: Optional[GeoLocation] = Field(None, description="Client location; its dialect distribution is combined with the text-based scores when the dialect is 'auto'.")
 
 class ProcessResponse(BaseModel):
     """Response model for text processing."""
@@ -20,9 +27,23 @@ class ProcessResponse(BaseModel):
     dialect_detected: Optional[str] = Field(None, example="anlo", description="Detected dialect if 'auto' was specified.")
     tasks_completed: List[str] = Field(..., example=["tokenize", "normalize", "pos"], description="List of tasks successfully completed.")
     
+class BatchProcessRequest(BaseModel):
+    """Request model for processing many texts in one call."""
+    texts: List[str] = Field(..., example=["Ɖeka, eve, etɔ̃.", "Ame si le afi ma."], description="Input texts to be processed.")
+    dialect: Optional[str] = Field("auto", example="anlo", description="Target dialect for every text, or 'auto' to detect it per text.")
+    tasks: Optional[List[str]] = Field(["tokenize", "normalize", "pos"], example=["tokenize", "pos"], description="List of processing tasks to perform on every text.")
+
+class BatchProcessResponse(BaseModel):
+    """Response model for batch processing."""
+    results: List[Dict[str, Any]] = Field(..., description="One result per input text, in order. Failed texts have an 'error' field.")
+    processing_time: float = Field(..., example=1.5, description="Time taken for processing in seconds.")
+    errors: int = Field(..., example=0, description="Number of texts that could not be processed.")
+    tasks_completed: List[str] = Field(..., example=["tokenize", "normalize", "pos"], description="List of tasks performed.")
+
 class AnalysisRequest(BaseModel):
     """Request model for comprehensive text analysis."""
     text: str = Field(..., example="Enye gbeŋutiŋutinye.", description="Input text for detailed linguistic analysis.")
+    location: Optional[GeoLocation] = Field(None, description="Client location, used as a prior for dialect detection.")
 
 class AnalysisResponse(BaseModel):
     """Response model for comprehensive text analysis."""
@@ -47,6 +68,16 @@ class TrainingResponse(BaseModel):
     metrics: Optional[Dict[str, Any]] = Field(None, example={"loss": 0.05, "accuracy": 0.92}, description="Metrics from the training process.")
     message: Optional[str] = Field(None, example="Model training completed successfully.", description="Detailed message about the training process.")
 
+class ModelReloadRequest(BaseModel):
+    """Request model for swapping in another model version."""
+    version: Optional[str] = Field(None, example="v1.3", description="Registered model version to load, or the same version reloaded from disk if omitted.")
+
+class ModelReloadResponse(BaseModel):
+    """Response model for model reloads and rollbacks."""
+    processor: str = Field(..., example="pos_tagger", description="Processor that was swapped.")
+    version: Optional[str] = Field(None, example="v1.3", description="Model version now serving requests (None: the registry's active version).")
+    previous_version: Optional[str] = Field(None, example="v1.2", description="Model version that was replaced, available for rollback.")
+
 class ErrorResponse(BaseModel):
     """Standard error response model."""
     detail: str = Field(..., example="Invalid input provided.", description="Error message.")
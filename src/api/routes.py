@@ -3,32 +3,84 @@ API routes for LexLang.
 This module defines the FastAPI endpoints for processing, analysis, and model management.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, status
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional, Dict, Any
+import asyncio
 import json
 import logging
+import time
 
 from ..core.pipeline import Pipeline # Assuming Pipeline is accessible
-from ..exceptions import LexLangError
+from ..core.pipeline import DEFAULT_TASKS
+from ..core.serializers import get_serializer
+from ..exceptions import LexLangError, ServiceOverloadedError
+from .batching import RequestBatcher
+from .executor import PipelineExecutor
 from .models import (
     ProcessRequest, ProcessResponse, 
+    BatchProcessRequest, BatchProcessResponse,
     AnalysisRequest, AnalysisResponse,
     TrainingRequest, TrainingResponse,
+    ModelReloadRequest, ModelReloadResponse,
     ErrorResponse
 )
-from .auth import get_current_user # Assuming a simple auth mechanism
+from .auth import get_current_user, has_role # Assuming a simple auth mechanism
 
 router = APIRouter()
+
+
+class ReleasingStreamingResponse(StreamingResponse):
+    """Streaming response that calls ``release`` once it has been sent or aborted."""
+
+    def __init__(self, content, release, **kwargs):
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
 logger = logging.getLogger(__name__)
 
 # This should ideally be initialized once by the main app or a dependency injection system
 # For simplicity, we assume 'pipeline_instance' is globally available or passed
 pipeline_instance: Optional[Pipeline] = None 
+executor_instance: Optional[PipelineExecutor] = None
+batcher_instance: Optional[RequestBatcher] = None
 
 def set_pipeline_instance(pipeline: Pipeline):
-    """Setter for the pipeline instance."""
-    global pipeline_instance
+    """Setter for the pipeline instance (and the executor that runs it)."""
+    global pipeline_instance, executor_instance, batcher_instance
+    if executor_instance is not None:
+        executor_instance.shutdown(wait=False)
     pipeline_instance = pipeline
+    executor_instance = PipelineExecutor(pipeline, pipeline.config)
+    batcher_instance = (RequestBatcher.from_config(executor_instance, pipeline.config)
+                        if pipeline.config.api.enable_batching else None)
+
+async def run_pipeline(**kwargs):
+    """Run ``Pipeline.process`` off the event loop, micro-batched when enabled.
+
+    Requests with a location are not batched: batches share one set of
+    ``Pipeline.process`` arguments.
+    """
+    if batcher_instance is not None and kwargs.get("location") is None:
+        return await batcher_instance.process(**kwargs)
+    return await executor_instance.process(**kwargs)
+
+def location_kwargs(request) -> Dict[str, Any]:
+    """``location`` argument of ``Pipeline.process``, only when the client sent one."""
+    if request.location is None:
+        return {}
+    location = request.location.dict(exclude_none=True)
+    return {"location": location} if location else {}
+
+def overloaded(e: ServiceOverloadedError) -> HTTPException:
+    """503 response asking the client to retry once the queue drains."""
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e),
+                         headers={"Retry-After": str(e.retry_after)})
 
 @router.get("/health", summary="Health check endpoint", response_description="API status")
 async def health_check():
@@ -53,14 +105,16 @@ async def process_text(
 
     try:
         # Measure processing time
-        import time
         start_time = time.perf_counter()
         
-        results = pipeline_instance.process(
+        # JSON results are kept structured and serialized once, with the response.
+        # The pipeline runs on the executor so the event loop stays responsive.
+        results = await run_pipeline(
             text=request.text,
             dialect=request.dialect,
             tasks=request.tasks,
-            output_format=request.output_format
+            output_format="dict" if request.output_format == "json" else request.output_format,
+            **location_kwargs(request)
         )
         
         end_time = time.perf_counter()
@@ -75,13 +129,21 @@ async def process_text(
             tasks=request.tasks
         )
         
+        if isinstance(results, bytes):
+            return Response(content=results,
+                            media_type=get_serializer(request.output_format).media_type)
+        
         return ProcessResponse(
-            results=json.loads(results) if request.output_format == "json" else results,
+            results=results,
             processing_time=processing_duration,
-            dialect_detected=request.dialect, # This might be updated by the pipeline
+            dialect_detected=(results.get("final_dialect", request.dialect)
+                              if isinstance(results, dict) else request.dialect),
             tasks_completed=request.tasks
         )
         
+    except ServiceOverloadedError as e:
+        logger.warning(f"Rejecting request: {e}")
+        raise overloaded(e)
     except LexLangError as e:
         logger.error(f"Processing error: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -90,6 +152,142 @@ async def process_text(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error during processing.")
 
 
+@router.post("/process/batch", response_model=BatchProcessResponse, summary="Process many Ewe texts",
+             response_description="One result per input text", responses={413: {"model": ErrorResponse}})
+async def process_batch(
+    request: BatchProcessRequest,
+    current_user: Optional[str] = Depends(get_current_user)
+):
+    """
+    Processes a list of texts in one request, through the batched pipeline path.
+    A text that fails gets an error entry without affecting the others.
+    """
+    if pipeline_instance is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Pipeline not initialized.")
+    max_texts = pipeline_instance.config.api.max_batch_texts
+    if len(request.texts) > max_texts:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"At most {max_texts} texts per batch; use /process/stream for more.")
+
+    try:
+        executor_instance.admit()
+    except ServiceOverloadedError as e:
+        raise overloaded(e)
+    try:
+        start_time = time.perf_counter()
+        results = await executor_instance.run(
+            "batch_process",
+            texts=request.texts,
+            dialect=request.dialect,
+            tasks=request.tasks,
+            output_format="dict"
+        )
+        return BatchProcessResponse(
+            results=results,
+            processing_time=time.perf_counter() - start_time,
+            errors=sum(1 for result in results if "error" in result),
+            tasks_completed=request.tasks
+        )
+    except LexLangError as e:
+        logger.error(f"Batch processing error: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    finally:
+        executor_instance.release()
+
+
+async def _read_ndjson(request: Request, max_bytes: int,
+                       max_line_bytes: int) -> List[Optional[str]]:
+    """Texts from an NDJSON body: one JSON string or {"text": ...} object per line.
+
+    The body is read in full, up to ``max_bytes``, before any result is sent.
+    Lines that cannot be read give None, so that result indices stay aligned.
+    """
+    texts: List[Optional[str]] = []
+    buffer = b""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                detail=f"NDJSON body exceeds {max_bytes} bytes.")
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > max_line_bytes:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                detail=f"NDJSON line exceeds {max_line_bytes} bytes.")
+        texts.extend(_parse_ndjson_line(line) for line in lines if line.strip())
+    if buffer.strip():
+        texts.append(_parse_ndjson_line(buffer))
+    return texts
+
+
+def _parse_ndjson_line(line: bytes) -> Optional[str]:
+    try:
+        item = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(item, dict):
+        item = item.get("text")
+    return item if isinstance(item, str) else None
+
+
+@router.post("/process/stream", summary="Stream-process NDJSON texts",
+             response_description="NDJSON results, one line per input line, in order",
+             responses={413: {"model": ErrorResponse}})
+async def process_stream(
+    request: Request,
+    dialect: str = Query("auto", description="Target dialect, or 'auto'."),
+    tasks: List[str] = Query(DEFAULT_TASKS, description="Processing tasks to perform."),
+    current_user: Optional[str] = Depends(get_current_user)
+):
+    """
+    Reads texts from an NDJSON request body and streams one JSON result per line back
+    as each chunk of ``processing.batch_size`` texts is processed, so that clients
+    see the first results long before the last ones are computed.
+    """
+    if pipeline_instance is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Pipeline not initialized.")
+    config = pipeline_instance.config
+    # The body is read before the response starts: a streaming response listens
+    # for client disconnects on the same receive channel as the body.
+    texts = await _read_ndjson(request, config.api.max_stream_bytes,
+                               config.api.max_line_bytes)
+    try:
+        executor_instance.admit()
+    except ServiceOverloadedError as e:
+        raise overloaded(e)
+
+    batch_size = max(1, config.processing.batch_size)
+
+    async def results() -> AsyncIterator[str]:
+        for offset in range(0, len(texts), batch_size):
+            chunk = texts[offset:offset + batch_size]
+            lines = await executor_instance.run(
+                "process_chunk",
+                texts=[text or "" for text in chunk],
+                offset=offset,
+                dialect=dialect,
+                tasks=tasks,
+                output_format="jsonl"
+            )
+            for i, text in enumerate(chunk):
+                if text is None:
+                    lines[i] = json.dumps({"error": "Invalid NDJSON line: expected a string "
+                                                    "or an object with a 'text' field",
+                                           "batch_index": offset + i})
+            for line in lines:
+                yield line + "\n"
+
+    # The slot is released when the response ends, however it ends: a client
+    # that disconnects before the first chunk never starts the generator
+    try:
+        return ReleasingStreamingResponse(results(), executor_instance.release,
+                                          media_type="application/x-ndjson")
+    except Exception:
+        executor_instance.release()
+        raise
+
+
 @router.post("/analyze", response_model=AnalysisResponse, summary="Perform detailed linguistic analysis",
              response_description="Detailed linguistic analysis results", responses={500: {"model": ErrorResponse}})
 async def analyze_text(request: AnalysisRequest):
@@ -102,15 +300,14 @@ async def analyze_text(request: AnalysisRequest):
 
     try:
         # For analysis, we typically run a full set of tasks
-        results_raw = pipeline_instance.process(
+        parsed_results = await run_pipeline(
             text=request.text,
             dialect="auto", # Always auto-detect for comprehensive analysis
             tasks=["tokenize", "normalize", "pos", "tone", "dialect", "morphology"],
-            output_format="json"
+            output_format="dict",
+            **location_kwargs(request)
         )
         
-        parsed_results = json.loads(results_raw)
-        
         return AnalysisResponse(
             tokens=parsed_results.get("tokens", []),
             pos_tags=parsed_results.get("pos_tags", []),
@@ -120,6 +317,9 @@ async def analyze_text(request: AnalysisRequest):
             linguistic_features=parsed_results.get("linguistic_features", {}) # TODO: Ensure this field is set by pipeline
         )
         
+    except ServiceOverloadedError as e:
+        logger.warning(f"Rejecting request: {e}")
+        raise overloaded(e)
     except Exception as e:
         logger.error(f"Error during analysis: {e}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to perform comprehensive analysis.")
@@ -129,17 +329,45 @@ async def list_models():
     """
     Retrieves a list of available NLP models and their versions within LexLang.
     """
-    # This should ideally read from a MODEL_REGISTRY.json or similar
-    # For now, return a static list
-    models = {
-        "pos_tagger": {"version": "v1.2", "status": "active"},
-        "dialect_classifier": {"version": "v3.0", "status": "active"},
-        "tone_classifier": {"version": "v2.5", "status": "active"},
-        "embeddings": {"version": "v2.1", "status": "active"},
-        "transformer_base": {"version": "v1.0", "status": "active"}
-    }
+    if pipeline_instance is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Pipeline not initialized.")
+    models = pipeline_instance.get_models()
     return {"available_models": models}
 
+async def _swap_model(method: str, processor: str, *args) -> Dict[str, Any]:
+    """Run a pipeline reload/rollback on a worker thread, then refresh process workers."""
+    if pipeline_instance is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Pipeline not initialized.")
+    loop = asyncio.get_running_loop()
+    try:
+        # Loading and warming up a model can take a while: keep it off the event loop
+        result = await loop.run_in_executor(
+            None, getattr(pipeline_instance, method), processor, *args)
+    except LexLangError as e:
+        logger.warning(f"Model swap of {processor} failed: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    executor_instance.restart_workers()
+    logger.info(f"Model swap of {processor} done: {result}")
+    return result
+
+@router.post("/admin/models/{processor}/reload", response_model=ModelReloadResponse,
+             summary="Hot-swap a model", response_description="Swapped model version")
+async def reload_model(processor: str, request: ModelReloadRequest,
+                       current_user: str = Depends(has_role("admin"))):
+    """
+    Loads (and warms up) a model version in the background and swaps it in.
+    Requests in progress finish on the previous model, which is kept for rollback.
+    """
+    return await _swap_model("reload_model", processor, request.version)
+
+@router.post("/admin/models/{processor}/rollback", response_model=ModelReloadResponse,
+             summary="Roll back a hot-swapped model", response_description="Restored model version")
+async def rollback_model(processor: str, current_user: str = Depends(has_role("admin"))):
+    """
+    Swaps back the model replaced by the last reload of this processor.
+    """
+    return await _swap_model("rollback_model", processor)
+
 @router.get("/dialects", summary="List supported Ewe dialects", response_description="List of supported dialects")
 async def list_dialects():
     """
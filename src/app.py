@@ -1,6 +1,6 @@
 """FastAPI web application for LexLang."""
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
@@ -10,6 +10,7 @@ from datetime import datetime
 
 from .config import load_config
 from .core.pipeline import Pipeline
+from .core.serializers import get_serializer
 from .api.models import (
     ProcessRequest, ProcessResponse, 
     AnalysisRequest, AnalysisResponse,
@@ -17,7 +18,10 @@ from .api.models import (
 )
 from .api.middleware import setup_middleware
 from .api.auth import get_current_user
-from .exceptions import LexLangError
+from .api.batching import RequestBatcher
+from .api.executor import PipelineExecutor
+from .api.routes import location_kwargs
+from .exceptions import LexLangError, ServiceOverloadedError
 from .utils import setup_logging
 
 # Setup logging
@@ -39,21 +43,33 @@ setup_middleware(app)
 # Global variables
 config = None
 pipeline = None
+executor = None
+batcher = None
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
-    global config, pipeline
+    global config, pipeline, executor, batcher
     try:
         config = load_config("configs/default.yaml")
         pipeline = Pipeline(config)
+        executor = PipelineExecutor(pipeline, config)
+        if config.api.enable_batching:
+            batcher = RequestBatcher.from_config(executor, config)
         logger.info("LexLang API started successfully")
     except Exception as e:
         logger.error(f"Failed to initialize application: {e}")
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the processing pool."""
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -82,11 +98,14 @@ async def process_text(
 ):
     """Process text with specified tasks."""
     try:
-        results = pipeline.process(
+        location = location_kwargs(request)
+        # Batches share one set of arguments: localized requests are not batched
+        results = await (executor if location else batcher or executor).process(
             text=request.text,
             dialect=request.dialect,
             tasks=request.tasks,
-            output_format=request.output_format
+            output_format="dict" if request.output_format == "json" else request.output_format,
+            **location
         )
         
         # Log request for analytics
@@ -98,13 +117,20 @@ async def process_text(
             tasks=request.tasks
         )
         
+        if isinstance(results, bytes):
+            return Response(content=results,
+                            media_type=get_serializer(request.output_format).media_type)
+        
         return ProcessResponse(
-            results=json.loads(results) if request.output_format == "json" else results,
+            results=results,
             processing_time=0.0,  # TODO: Implement timing
             dialect_detected=request.dialect,
             tasks_completed=request.tasks
         )
         
+    except ServiceOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)})
     except LexLangError as e:
         logger.error(f"Processing error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -121,15 +147,15 @@ async def analyze_text(
     """Perform comprehensive text analysis."""
     try:
         # Run full analysis pipeline
-        results = pipeline.process(
+        location = location_kwargs(request)
+        parsed_results = await (executor if location else batcher or executor).process(
             text=request.text,
             dialect="auto",
             tasks=["tokenize", "normalize", "pos", "tone", "dialect"],
-            output_format="json"
+            output_format="dict",
+            **location
         )
         
-        parsed_results = json.loads(results)
-        
         return AnalysisResponse(
             tokens=parsed_results.get("tokens", []),
             pos_tags=parsed_results.get("pos_tags", []),
@@ -139,6 +165,9 @@ async def analyze_text(
             linguistic_features=parsed_results.get("linguistic_features", {})
         )
         
+    except ServiceOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         logger.error(f"Analysis error: {e}")
         raise HTTPException(status_code=500, detail="Analysis failed")
@@ -147,14 +176,11 @@ async def analyze_text(
 @app.get("/models")
 async def list_models():
     """List available models."""
+    if not pipeline:
+        raise HTTPException(status_code=503, detail="Service not ready")
     try:
-        models = {
-            "pos_tagger": "v1.2",
-            "dialect_classifier": "v3.0",
-            "tone_classifier": "v2.5",
-            "embeddings": "v2.1",
-            "transformers": "v1.0"
-        }
+        models = {name: info["version"]
+                  for name, info in pipeline.get_models().items()}
         return {"models": models}
     except Exception as e:
         logger.error(f"Error listing models: {e}")
@@ -3,11 +3,12 @@
 import click
 import json
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Optional
 
 from .config import load_config
-from .core.pipeline import Pipeline
+from .core.pipeline import Pipeline, STREAM_FORMATS
 from .utils import setup_logging
 from .exceptions import LexLangError
 
@@ -16,8 +17,10 @@ from .exceptions import LexLangError
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--config', '-c', default='configs/default.yaml', 
               help='Configuration file path')
+@click.option('--profile', '-p', type=click.Choice(['light', 'full']), default=None,
+              help='Pipeline profile (default: processing.profile)')
 @click.pass_context
-def cli(ctx, verbose: bool, config: str):
+def cli(ctx, verbose: bool, config: str, profile: Optional[str]):
     """LexLang: Advanced NLP toolkit for Ewe language processing."""
     ctx.ensure_object(dict)
     
@@ -28,7 +31,7 @@ def cli(ctx, verbose: bool, config: str):
     # Load configuration
     try:
         ctx.obj['config'] = load_config(config)
-        ctx.obj['pipeline'] = Pipeline(ctx.obj['config'])
+        ctx.obj['pipeline'] = Pipeline(ctx.obj['config'], profile=profile)
     except Exception as e:
         click.echo(f"Error loading configuration: {e}", err=True)
         ctx.exit(1)
@@ -41,30 +44,58 @@ def cli(ctx, verbose: bool, config: str):
               type=click.Choice(['anlo', 'inland', 'ho', 'kpando', 'auto']),
               default='auto', help='Target dialect')
 @click.option('--format', '-f',
-              type=click.Choice(['json', 'text', 'conllu']),
-              default='json', help='Output format')
+              type=click.Choice(['json', 'jsonl', 'text', 'conllu']),
+              default='json',
+              help='Output format; jsonl, text and conllu are streamed sentence by sentence')
+@click.option('--workers', '-w', type=int, default=None,
+              help='Worker processes for streamed formats '
+                   '(default: processing.num_workers; 1 runs in-process)')
 @click.pass_context
 def process(ctx, input_file: str, output: Optional[str], 
-           dialect: str, format: str):
-    """Process a text file."""
+           dialect: str, format: str, workers: Optional[int]):
+    """Process a text file.
+    
+    Line-oriented formats are streamed sentence by sentence; json output is
+    a single document for the whole file.
+    """
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            text = f.read()
-        
         pipeline = ctx.obj['pipeline']
-        results = pipeline.process(
-            text=text,
-            dialect=dialect,
-            tasks=['tokenize', 'normalize', 'pos', 'tone'],
-            output_format=format
-        )
+        
+        if format not in STREAM_FORMATS:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            results = pipeline.process(
+                text=text,
+                dialect=dialect,
+                tasks=['tokenize', 'normalize', 'pos', 'tone'],
+                output_format=format
+            )
+            if output:
+                with open(output, 'w', encoding='utf-8') as f:
+                    f.write(results)
+                click.echo(f"Results written to {output}")
+            else:
+                click.echo(results)
+            return
+        
+        with open(input_file, 'r', encoding='utf-8') as f, \
+                (open(output, 'w', encoding='utf-8') if output else nullcontext()) as out:
+            results = pipeline.stream(
+                f,
+                dialect=dialect,
+                tasks=['tokenize', 'normalize', 'pos', 'tone'],
+                output_format=format,
+                num_workers=workers
+            )
+            for result in results:
+                if out:
+                    out.write(result)
+                    out.write("\n")
+                else:
+                    click.echo(result)
         
         if output:
-            with open(output, 'w', encoding='utf-8') as f:
-                f.write(results)
             click.echo(f"Results written to {output}")
-        else:
-            click.echo(results)
             
     except Exception as e:
         click.echo(f"Error processing file: {e}", err=True)
@@ -87,14 +118,41 @@ def analyze(ctx, text: str, dialect: str):
             output_format='json'
         )
         
-        # Pretty print JSON
-        parsed = json.loads(results)
-        click.echo(json.dumps(parsed, indent=2, ensure_ascii=False))
+        click.echo(results)
         
     except Exception as e:
         click.echo(f"Error analyzing text: {e}", err=True)
 
 
+@cli.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--source', '-s', required=True,
+              type=click.Choice(['anlo', 'inland', 'ho', 'kpando']), help='Dialect of the input')
+@click.option('--target', '-t', required=True,
+              type=click.Choice(['anlo', 'inland', 'ho', 'kpando']), help='Dialect to convert to')
+@click.option('--output', '-o', type=click.Path(), help='Output file path')
+@click.pass_context
+def convert(ctx, input_file: str, source: str, target: str, output: Optional[str]):
+    """Convert a text file from one dialect to another, line by line."""
+    try:
+        from .core.dialect_handler.dialect_converter import DialectConverter
+
+        converter = DialectConverter(ctx.obj['config'])
+        with open(input_file, 'r', encoding='utf-8') as f, \
+                (open(output, 'w', encoding='utf-8') if output else nullcontext()) as out:
+            for line in converter.convert_lines(f, source, target):
+                if out:
+                    out.write(line)
+                else:
+                    click.echo(line, nl=False)
+
+        if output:
+            click.echo(f"Converted text written to {output}")
+
+    except Exception as e:
+        click.echo(f"Error converting file: {e}", err=True)
+
+
 @cli.command()
 @click.argument('model_type', 
                type=click.Choice(['pos', 'dialect', 'tone', 'embeddings']))
@@ -140,6 +198,49 @@ def evaluate(ctx, model_path: str, test_data: str):
         click.echo(f"Error evaluating model: {e}", err=True)
 
 
+@cli.command('reload-model')
+@click.argument('processor',
+               type=click.Choice(['pos_tagger', 'dialect_detector', 'embeddings',
+                                  'tokenizer', 'normalizer', 'tonal_processor',
+                                  'morphology']))
+@click.option('--version', 'model_version', default=None,
+              help='Registered model version to load (default: reload the current one)')
+@click.option('--rollback', is_flag=True,
+              help='Swap back the model replaced by the last reload')
+@click.option('--url', default=None,
+              help='API base URL (default: http://localhost:<api.port>/api/v1)')
+@click.option('--api-key', envvar='LEXLANG_API_KEY', default=None,
+              help='Admin API key (or LEXLANG_API_KEY)')
+@click.pass_context
+def reload_model(ctx, processor: str, model_version: Optional[str], rollback: bool,
+                 url: Optional[str], api_key: Optional[str]):
+    """Hot-swap a model in a running API server."""
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+    
+    config = ctx.obj['config']
+    base = (url or f"http://localhost:{config.api.port}/api/v1").rstrip('/')
+    action = 'rollback' if rollback else 'reload'
+    body = {} if rollback else {'version': model_version}
+    request = Request(f"{base}/admin/models/{processor}/{action}",
+                      data=json.dumps(body).encode('utf-8'), method='POST',
+                      headers={'Content-Type': 'application/json',
+                               'X-API-Key': api_key or ''})
+    try:
+        with urlopen(request) as response:
+            result = json.load(response)
+        click.echo(f"{processor}: now serving {result.get('version') or 'active version'}"
+                   + (f" (replaced {result['previous_version']})"
+                      if result.get('previous_version') else ""))
+    except HTTPError as e:
+        detail = e.read().decode('utf-8', 'replace')
+        click.echo(f"Error swapping model: HTTP {e.code} {detail}", err=True)
+        ctx.exit(1)
+    except URLError as e:
+        click.echo(f"Error contacting API at {base}: {e.reason}", err=True)
+        ctx.exit(1)
+
+
 def main():
     """Entry point for CLI."""
     cli()
@@ -1,6 +1,5 @@
 """Configuration management for LexLang."""
 
-import yaml
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -18,6 +17,15 @@ class ModelConfig:
     dialect_model_path: str = "models/classifiers/dialect_classifier_v3.0.pkl"
     tone_model_path: str = "models/classifiers/tone_classifier_v2.5.pkl"
     transformer_model_path: str = "models/pretrained/transformer_base_v1.0.pt"
+    # POS tagger implementation: "hmm" (default, lowest latency), "crf" or "neural"
+    pos_backend: str = "hmm"
+    # Dynamic int8 quantization of the neural tagger's linear layers
+    pos_quantize: bool = False
+    # Registered models resolve through the registry; the paths above are
+    # used for models it does not list
+    registry_path: str = "models/MODEL_REGISTRY.json"
+    checksums_path: str = "models/MODEL_CHECKSUMS.md"
+    verify_checksums: bool = True
 
 
 @dataclass
@@ -34,10 +42,23 @@ class ProcessingConfig:
     """Processing configuration."""
     max_sequence_length: int = 512
     batch_size: int = 32
-    num_workers: int = 4
+    num_workers: int = 1  # worker processes of batch_process/stream; 1 runs in-process
+    stage_threads: int = 4  # threads running independent stages of one document
     enable_caching: bool = True
+    cache_max_entries: int = 10000
+    cache_ttl: int = 3600  # seconds
+    cache_disk_max_entries: int = 100000
+    token_memo_size: int = 50000
     enable_gpu: bool = True
     default_dialect: str = "auto"
+    profile: str = "full"  # "light" (tokenize/normalize) or "full"
+    preload: bool = False  # build all processors of the profile at startup
+    # Dialect detection of long texts reads sentence by sentence and stops once
+    # the two best dialects are this far apart in posterior probability
+    dialect_margin: float = 0.5
+    dialect_incremental_chars: int = 2000  # shorter texts are scored in one pass
+    dialect_max_chars: int = 20000  # detection never reads further into a text
+    dialect_geo_weight: float = 1.0  # exponent of the location prior fused with text scores
 
 
 @dataclass
@@ -49,6 +70,16 @@ class APIConfig:
     secret_key: str = "lexlang-secret-key"
     cors_origins: list = field(default_factory=lambda: ["*"])
     rate_limit: int = 100
+    executor: str = "thread"  # "thread" or "process"
+    max_concurrency: int = 4
+    max_queue: int = 32
+    retry_after: int = 1  # seconds, sent with 503 responses when the queue is full
+    enable_batching: bool = True
+    batch_max_wait_ms: float = 5.0
+    batch_max_size: int = 0  # 0 uses processing.batch_size
+    max_batch_texts: int = 1000  # per /process/batch request
+    max_stream_bytes: int = 52428800  # 50MB NDJSON body for /process/stream
+    max_line_bytes: int = 1048576  # 1MB per NDJSON line
 
 
 @dataclass
@@ -80,6 +111,7 @@ def load_config(config_path: str = "configs/default.yaml") -> LexLangConfig:
             logger.warning(f"Config file {config_path} not found, using defaults")
             return LexLangConfig()
         
+        import yaml
         with open(config_file, 'r', encoding='utf-8') as f:
             config_data = yaml.safe_load(f)
         
@@ -120,7 +152,13 @@ def _override_with_env(config_data: Dict[str, Any]) -> Dict[str, Any]:
         'MODEL_PATH': ['models', 'base_path'],
         'DATA_PATH': ['data', 'base_path'],
         'MAX_WORKERS': ['processing', 'num_workers'],
-        'BATCH_SIZE': ['processing', 'batch_size']
+        'BATCH_SIZE': ['processing', 'batch_size'],
+        'ENABLE_CACHING': ['processing', 'enable_caching'],
+        'PIPELINE_PROFILE': ['processing', 'profile'],
+        'POS_BACKEND': ['models', 'pos_backend'],
+        'API_EXECUTOR': ['api', 'executor'],
+        'API_MAX_CONCURRENCY': ['api', 'max_concurrency'],
+        'API_MAX_QUEUE': ['api', 'max_queue']
     }
     
     for env_var, config_path in env_mappings.items():
@@ -134,9 +172,10 @@ def _override_with_env(config_data: Dict[str, Any]) -> Dict[str, Any]:
                 current = current[key]
             
             # Convert value to appropriate type
-            if env_var in ['API_PORT', 'MAX_WORKERS', 'BATCH_SIZE']:
+            if env_var in ['API_PORT', 'MAX_WORKERS', 'BATCH_SIZE',
+                           'API_MAX_CONCURRENCY', 'API_MAX_QUEUE']:
                 value = int(value)
-            elif env_var in ['DEBUG']:
+            elif env_var in ['DEBUG', 'ENABLE_CACHING']:
                 value = value.lower() in ('true', '1', 'yes', 'on')
             
             current[config_path[-1]] = value
@@ -157,6 +196,7 @@ def save_config(config: LexLangConfig, config_path: str):
         
         os.makedirs(os.path.dirname(config_path), exist_ok=True)
         
+        import yaml
         with open(config_path, 'w', encoding='utf-8') as f:
             yaml.dump(config_dict, f, default_flow_style=False, 
                      allow_unicode=True, indent=2)
@@ -1,6 +1,14 @@
 """Core processing modules for LexLang."""
 
-from .pipeline import Pipeline
 from .base_processor import BaseProcessor
 
+
+def __getattr__(name):
+    # The pipeline module is imported on first use only
+    if name == "Pipeline":
+        from .pipeline import Pipeline
+        return Pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["Pipeline", "BaseProcessor"]
@@ -0,0 +1,227 @@
+"""Content-addressed cache for pipeline results."""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import LexLangConfig
+
+logger = logging.getLogger(__name__)
+
+
+def resource_keys(config: LexLangConfig) -> List[str]:
+    """Keys of the settings and rule files that change results besides the models.
+
+    Covers the POS backend, the normalization plan, the tokenizer rules, the
+    morphology lexicons and the geographic dialect distribution.
+    """
+    from .dialect_handler.geo_classifier import distribution_key
+    from .morphology.morphological_analyzer import source_key
+    from .normalizer.text_normalizer import normalization_plan
+    from .tokenizer.dialect_aware_tokenizer import rules_digest
+
+    resources = config.data.linguistic_resources_path
+    return [f"pos_backend={config.models.pos_backend}",
+            f"normalization={normalization_plan().key}",
+            f"tokenizer={rules_digest(resources)}",
+            f"morphology={source_key(resources)}",
+            f"geo={distribution_key(resources)}"]
+
+
+def model_fingerprint(config: LexLangConfig,
+                      paths: Optional[Dict[str, str]] = None) -> str:
+    """Identify the model files in use by path, size and modification time.
+
+    ``paths`` maps a name to each model file (the configured model paths by
+    default). The ``resource_keys`` are included too: the disk tier outlives
+    the process, and its results must not survive a change of rules.
+    """
+    if paths is None:
+        paths = {name: path for name, path in vars(config.models).items()
+                 if name.endswith("_model_path")}
+    parts = []
+    for name, path in sorted(paths.items()):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{name}={path}:{stat.st_size}:{int(stat.st_mtime)}")
+        except OSError:
+            parts.append(f"{name}={path}:missing")
+    parts.extend(resource_keys(config))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Two-tier cache of pipeline results.
+
+    Results are keyed on a hash of the exact text (token offsets refer to
+    it), the dialect, the set of tasks and the model fingerprint. The first
+    tier is an in-memory LRU with a time-to-live; the second stores JSON
+    files under ``cache_dir`` so that results survive restarts and are shared
+    between processes. Expired files are swept periodically and the disk
+    tier is capped at ``disk_max_entries`` files.
+
+    Values are copied in and out, so callers may modify what they get.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_entries: int = 10000,
+                 ttl: float = 3600.0,
+                 fingerprint: str = "",
+                 disk_max_entries: int = 100000):
+        self.cache_dir = Path(cache_dir) / "results" if cache_dir else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.fingerprint = fingerprint
+        self.disk_max_entries = disk_max_entries
+        # Sweep often enough that the disk tier overshoots its cap by at most 10%
+        self.sweep_interval = max(1, disk_max_entries // 10)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_sweep = 0
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0,
+                       "disk_evictions": 0}
+
+    @classmethod
+    def from_config(cls, config: LexLangConfig,
+                    fingerprint: Optional[str] = None) -> "ResultCache":
+        return cls(
+            cache_dir=config.data.cache_dir,
+            max_entries=config.processing.cache_max_entries,
+            ttl=config.processing.cache_ttl,
+            fingerprint=fingerprint or model_fingerprint(config),
+            disk_max_entries=config.processing.cache_disk_max_entries
+        )
+
+    def make_key(self, text: str, dialect: str, tasks: Iterable[str],
+                 location: Optional[Dict[str, Any]] = None) -> str:
+        key = [text, dialect, sorted(set(tasks)), self.fingerprint]
+        if location:
+            # Localized requests get their own entries (geo prior)
+            key.append(location)
+        payload = json.dumps(key, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return copy.deepcopy(value)
+                del self._memory[key]
+
+        value = self._read_disk(key, now)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, copy.deepcopy(value), now)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value, time.time())
+            self._stats["stores"] += 1
+        self._write_disk(key, value)
+
+    def sweep(self) -> int:
+        """Delete expired disk entries, then the oldest beyond ``disk_max_entries``."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                mtime = path.stat().st_mtime
+                if mtime + self.ttl <= now:
+                    path.unlink()
+                    removed += 1
+                else:
+                    entries.append((mtime, path))
+            except OSError:
+                continue
+        excess = len(entries) - self.disk_max_entries
+        if excess > 0:
+            entries.sort()
+            for _, path in entries[:excess]:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+        with self._lock:
+            self._stats["disk_evictions"] += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = ((stats["memory_hits"] + stats["disk_hits"]) / lookups
+                             if lookups else 0.0)
+        return stats
+
+    def _remember(self, key: str, value: Dict[str, Any], now: float):
+        self._memory[key] = (now + self.ttl, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            if path.stat().st_mtime + self.ttl <= now:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, value: Dict[str, Any]):
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            return
+        with self._lock:
+            self._writes_since_sweep += 1
+            due = self._writes_since_sweep >= self.sweep_interval
+            if due:
+                self._writes_since_sweep = 0
+        if due:
+            self.sweep()
@@ -0,0 +1,7 @@
+"""Dialect handling modules."""
+
+from .dialect_converter import DialectConverter
+from .dialect_detector import DialectDetector
+from .variation_mapper import VariationMapper
+
+__all__ = ["DialectConverter", "DialectDetector", "VariationMapper"]
@@ -1,5 +1,70 @@
 """DialectConverter: conversion entre dialectes."""
+import re
+
 from ..base_processor import BaseProcessor
+from ..tokenizer.dialect_aware_tokenizer import WORD_CHARS
+from ..tokens import TokenSpans
+from ..token_memo import shared_memo
+from .variation_mapper import VariationMapper
+
+WORD_PATTERN = re.compile(rf"[{WORD_CHARS}]+")
+
 
 class DialectConverter(BaseProcessor):
-    """Convertit le texte
+    """Convertit le texte d'un dialecte vers un autre.
+
+    Les règles de ``VariationMapper`` sont compilées une fois par paire de
+    dialectes ; chaque type de token n'est converti qu'une fois, les
+    résultats étant gardés dans le mémo partagé sous la clé
+    (token, source, cible). Convertir un corpus coûte donc surtout le
+    parcours du texte, comme la tokenisation.
+    """
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.mapper = VariationMapper(config)
+        self.memo = shared_memo(config)
+
+    def _map(self, tokens: list, source: str, target: str) -> list:
+        plan = self.mapper.compile(source, target)
+        if source == target or not plan:
+            return list(tokens)
+        return self.memo.map(f"convert:{plan.key}", tokens, plan.apply,
+                             f"{source}>{target}")
+
+    def convert_token(self, token: str, source: str, target: str) -> str:
+        return self._map([token], source, target)[0]
+
+    def convert(self, tokens, source: str, target: str):
+        """Tokens convertis ; un ``TokenSpans`` garde ses positions."""
+        if isinstance(tokens, TokenSpans):
+            return tokens.with_types(self._map(tokens.types, source, target))
+        return self._map(tokens, source, target)
+
+    def convert_text(self, text: str, source: str, target: str) -> str:
+        """Texte converti, espaces et ponctuation inchangés."""
+        return self.convert_texts([text], source, target)[0]
+
+    def convert_texts(self, texts: list, source: str, target: str) -> list:
+        """Convertit plusieurs textes, avec une seule consultation du mémo."""
+        words = WORD_PATTERN.findall('\n'.join(texts))
+        if not words:
+            return list(texts)
+        types = list(dict.fromkeys(words))
+        mapping = {word: converted for word, converted
+                   in zip(types, self._map(types, source, target)) if converted != word}
+        if not mapping:
+            return list(texts)
+        replace = lambda match: mapping.get(match.group(), match.group())
+        return [WORD_PATTERN.sub(replace, text) for text in texts]
+
+    def convert_lines(self, lines, source: str, target: str, batch_size: int = 1000):
+        """Convertit un corpus ligne par ligne (itérateur, mémoire bornée)."""
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) == batch_size:
+                yield from self.convert_texts(batch, source, target)
+                batch = []
+        if batch:
+            yield from self.convert_texts(batch, source, target)
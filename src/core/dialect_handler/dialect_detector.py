@@ -1,15 +1,423 @@
 """DialectDetector: détection automatique du dialecte."""
+import logging
+import os
+import re
+import unicodedata
+
+import numpy as np
+
+from ...exceptions import ModelLoadError
 from ..base_processor import BaseProcessor
 
+logger = logging.getLogger(__name__)
+
+DIALECTS = ('anlo', 'inland', 'ho', 'kpando')
+DEFAULT_DIALECT = 'anlo'
+NGRAM_ORDERS = (1, 2, 3, 4)
+# 2**18 colonnes hachées : quelques collisions, 4 Mo de poids pour quatre dialectes
+HASH_BITS = 18
+_MULTIPLIER = np.uint64(1000003)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+# Frontières de phrase (comme SentenceTokenizer) et sauts de ligne
+SEGMENT_BOUNDARY = re.compile(r'(?<=[\.\?\!])\s+|\s*\n\s*')
+# Premier caractère non blanc : cherché sans copier le reste du texte
+NON_SPACE = re.compile(r'\S')
+# Phrases scorées ensemble par la détection incrémentale
+INCREMENTAL_BLOCK = 8
+# N-grammes minimum d'une phrase pour ouvrir un segment (une interjection n'en ouvre pas)
+MIN_SEGMENT_NGRAMS = 40
+DEFAULT_MARGIN = 0.5
+DEFAULT_INCREMENTAL_CHARS = 2000
+DEFAULT_MAX_CHARS = 20000
+DEFAULT_GEO_WEIGHT = 1.0
+
+
+def prepare_text(text: str) -> str:
+    """Texte en NFC, en minuscules, espaces réduits et bordé d'espaces."""
+    return f" {' '.join(unicodedata.normalize('NFC', text).lower().split())} "
+
+
+def ngram_ids(text: str, orders=NGRAM_ORDERS, bits: int = HASH_BITS) -> np.ndarray:
+    """Colonnes hachées des n-grammes de caractères de ``text``.
+
+    Le hachage polynomial est calculé en NumPy pour tous les n-grammes d'un
+    même ordre à la fois ; il ne dépend pas de ``PYTHONHASHSEED``, ce qui
+    permet de relire un modèle dans un autre processus.
+    """
+    codes = np.frombuffer(prepare_text(text).encode('utf-32-le'), dtype=np.uint32)
+    codes = codes.astype(np.uint64)
+    ids = []
+    for n in orders:
+        count = len(codes) - n + 1
+        if count <= 0:
+            continue
+        h = np.full(count, n, dtype=np.uint64)
+        for k in range(n):
+            h = h * _MULTIPLIER + codes[k:k + count]
+        ids.append((h * _GOLDEN) >> np.uint64(64 - bits))
+    if not ids:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(ids).astype(np.int64)
+
+
+def featurize(texts, orders=NGRAM_ORDERS, bits: int = HASH_BITS):
+    """Matrice creuse (CSR) des textes : colonnes, ligne de chaque entrée, nombre par ligne.
+
+    Chaque ligne est normalisée par la racine de son nombre de n-grammes :
+    les scores croissent avec la longueur du texte, moins vite que la somme.
+    """
+    ids = [ngram_ids(text, orders, bits) for text in texts]
+    lengths = np.array([len(i) for i in ids], dtype=np.int64)
+    columns = np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64)
+    rows = np.repeat(np.arange(len(ids)), lengths)
+    return columns, rows, lengths
+
+
+def segment_spans(text: str):
+    """(début, fin) des phrases non vides de ``text``, produites à la demande."""
+    start = 0
+    for match in SEGMENT_BOUNDARY.finditer(text):
+        if text[start:match.start()].strip():
+            yield start, match.start()
+        start = match.end()
+    if text[start:].strip():
+        yield start, len(text)
+
+
+def _sparse_sums(weights, columns, rows, n_rows):
+    """Produit matrice creuse (non normalisée) x poids : (lignes, dialectes)."""
+    gathered = weights[columns]
+    return np.stack([np.bincount(rows, weights=gathered[:, c], minlength=n_rows)
+                     for c in range(weights.shape[1])], axis=1)
+
+
+def _sparse_dot(weights, columns, rows, lengths):
+    """Produit matrice creuse x poids : (textes, dialectes)."""
+    sums = _sparse_sums(weights, columns, rows, len(lengths))
+    return sums / np.sqrt(np.maximum(lengths, 1))[:, None]
+
+
+def _margins(probs):
+    """Écart entre les deux meilleures probabilités de chaque ligne."""
+    if probs.shape[1] < 2:
+        return probs[:, 0]
+    top = np.partition(probs, -2, axis=1)
+    return top[:, -1] - top[:, -2]
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _fit_temperature(logits, labels):
+    """Température minimisant la log-vraisemblance négative (recherche sur grille)."""
+    best, best_nll = 1.0, np.inf
+    for temperature in np.geomspace(0.05, 20.0, 121):
+        probs = _softmax(logits / temperature)
+        nll = -np.log(probs[np.arange(len(labels)), labels] + 1e-12).mean()
+        if nll < best_nll:
+            best, best_nll = float(temperature), nll
+    return best
+
+
+def train_ngram_classifier(texts, labels, epochs: int = 10, learning_rate: float = 0.5,
+                           l2: float = 1e-6, batch_size: int = 32, holdout: float = 0.1,
+                           bits: int = HASH_BITS, seed: int = 0) -> dict:
+    """Régression logistique multinomiale sur n-grammes de caractères hachés.
+
+    Descente de gradient stochastique par mini-lots ; une fraction
+    ``holdout`` des exemples (au moins 20 exemples requis) sert ensuite à
+    calibrer les probabilités par mise à l'échelle de température. Renvoie
+    les tableaux du modèle pour ``np.savez``.
+    """
+    pairs = [(text, label) for text, label in zip(texts, labels) if text and text.strip()]
+    if not pairs:
+        raise ValueError("No labelled texts to train on")
+    dialects = [d for d in DIALECTS if any(label == d for _, label in pairs)]
+    dialects += sorted({label for _, label in pairs} - set(DIALECTS))
+    index = {d: i for i, d in enumerate(dialects)}
+    y = np.array([index[label] for _, label in pairs])
+    columns, rows, lengths = featurize([text for text, _ in pairs], bits=bits)
+    starts = np.concatenate(([0], np.cumsum(lengths)))
+
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(pairs))
+    n_holdout = int(len(pairs) * holdout) if len(pairs) >= 20 else 0
+    held_out, train = order[:n_holdout], order[n_holdout:]
+
+    weights = np.zeros((1 << bits, len(dialects)), dtype=np.float32)
+    bias = np.zeros(len(dialects), dtype=np.float32)
+    for _ in range(epochs):
+        rng.shuffle(train)
+        for begin in range(0, len(train), batch_size):
+            batch = train[begin:begin + batch_size]
+            cols = np.concatenate([columns[starts[i]:starts[i + 1]] for i in batch])
+            local = np.repeat(np.arange(len(batch)), lengths[batch])
+            probs = _softmax(_sparse_dot(weights, cols, local, lengths[batch]) + bias)
+            error = probs
+            error[np.arange(len(batch)), y[batch]] -= 1.0
+            error /= len(batch)
+            touched = np.unique(cols)
+            weights[touched] *= 1.0 - learning_rate * l2
+            scale = (1.0 / np.sqrt(np.maximum(lengths[batch], 1)))[local]
+            np.add.at(weights, cols, (-learning_rate * error[local] * scale[:, None])
+                      .astype(np.float32))
+            bias -= (learning_rate * error.sum(axis=0)).astype(np.float32)
+
+    temperature = 1.0
+    if n_holdout:
+        keep = np.isin(rows, held_out)
+        remap = np.full(len(pairs), -1)
+        remap[held_out] = np.arange(n_holdout)
+        logits = _sparse_dot(weights, columns[keep], remap[rows[keep]], lengths[held_out]) + bias
+        temperature = _fit_temperature(logits, y[held_out])
+    return {
+        'kind': np.array('dialect_ngram'),
+        'dialects': np.array(dialects),
+        'orders': np.array(NGRAM_ORDERS),
+        'bits': np.array(bits),
+        'weights': weights,
+        'bias': bias,
+        'temperature': np.array(temperature, dtype=np.float32),
+    }
+
+
 class DialectDetector(BaseProcessor):
-    """Détermine le dialecte le plus probable."""
+    """Détermine le dialecte le plus probable.
+
+    Les n-grammes de caractères (1 à 4) du texte sont hachés dans un espace
+    de ``2**bits`` colonnes ; les scores des dialectes sont le produit de ce
+    vecteur creux par la matrice de poids, puis une softmax à température
+    calibrée. Un lot de textes forme une seule matrice creuse.
+
+    Sans modèle entraîné, le dialecte vaut ``DEFAULT_DIALECT`` et les scores
+    sont uniformes.
+    """
+
+    def __init__(self, model_path=None, config=None):
+        super().__init__(config)
+        from ..model_registry import as_model_entry
+        entry = as_model_entry(model_path)
+        self.model_path = entry.path if entry is not None else None
+        processing = config.processing if config is not None else None
+        self.margin = processing.dialect_margin if processing else DEFAULT_MARGIN
+        self.incremental_chars = (processing.dialect_incremental_chars if processing
+                                  else DEFAULT_INCREMENTAL_CHARS)
+        self.max_chars = processing.dialect_max_chars if processing else DEFAULT_MAX_CHARS
+        self.geo_weight = processing.dialect_geo_weight if processing else DEFAULT_GEO_WEIGHT
+        self.dialects = list(DIALECTS)
+        self.weights = None
+        self._geo = None
+        if entry is not None and entry.available:
+            from ..model_registry import shared_store
+            self.load_arrays(shared_store(config).load_entry(entry))
+        elif entry is not None:
+            logger.warning(f"Dialect model not available ({model_path}), "
+                           f"detecting every text as {DEFAULT_DIALECT}")
+
+    def load_arrays(self, arrays):
+        """Installe un modèle produit par ``train_ngram_classifier`` (ou relu d'un .npz)."""
+        kind = str(arrays['kind']) if 'kind' in arrays else None
+        if kind != 'dialect_ngram':
+            raise ModelLoadError(f"Not a dialect n-gram model: {self.model_path}")
+        self.arrays = arrays
+        self.dialects = [str(d) for d in arrays['dialects']]
+        self._geo = None                    # le prior suit l'ordre des dialectes du modèle
+        self.orders = tuple(int(n) for n in arrays['orders'])
+        self.bits = int(arrays['bits'])
+        self.weights = np.asarray(arrays['weights'], dtype=np.float32)
+        self.bias = np.asarray(arrays['bias'], dtype=np.float32)
+        self.temperature = float(arrays['temperature'])
+        return self
+
+    @classmethod
+    def train(cls, texts, labels, config=None, **kwargs) -> "DialectDetector":
+        return cls(config=config).load_arrays(train_ngram_classifier(texts, labels, **kwargs))
+
+    def save(self, path: str):
+        """Écrit le modèle au format .npz (lu par ``ModelStore``)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, **self.arrays)
+
+    def _probs(self, sums, lengths):
+        logits = sums / np.sqrt(np.maximum(lengths, 1))[:, None] + self.bias
+        return _softmax(logits / self.temperature)
+
+    def _segment_sums(self, text: str, spans: list):
+        """Sommes des poids (non normalisées) et nombre de n-grammes de chaque phrase."""
+        columns, rows, lengths = featurize([text[start:end] for start, end in spans],
+                                           self.orders, self.bits)
+        return _sparse_sums(self.weights, columns, rows, len(spans)), lengths
+
+    def predict_proba(self, texts: list) -> np.ndarray:
+        """Probabilités calibrées (textes, dialectes), dans l'ordre de ``self.dialects``."""
+        if self.weights is None:
+            return np.full((len(texts), len(self.dialects)), 1.0 / len(self.dialects))
+        columns, rows, lengths = featurize(texts, self.orders, self.bits)
+        logits = _sparse_dot(self.weights, columns, rows, lengths) + self.bias
+        return _softmax(logits / self.temperature)
+
+    def scores(self, text: str) -> dict:
+        return dict(zip(self.dialects, self.predict_proba([text])[0].tolist()))
+
+    @property
+    def geo(self):
+        """Prior géographique, chargé à la première requête localisée."""
+        if self._geo is None:
+            from .geo_classifier import GeoClassifier
+            self._geo = GeoClassifier(self.config, self.dialects)
+        return self._geo
+
+    def fuse(self, scores: dict, location) -> tuple:
+        """Scores du texte combinés au prior de ``location`` : (scores, prior).
+
+        La probabilité a posteriori est proportionnelle à
+        ``score(d) * prior(d) ** geo_weight`` ; sans prior connu, les scores
+        sont inchangés.
+        """
+        prior = self.geo.prior(location) if location else None
+        if prior is None:
+            return scores, None
+        fused = {d: scores[d] * prior[d] ** self.geo_weight for d in self.dialects}
+        total = sum(fused.values())
+        return {d: value / total for d, value in fused.items()}, prior
+
+    def _scores_batch(self, texts: list) -> list:
+        """Scores de chaque texte ; les longs textes sont lus de façon incrémentale."""
+        if self.weights is None:
+            return [dict.fromkeys(self.dialects, 1.0 / len(self.dialects)) for _ in texts]
+        short = [i for i, text in enumerate(texts) if len(text) <= self.incremental_chars]
+        results = [None] * len(texts)
+        if short:
+            probs = self.predict_proba([texts[i] for i in short])
+            for i, row in zip(short, probs):
+                results[i] = dict(zip(self.dialects, row.tolist()))
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                results[i] = self.detect_incremental(text)['scores']
+        return results
+
+    def detect(self, text: str, location=None) -> str:
+        return self.detect_batch([text], [location])[0]
+
+    def detect_batch(self, texts: list, locations: list = None) -> list:
+        """Dialecte de chaque texte, combiné au prior de sa localisation s'il y en a une."""
+        locations = locations or [None] * len(texts)
+        if self.weights is None and not any(locations):
+            return [DEFAULT_DIALECT] * len(texts)
+        results = []
+        for scores, location in zip(self._scores_batch(texts), locations):
+            scores, prior = self.fuse(scores, location)
+            results.append(max(scores, key=scores.get)
+                           if self.weights is not None or prior is not None
+                           else DEFAULT_DIALECT)
+        return results
+
+    def detect_incremental(self, text: str, margin: float = None,
+                           max_chars: int = None) -> dict:
+        """Détection phrase par phrase, arrêtée dès que le dialecte est sûr.
+
+        Les sommes des poids des phrases lues s'accumulent : la probabilité
+        a posteriori après ``k`` phrases est celle du texte formé de ces
+        ``k`` phrases. La lecture s'arrête dès que l'écart entre les deux
+        meilleurs dialectes atteint ``margin``, ou après ``max_chars``
+        caractères, ce qui borne le coût sur les très longs textes.
+        """
+        margin = self.margin if margin is None else margin
+        max_chars = self.max_chars if max_chars is None else max_chars
+        if self.weights is None:
+            scores = dict(zip(self.dialects, [1.0 / len(self.dialects)] * len(self.dialects)))
+            return {'predicted': DEFAULT_DIALECT, 'scores': scores,
+                    'confidence': scores[DEFAULT_DIALECT], 'sentences': 0,
+                    'chars_read': 0, 'complete': False}
+
+        sums = np.zeros(len(self.dialects))
+        total, read, chars_read = 0, 0, 0
+        probs = self._probs(sums[None, :], np.array([0]))[0]
+        complete = True
+        spans = segment_spans(text)
+        while True:
+            block = []
+            for span in spans:
+                block.append(span)
+                if len(block) == INCREMENTAL_BLOCK or span[1] >= max_chars:
+                    break
+            if not block:
+                break
+            # Sommes cumulées : un préfixe de phrases par ligne, une seule passe creuse
+            block_sums, lengths = self._segment_sums(text, block)
+            prefix_sums = sums + np.cumsum(block_sums, axis=0)
+            prefix_lengths = total + np.cumsum(lengths)
+            prefix_probs = self._probs(prefix_sums, prefix_lengths)
+            confident = np.flatnonzero(_margins(prefix_probs) >= margin)
+            last = confident[0] if len(confident) else len(block) - 1
+            sums, total = prefix_sums[last], prefix_lengths[last]
+            probs, read, chars_read = prefix_probs[last], read + int(last) + 1, block[last][1]
+            if len(confident) or chars_read >= max_chars:
+                complete = NON_SPACE.search(text, chars_read) is None
+                break
+
+        best = int(probs.argmax())
+        return {'predicted': self.dialects[best],
+                'scores': dict(zip(self.dialects, probs.tolist())),
+                'confidence': float(probs[best]), 'sentences': read,
+                'chars_read': chars_read, 'complete': complete}
+
+    def segments(self, text: str, margin: float = None) -> list:
+        """Dialecte de chaque passage d'un texte mêlant plusieurs dialectes.
+
+        Chaque phrase est classée (toutes en une passe creuse) ; une phrase
+        sûre d'un autre dialecte ouvre un nouveau segment, une phrase peu
+        sûre (écart inférieur à ``margin``, ou phrase trop courte) reste dans
+        le segment courant.
+        Les scores d'un segment sont ceux de l'ensemble de ses phrases.
+        """
+        margin = self.margin if margin is None else margin
+        spans = list(segment_spans(text))
+        if not spans:
+            return []
+        if self.weights is None:
+            return [{'start': spans[0][0], 'end': spans[-1][1], 'dialect': DEFAULT_DIALECT,
+                     'confidence': 1.0 / len(self.dialects), 'sentences': len(spans)}]
+
+        sums, lengths = self._segment_sums(text, spans)
+        probs = self._probs(sums, lengths)
+        labels = probs.argmax(axis=1)
+        sure = (_margins(probs) >= margin) & (lengths >= MIN_SEGMENT_NGRAMS)
+        runs = []                           # [début, fin, étiquette, premier, dernier]
+        for i, (span, label) in enumerate(zip(spans, labels)):
+            if runs and (label == runs[-1][2] or not sure[i]):
+                runs[-1][1], runs[-1][4] = span[1], i
+            else:
+                runs.append([span[0], span[1], label, i, i])
+
+        segments = []
+        for start, end, _, first, last in runs:
+            run_probs = self._probs(sums[first:last + 1].sum(axis=0)[None, :],
+                                    lengths[first:last + 1].sum(keepdims=True))[0]
+            best = int(run_probs.argmax())
+            segments.append({'start': start, 'end': end, 'dialect': self.dialects[best],
+                             'confidence': float(run_probs[best]),
+                             'sentences': last - first + 1})
+        return segments
 
-    def detect(self, text: str) -> str:
-        # TODO: charger classifieur et prédire
-        return 'anlo'
+    def analyze(self, text: str, detailed: bool = False, location=None) -> dict:
+        """Dialecte prédit ; avec ``detailed``, scores, confiance et segments.
 
-    def analyze(self, text: str, detailed: bool = False) -> dict:
-        info = {'predicted': self.detect(text)}
+        Avec ``location``, les scores sont combinés au prior géographique,
+        renvoyé sous ``prior``.
+        """
+        scores, prior = self.fuse(self._scores_batch([text])[0], location)
+        predicted = (max(scores, key=scores.get)
+                     if self.weights is not None or prior is not None else DEFAULT_DIALECT)
+        info = {'predicted': predicted}
         if detailed:
-            info['scores'] = {'anlo': 0.7, 'inland': 0.3}
+            info['scores'] = scores
+            info['confidence'] = scores[predicted]
+            if prior is not None:
+                info['prior'] = prior
+            info['segments'] = self.segments(text)
         return info
@@ -0,0 +1,143 @@
+"""GeoClassifier: probabilités a priori des dialectes selon la localisation."""
+import hashlib
+import logging
+import math
+from pathlib import Path
+
+import numpy as np
+
+from ...exceptions import ValidationError
+from ..base_processor import BaseProcessor
+from ..tokenizer.dialect_aware_tokenizer import DEFAULT_RESOURCES, SUPPORTED_DIALECTS
+from .variation_mapper import load_resource
+
+logger = logging.getLogger(__name__)
+
+GEO_DISTRIBUTION = "dialects/geo_distribution.json"
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+# Taille des cellules de la grille (degrés) ; ~55 km de côté en latitude
+CELL_DEGREES = 0.5
+# Noyau gaussien : largeur de bande et rayon au-delà duquel un point est ignoré
+BANDWIDTH_KM = 25.0
+RADIUS_KM = 75.0
+# Part uniforme mêlée au prior : aucun dialecte n'y est jamais exclu
+PRIOR_SMOOTHING = 0.05
+
+
+def distribution_key(resources_path=DEFAULT_RESOURCES) -> str:
+    """Empreinte de ``geo_distribution.json`` (vide si le fichier manque)."""
+    path = Path(resources_path) / GEO_DISTRIBUTION
+    return hashlib.sha1(path.read_bytes() if path.exists() else b'').hexdigest()[:12]
+
+
+class GeoClassifier(BaseProcessor):
+    """Distribution des dialectes autour d'un point ou dans une région.
+
+    ``dialects/geo_distribution.json`` liste des points d'enquête et des
+    régions : ``{"geo_distribution": {"points": [{"lat": 5.92, "lon": 0.99,
+    "region": "GH-TV", "dialects": {"anlo": 0.9, "inland": 0.1}}],
+    "regions": {"GH-TV": {...}}}}``. Les points sont rangés dans une grille
+    de cellules de ``CELL_DEGREES`` degrés : une requête ne lit que les
+    cellules couvrant le rayon ``RADIUS_KM`` autour du point, et moyenne
+    leurs distributions avec un noyau gaussien sur la distance (haversine).
+    Une région sans distribution propre reçoit la moyenne de ses points.
+    """
+
+    def __init__(self, config=None, dialects=SUPPORTED_DIALECTS):
+        super().__init__(config)
+        resources = (config.data.linguistic_resources_path
+                     if config is not None else DEFAULT_RESOURCES)
+        self.path = Path(resources) / GEO_DISTRIBUTION
+        self.dialects = list(dialects)
+        self.reload()
+
+    def reload(self):
+        data = load_resource(self.path, 'geo_distribution') or {}
+        points = [p for p in data.get('points') or [] if p.get('dialects')]
+        self.lat = np.radians([float(p['lat']) for p in points])
+        self.lon = np.radians([float(p['lon']) for p in points])
+        self.distributions = np.array([self._vector(p['dialects']) for p in points]
+                                      ).reshape(len(points), len(self.dialects))
+
+        self.grid = {}
+        for i, p in enumerate(points):
+            self.grid.setdefault(self._cell(float(p['lat']), float(p['lon'])), []).append(i)
+        self.grid = {cell: np.array(indices) for cell, indices in self.grid.items()}
+
+        regions = {}
+        for i, p in enumerate(points):
+            if p.get('region'):
+                regions.setdefault(p['region'].upper(), []).append(self.distributions[i])
+        self.regions = {code: np.mean(rows, axis=0) for code, rows in regions.items()}
+        for code, distribution in (data.get('regions') or {}).items():
+            self.regions[code.upper()] = self._vector(distribution)
+        if points or self.regions:
+            logger.info(f"Geo prior: {len(points)} points in {len(self.grid)} cells, "
+                        f"{len(self.regions)} regions")
+
+    def __bool__(self):
+        return bool(self.grid) or bool(self.regions)
+
+    def _vector(self, distribution: dict) -> np.ndarray:
+        vector = np.array([float(distribution.get(d, 0.0)) for d in self.dialects])
+        total = vector.sum()
+        return vector / total if total > 0 else np.full(len(self.dialects), 1.0 / len(vector))
+
+    @staticmethod
+    def _cell(lat: float, lon: float):
+        return int(math.floor(lat / CELL_DEGREES)), int(math.floor(lon / CELL_DEGREES))
+
+    def _candidates(self, lat: float, lon: float) -> np.ndarray:
+        """Indices des points des cellules couvrant le rayon autour de (lat, lon)."""
+        row, col = self._cell(lat, lon)
+        lat_cells = math.ceil(RADIUS_KM / (CELL_DEGREES * KM_PER_DEGREE))
+        # Les degrés de longitude raccourcissent vers les pôles
+        shrink = max(math.cos(math.radians(min(abs(lat) + CELL_DEGREES, 89.0))), 1e-3)
+        lon_cells = math.ceil(RADIUS_KM / (CELL_DEGREES * KM_PER_DEGREE * shrink))
+        found = [self.grid[r, c]
+                 for r in range(row - lat_cells, row + lat_cells + 1)
+                 for c in range(col - lon_cells, col + lon_cells + 1) if (r, c) in self.grid]
+        return np.concatenate(found) if found else np.zeros(0, dtype=int)
+
+    def _smooth(self, vector: np.ndarray) -> dict:
+        vector = (1.0 - PRIOR_SMOOTHING) * vector + PRIOR_SMOOTHING / len(vector)
+        return dict(zip(self.dialects, vector.tolist()))
+
+    def point_prior(self, lat: float, lon: float):
+        """Prior autour d'un point, ou ``None`` si aucun point d'enquête n'est assez proche."""
+        if not -90.0 <= lat <= 90.0 or not -180.0 <= lon <= 180.0:
+            raise ValidationError(f"Invalid coordinates: ({lat}, {lon})")
+        candidates = self._candidates(lat, lon)
+        if not len(candidates):
+            return None
+        phi, lam = math.radians(lat), math.radians(lon)
+        a = (np.sin((self.lat[candidates] - phi) / 2) ** 2
+             + math.cos(phi) * np.cos(self.lat[candidates])
+             * np.sin((self.lon[candidates] - lam) / 2) ** 2)
+        distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        close = distance <= RADIUS_KM
+        if not close.any():
+            return None
+        weights = np.exp(-(distance[close] / BANDWIDTH_KM) ** 2)
+        return self._smooth(weights @ self.distributions[candidates[close]] / weights.sum())
+
+    def region_prior(self, region: str):
+        """Prior d'une région (code, ex. ``GH-TV``), ou ``None`` si elle est inconnue."""
+        distribution = self.regions.get(region.upper())
+        return self._smooth(distribution) if distribution is not None else None
+
+    def prior(self, location):
+        """Prior d'une localisation : ``{"lat", "lon"}``, ``{"region"}``, ou les deux.
+
+        Les coordonnées priment ; la région sert si aucun point n'est proche.
+        Renvoie ``None`` quand rien n'est connu de la localisation.
+        """
+        if not location or not self:
+            return None
+        prior = None
+        if location.get('lat') is not None and location.get('lon') is not None:
+            prior = self.point_prior(float(location['lat']), float(location['lon']))
+        if prior is None and location.get('region'):
+            prior = self.region_prior(location['region'])
+        return prior
@@ -0,0 +1,166 @@
+"""VariationMapper: règles de variation dialectale compilées par paire de dialectes."""
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+
+from ...exceptions import DialectConversionError
+from ..base_processor import BaseProcessor
+from ..tokenizer.dialect_aware_tokenizer import DEFAULT_RESOURCES, SUPPORTED_DIALECTS
+
+logger = logging.getLogger(__name__)
+
+VARIATION_RULES = "dialects/variation_rules.json"
+SOUND_CORRESPONDENCES = "phonetics/sound_correspondences.json"
+
+
+def load_resource(path, section: str):
+    """Lit la section ``section`` d'une ressource JSON (fichier absent ou vide accepté).
+
+    Une ressource qui n'est pas un objet (ex. une liste de formes) est renvoyée telle quelle.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if not content.strip():
+        return None
+    data = json.loads(content)
+    return data.get(section) if isinstance(data, dict) else data
+
+
+class ConversionPlan:
+    """Conversion compilée d'un dialecte vers un autre, appliquée token par token.
+
+    Les mots listés sont cherchés dans une table ; les autres passent par
+    une seule expression régulière des réécritures : début de mot
+    (``^ɣ``), fin de mot (``e$``) et toute position. Ses alternatives sont
+    rangées par longueur décroissante, chacune avec sa condition de
+    position : le mot est parcouru une fois, de gauche à droite, et à
+    chaque position la plus longue séquence applicable l'emporte, quelle
+    que soit sa catégorie (à longueur égale, début et fin de mot passent
+    avant toute position). La sortie d'une réécriture n'est pas réécrite,
+    comme dans un transducteur. La casse du token (initiale ou tout en
+    majuscules) est conservée.
+    """
+
+    def __init__(self, words: dict = None, rewrites: dict = None):
+        self.words = {src.lower(): dst for src, dst in (words or {}).items()}
+        self.rewrites = dict(rewrites or {})
+        tables = {'initial': {}, 'final': {}, 'medial': {}}
+        for src, dst in self.rewrites.items():
+            # ^ et $ de la forme cible ne font que répéter la position de la source
+            dst = dst[1:] if dst.startswith('^') else dst
+            dst = dst[:-1] if dst.endswith('$') else dst
+            if src.startswith('^') and src.endswith('$') and len(src) > 2:
+                self.words.setdefault(src[1:-1].lower(), dst)
+            elif src.startswith('^') and len(src) > 1:
+                tables['initial'][src[1:].lower()] = dst
+            elif src.endswith('$') and len(src) > 1:
+                tables['final'][src[:-1].lower()] = dst
+            elif src:
+                tables['medial'][src.lower()] = dst
+        self.tables = tables
+        templates = {'initial': '^{}', 'final': '{}$', 'medial': '{}'}
+        rules = sorted((-len(src), order, name, src)
+                       for order, name in enumerate(templates) for src in tables[name])
+        alternatives = [templates[name].format(re.escape(src)) for _, _, name, src in rules]
+        self.pattern = re.compile('|'.join(alternatives)) if alternatives else None
+
+    def __bool__(self):
+        return bool(self.words) or self.pattern is not None
+
+    @property
+    def key(self) -> str:
+        """Empreinte des règles, pour distinguer les résultats de plans différents."""
+        payload = json.dumps([sorted(self.words.items()), sorted(self.rewrites.items())],
+                             ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+    def _rewrite(self, match) -> str:
+        src = match.group()
+        if match.start() == 0 and src in self.tables['initial']:
+            return self.tables['initial'][src]
+        if match.end() == len(match.string) and src in self.tables['final']:
+            return self.tables['final'][src]
+        return self.tables['medial'][src]
+
+    def apply(self, token: str) -> str:
+        word = token.lower()
+        converted = self.words.get(word)
+        if converted is None:
+            if self.pattern is None:
+                return token
+            converted = self.pattern.sub(self._rewrite, word)
+        if converted == word:
+            return token
+        if token.isupper() and len(token) > 1:
+            return converted.upper()
+        if token[:1].isupper():
+            return converted[:1].upper() + converted[1:]
+        return converted
+
+
+class VariationMapper(BaseProcessor):
+    """Correspondances entre formes dialectales, compilées par paire de dialectes.
+
+    ``phonetics/sound_correspondences.json`` donne des séries de segments
+    équivalents, ``{"sound_correspondences": [{"anlo": "ɣ", "inland": "g"}]}``
+    (``^``/``$`` : début/fin de mot) ; ``dialects/variation_rules.json`` des
+    règles propres à une paire, qui l'emportent :
+    ``{"variation_rules": {"anlo>inland": {"words": {...}, "rewrites": {...}}}}``.
+    Chaque paire n'est compilée qu'une fois.
+    """
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.resources = Path(config.data.linguistic_resources_path
+                              if config is not None else DEFAULT_RESOURCES)
+        self._compiled = {}
+        self.reload_rules()
+
+    def reload_rules(self):
+        self.variation_rules = load_resource(self.resources / VARIATION_RULES,
+                                             'variation_rules') or {}
+        self.correspondences = load_resource(self.resources / SOUND_CORRESPONDENCES,
+                                             'sound_correspondences') or []
+        self._compiled = {}
+
+    @staticmethod
+    def check_dialect(dialect: str):
+        # Le nom sert de clé d'un cache sans éviction
+        if dialect not in SUPPORTED_DIALECTS:
+            raise DialectConversionError(f"Unsupported dialect: {dialect!r}")
+
+    def rules_for(self, source: str, target: str) -> dict:
+        """Mots et réécritures de ``source`` vers ``target``."""
+        rewrites = {}
+        for series in self.correspondences:
+            src, dst = series.get(source), series.get(target)
+            if src and dst is not None and src != dst:
+                rewrites[src] = dst
+        pair = self.variation_rules.get(f"{source}>{target}") or {}
+        rewrites.update(pair.get('rewrites') or {})
+        return {'words': dict(pair.get('words') or {}), 'rewrites': rewrites}
+
+    def compile(self, source: str, target: str) -> ConversionPlan:
+        plan = self._compiled.get((source, target))
+        if plan is None:
+            self.check_dialect(source)
+            self.check_dialect(target)
+            plan = ConversionPlan(**self.rules_for(source, target))
+            if not plan and source != target:
+                logger.warning(f"No variation rules from {source} to {target}")
+            self._compiled[source, target] = plan
+        return plan
+
+    def map(self, token: str, source: str, target: str) -> str:
+        """Forme de ``token`` dans le dialecte ``target``."""
+        return self.compile(source, target).apply(token)
+
+    def variants(self, token: str, source: str) -> dict:
+        """Forme de ``token`` dans chacun des dialectes pris en charge."""
+        return {dialect: token if dialect == source else self.map(token, source, dialect)
+                for dialect in SUPPORTED_DIALECTS}
@@ -0,0 +1,5 @@
+"""Embedding modules."""
+
+from .word_embeddings import WordEmbeddings
+
+__all__ = ["WordEmbeddings"]
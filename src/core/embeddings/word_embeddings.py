@@ -0,0 +1,80 @@
+"""WordEmbeddings: vecteurs de mots statiques."""
+import logging
+
+import numpy as np
+
+from ..base_processor import BaseProcessor
+from ..tokens import TokenSpans
+
+logger = logging.getLogger(__name__)
+
+
+class WordEmbeddings(BaseProcessor):
+    """Recherche de vecteurs dans un modèle word2vec/fastText."""
+
+    def __init__(self, model_path=None, config=None):
+        super().__init__(config)
+        from ..model_registry import as_model_entry
+        entry = as_model_entry(model_path)
+        self.model_path = entry.path if entry is not None else None
+        self.vectors = self._load(entry)
+
+    def _load(self, entry):
+        if entry is None or not entry.available:
+            logger.warning(f"Embedding model not available: {self.model_path}")
+            return {}
+        # Chargé une seule fois par processus ; les fichiers .kv sont mappés
+        # en mémoire et partagés entre workers
+        from ..model_registry import shared_store
+        return shared_store(self.config).load_entry(entry)
+
+    def get_embeddings(self, tokens: list) -> list:
+        """Retourne un vecteur par token (None si hors vocabulaire)."""
+        return [self.vectors[tok].tolist() if tok in self.vectors else None
+                for tok in tokens]
+
+    @property
+    def dimension(self) -> int:
+        return getattr(self.vectors, 'vector_size', 0)
+
+    def get_embeddings_batch(self, token_lists: list) -> tuple:
+        """Retourne un tableau (batch, max_len, dim) rempli de zéros et le
+        masque booléen des tokens présents dans le vocabulaire."""
+        max_len = max((len(tokens) for tokens in token_lists), default=0)
+        index = getattr(self.vectors, 'key_to_index', {})
+        ids = np.full((len(token_lists), max_len), -1, dtype=np.int64)
+        for i, tokens in enumerate(token_lists):
+            ids[i, :len(tokens)] = [index.get(tok, -1) for tok in tokens]
+        mask = ids >= 0
+        embeddings = np.zeros((len(token_lists), max_len, self.dimension),
+                              dtype=np.float32)
+        if mask.any():
+            embeddings[mask] = self.vectors.vectors[ids[mask]]
+        return embeddings, mask
+
+    def get_matrix_batch(self, token_lists: list) -> list:
+        """Une matrice float32 (len, dim) par document, NaN hors vocabulaire.
+
+        Les vecteurs sont lus en un seul accès indexé pour tout le lot, une
+        fois par type de token pour les ``TokenSpans``.
+        """
+        index = getattr(self.vectors, 'key_to_index', {})
+        keys, positions = [], []
+        for tokens in token_lists:
+            types = tokens.types if isinstance(tokens, TokenSpans) else tokens
+            positions.append((len(keys), len(types)))
+            keys.extend(types)
+        ids = np.fromiter((index.get(key, -1) for key in keys), dtype=np.int64,
+                          count=len(keys))
+        found = ids >= 0
+        vectors = np.full((len(keys), self.dimension), np.nan, dtype=np.float32)
+        if found.any():
+            vectors[found] = self.vectors.vectors[ids[found]]
+
+        matrices = []
+        for tokens, (start, count) in zip(token_lists, positions):
+            matrix = vectors[start:start + count]
+            if isinstance(tokens, TokenSpans):
+                matrix = matrix[np.frombuffer(tokens.ids, dtype=np.uint32)]
+            matrices.append(matrix)
+        return matrices
@@ -0,0 +1,461 @@
+"""
+Model registry and process-wide model store.
+
+``models/MODEL_REGISTRY.json`` maps a model name to its versions and the
+active one; ``models/MODEL_CHECKSUMS.md`` lists the SHA-256 of each model
+file. ``ModelRegistry`` resolves a name (and optionally a version) to a
+``ModelEntry``, and ``ModelStore`` loads each file once per process,
+verifying its checksum on first load.
+
+Array formats (``.npy``, ``.safetensors``) and gensim ``.kv`` vectors are
+memory-mapped read-only, so the uvicorn workers and process-pool workers of
+a host share one physical copy through the page cache instead of each
+holding its own.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions import ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY = "models/MODEL_REGISTRY.json"
+DEFAULT_CHECKSUMS = "models/MODEL_CHECKSUMS.md"
+
+# File suffix -> format, when the registry does not name one
+SUFFIX_FORMATS = {
+    ".npy": "npy",
+    ".npz": "npz",
+    ".safetensors": "safetensors",
+    ".kv": "kv",
+    ".bin": "word2vec",
+    ".pkl": "pickle",
+    ".pt": "torch",
+    ".ts": "torchscript",
+    ".json": "json",
+}
+
+_CHECKSUM_LINE = re.compile(r"\b([0-9a-fA-F]{64})\b")
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """One version of a registered model."""
+    name: str
+    version: Optional[str]
+    path: str
+    format: Optional[str]
+    sha256: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        """The file exists and is not an empty placeholder (e.g. DVC not pulled)."""
+        return os.path.isfile(self.path) and os.path.getsize(self.path) > 0
+
+
+def as_model_entry(model, default_format: Optional[str] = None) -> Optional[ModelEntry]:
+    """``ModelEntry`` for a registry entry or a bare path (no version, no checksum)."""
+    if model is None or isinstance(model, ModelEntry):
+        return model
+    return ModelEntry(name=Path(model).stem, version=None, path=str(model),
+                      format=SUFFIX_FORMATS.get(Path(model).suffix.lower(), default_format))
+
+
+def format_for(path: str) -> str:
+    fmt = SUFFIX_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ModelLoadError(f"Cannot infer the model format of {path}")
+    return fmt
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_checksums(text: str) -> Dict[str, str]:
+    """Path -> SHA-256 from ``sha256sum`` output or a Markdown table."""
+    checksums = {}
+    for line in text.splitlines():
+        match = _CHECKSUM_LINE.search(line)
+        if match is None:
+            continue
+        rest = (line[:match.start()] + " " + line[match.end():]).replace("|", " ")
+        paths = [part.lstrip("*").strip("`") for part in rest.split()]
+        paths = [part for part in paths if "/" in part or "." in part]
+        if paths:
+            checksums[os.path.normpath(paths[0])] = match.group(1).lower()
+    return checksums
+
+
+class ModelRegistry:
+    """
+    Name/version -> file resolution backed by ``MODEL_REGISTRY.json``.
+
+    The registry has the form::
+
+        {"models": {"pos_tagger": {"active": "v1.2",
+                                   "versions": {"v1.2": {"path": "pos/pos_model_v1.2.pkl",
+                                                         "format": "pickle"}}}}}
+
+    Paths are relative to the registry's directory. Checksums come from the
+    entry's ``sha256`` field or, failing that, from the checksum file.
+    """
+
+    def __init__(self, registry_path: str = DEFAULT_REGISTRY,
+                 checksums_path: Optional[str] = DEFAULT_CHECKSUMS):
+        self.registry_path = registry_path
+        self.checksums_path = checksums_path
+        self.base_dir = os.path.dirname(registry_path)
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict[str, Any]] = {}
+        self._checksums: Dict[str, str] = {}
+        self.reload()
+
+    def reload(self):
+        """Re-read the registry and checksum files."""
+        models = _read_json(self.registry_path).get("models") or {}
+        checksums = {}
+        if self.checksums_path and os.path.exists(self.checksums_path):
+            with open(self.checksums_path, 'r', encoding='utf-8') as f:
+                checksums = parse_checksums(f.read())
+        with self._lock:
+            self._models = models
+            self._checksums = checksums
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._models
+
+    def names(self) -> List[str]:
+        return list(self._models)
+
+    def versions(self, name: str) -> List[str]:
+        return list(self._model(name).get("versions") or {})
+
+    def active_version(self, name: str) -> Optional[str]:
+        return self._model(name).get("active")
+
+    def resolve(self, name: str, version: Optional[str] = None) -> ModelEntry:
+        """Entry for ``name`` at ``version`` (the active version by default)."""
+        model = self._model(name)
+        version = version or model.get("active")
+        spec = (model.get("versions") or {}).get(version)
+        if spec is None:
+            raise ModelLoadError(f"Model '{name}' has no version '{version}'")
+        relative = os.path.normpath(spec["path"])
+        path = os.path.join(self.base_dir, relative)
+        sha256 = spec.get("sha256") or self._checksums.get(relative) \
+            or self._checksums.get(os.path.normpath(path))
+        return ModelEntry(name=name, version=version, path=path,
+                          format=spec.get("format") or format_for(path),
+                          sha256=sha256.lower() if sha256 else None)
+
+    def path_for(self, name: str, default: Optional[str] = None,
+                 version: Optional[str] = None) -> Optional[str]:
+        """Registered file of ``name``, or ``default`` if the model is not registered."""
+        entry = self.entry_for(name, default, version)
+        return entry.path if entry is not None else None
+
+    def entry_for(self, name: str, default: Optional[str] = None,
+                  version: Optional[str] = None) -> Optional[ModelEntry]:
+        """Registered entry of ``name``, or an entry for the ``default`` path.
+
+        A default path still gets the checksum listed for it in the checksum file.
+        """
+        if name in self or version is not None:
+            return self.resolve(name, version)
+        entry = as_model_entry(default)
+        if entry is None:
+            return None
+        sha256 = self._checksums.get(os.path.normpath(default)) or self._checksums.get(
+            os.path.normpath(os.path.relpath(default, self.base_dir or ".")))
+        return ModelEntry(name=name, version=None, path=entry.path, format=entry.format,
+                          sha256=sha256)
+
+    def register(self, name: str, version: str, path: str,
+                 fmt: Optional[str] = None, activate: bool = True) -> ModelEntry:
+        """Add ``path`` as ``version`` of ``name`` and record its checksum."""
+        relative = os.path.relpath(path, self.base_dir or ".")
+        spec = {"path": relative, "format": fmt or format_for(path),
+                "sha256": file_sha256(path)}
+        with self._lock:
+            data = _read_json(self.registry_path)
+            model = data.setdefault("models", {}).setdefault(name, {})
+            model.setdefault("versions", {})[version] = spec
+            if activate or not model.get("active"):
+                model["active"] = version
+            _write_json_atomic(self.registry_path, data)
+            self._models = data["models"]
+        logger.info(f"Registered model {name} {version} ({relative})")
+        return self.resolve(name, version)
+
+    def describe(self) -> Dict[str, Dict[str, Any]]:
+        """Registered models with their active version and availability."""
+        described = {}
+        for name in self.names():
+            active = self.active_version(name)
+            try:
+                entry = self.resolve(name, active)
+            except ModelLoadError:
+                described[name] = {"version": active, "status": "invalid",
+                                   "versions": self.versions(name)}
+                continue
+            described[name] = {
+                "version": entry.version,
+                "status": "active" if entry.available else "missing",
+                "format": entry.format,
+                "versions": self.versions(name),
+                "verified": shared_store().is_verified(entry.path),
+                "loaded": shared_store().is_loaded(entry.path),
+            }
+        return described
+
+    def _model(self, name: str) -> Dict[str, Any]:
+        model = self._models.get(name)
+        if model is None:
+            raise ModelLoadError(f"Model '{name}' is not registered in {self.registry_path}")
+        return model
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if not content.strip():
+        return {}
+    return json.loads(content)
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+# -- loaders -----------------------------------------------------------------
+
+_SAFETENSORS_DTYPES = {
+    "F64": "<f8", "F32": "<f4", "F16": "<f2",
+    "I64": "<i8", "I32": "<i4", "I16": "<i2", "I8": "i1",
+    "U64": "<u8", "U32": "<u4", "U16": "<u2", "U8": "u1", "BOOL": "?",
+}
+
+
+def _load_npy(path: str):
+    import numpy as np
+    return np.load(path, mmap_mode='r')
+
+
+def _load_npz(path: str):
+    # npz members are compressed or zipped and cannot be memory-mapped
+    import numpy as np
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+def _load_safetensors(path: str):
+    """Tensors of a safetensors file as read-only memory-mapped arrays."""
+    import numpy as np
+    with open(path, 'rb') as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    header.pop("__metadata__", None)
+    data = np.memmap(path, dtype=np.uint8, mode='r', offset=8 + header_size)
+    tensors = {}
+    for name, info in header.items():
+        dtype = _SAFETENSORS_DTYPES.get(info["dtype"])
+        if dtype is None:
+            raise ModelLoadError(f"Unsupported safetensors dtype {info['dtype']} in {path}")
+        start, end = info["data_offsets"]
+        tensors[name] = data[start:end].view(dtype).reshape(info["shape"])
+    return tensors
+
+
+def _load_kv(path: str):
+    from gensim.models import KeyedVectors
+    return KeyedVectors.load(path, mmap='r')
+
+
+def _load_word2vec(path: str):
+    from gensim.models import KeyedVectors
+    return KeyedVectors.load_word2vec_format(path, binary=True)
+
+
+def _load_pickle(path: str):
+    from ..utils import load_pickle
+    return load_pickle(path)
+
+
+def _load_torch(path: str):
+    import torch
+    try:
+        return torch.load(path, map_location='cpu', mmap=True)
+    except (TypeError, RuntimeError):
+        # older torch, or a legacy (non-zip) checkpoint that cannot be mapped
+        return torch.load(path, map_location='cpu')
+
+
+def _load_torchscript(path: str):
+    import torch
+    extra = {"meta.json": ""}
+    module = torch.jit.load(path, map_location='cpu', _extra_files=extra)
+    return {"module": module, "meta": json.loads(extra["meta.json"] or "{}")}
+
+
+def _load_json(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+LOADERS: Dict[str, Callable[[str], Any]] = {
+    "npy": _load_npy,
+    "npz": _load_npz,
+    "safetensors": _load_safetensors,
+    "kv": _load_kv,
+    "word2vec": _load_word2vec,
+    "pickle": _load_pickle,
+    "torch": _load_torch,
+    "torchscript": _load_torchscript,
+    "json": _load_json,
+}
+
+
+class ModelStore:
+    """
+    Process-wide cache of loaded model files.
+
+    Files are keyed by real path, size and modification time, so every
+    ``Pipeline`` of a process shares one loaded copy, and a file replaced on
+    disk is loaded afresh. Loaded models are shared between threads and
+    must be treated as read-only.
+    """
+
+    def __init__(self, verify_checksums: bool = True):
+        self.verify_checksums = verify_checksums
+        self._models: Dict[Tuple[str, int, int], Any] = {}
+        self._verified = set()
+        self._locks: Dict[Tuple[str, int, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {"loads": 0, "hits": 0}
+
+    @staticmethod
+    def _key(path: str) -> Tuple[str, int, int]:
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            raise ModelLoadError(f"Model file not found: {path}") from e
+        return os.path.realpath(path), st.st_size, st.st_mtime_ns
+
+    def load(self, path: str, fmt: Optional[str] = None,
+             sha256: Optional[str] = None) -> Any:
+        """Load ``path`` once per process, checking ``sha256`` if given."""
+        key = self._key(path)
+        if key[1] == 0:
+            raise ModelLoadError(f"Model file is empty: {path}")
+        with self._lock:
+            if key in self._models:
+                self._stats["hits"] += 1
+                return self._models[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key in self._models:
+                return self._models[key]
+            verified = bool(sha256 and self.verify_checksums)
+            if verified:
+                actual = file_sha256(path)
+                if actual != sha256.lower():
+                    raise ModelLoadError(
+                        f"Checksum mismatch for {path}: expected {sha256}, got {actual}")
+            fmt = fmt or format_for(path)
+            loader = LOADERS.get(fmt)
+            if loader is None:
+                raise ModelLoadError(f"Unknown model format '{fmt}' for {path}")
+            logger.info(f"Loading model {path} ({fmt})")
+            try:
+                model = loader(path)
+            except ModelLoadError:
+                raise
+            except Exception as e:
+                raise ModelLoadError(f"Failed to load model {path}: {e}") from e
+            with self._lock:
+                # drop copies of an older version of the same file
+                for stale in [k for k in self._models if k[0] == key[0]]:
+                    del self._models[stale]
+                    self._verified.discard(stale)
+                self._models[key] = model
+                if verified:
+                    self._verified.add(key)
+                self._locks.pop(key, None)
+                self._stats["loads"] += 1
+        return model
+
+    def load_entry(self, entry: ModelEntry) -> Any:
+        """Load a registry entry, checking its checksum when one is recorded."""
+        return self.load(entry.path, entry.format, entry.sha256)
+
+    def is_verified(self, path: str) -> bool:
+        """``path`` is loaded and its checksum was checked on load."""
+        real = os.path.realpath(path)
+        with self._lock:
+            return any(key[0] == real for key in self._verified)
+
+    def is_loaded(self, path: str) -> bool:
+        real = os.path.realpath(path)
+        with self._lock:
+            return any(key[0] == real for key in self._models)
+
+    def evict(self, path: str):
+        real = os.path.realpath(path)
+        with self._lock:
+            for key in [k for k in self._models if k[0] == real]:
+                del self._models[key]
+                self._verified.discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, models=len(self._models))
+
+
+_shared_store: Optional[ModelStore] = None
+_registries: Dict[Tuple[str, Optional[str]], ModelRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_store(config=None) -> ModelStore:
+    """The process-wide ``ModelStore``."""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = ModelStore()
+        if config is not None:
+            _shared_store.verify_checksums = config.models.verify_checksums
+        return _shared_store
+
+
+def model_registry(config=None) -> ModelRegistry:
+    """Process-wide registry for the configured registry and checksum files."""
+    if config is not None:
+        key = (config.models.registry_path, config.models.checksums_path)
+    else:
+        key = (DEFAULT_REGISTRY, DEFAULT_CHECKSUMS)
+    with _shared_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ModelRegistry(*key)
+        return registry
@@ -0,0 +1,8 @@
+"""Morphological analysis modules."""
+
+from .affix_processor import AffixProcessor
+from .automaton import Automaton
+from .morphological_analyzer import MorphologicalAnalyzer
+from .stem_extractor import StemExtractor
+
+__all__ = ["AffixProcessor", "Automaton", "MorphologicalAnalyzer", "StemExtractor"]
@@ -0,0 +1,135 @@
+"""AffixProcessor: préfixes, suffixes et règles flexionnelles compilés."""
+import json
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .automaton import Automaton
+
+AFFIX_KINDS = ('prefix', 'suffix')
+
+
+def normalize_form(form: str) -> str:
+    """Forme de lexique : NFC, minuscules, sans tiret de bordure (``-wo`` -> ``wo``)."""
+    return unicodedata.normalize('NFC', form).lower().strip().strip('-')
+
+
+def lexicon_entries(data) -> Dict[str, dict]:
+    """Entrées d'un lexique, quelle que soit sa forme dans la ressource.
+
+    Acceptés : liste de formes, liste d'objets ``{"form": ...}``, ou objet
+    forme -> glose (chaîne) ou forme -> attributs.
+    """
+    entries = {}
+    if isinstance(data, dict):
+        items = [(form, value if isinstance(value, dict) else {'gloss': value})
+                 for form, value in data.items()]
+    else:
+        items = [(item, {}) if isinstance(item, str) else (item['form'], item)
+                 for item in data or []]
+    for form, attributes in items:
+        form = normalize_form(form)
+        if form:
+            entries[form] = {key: value for key, value in attributes.items() if key != 'form'}
+    return entries
+
+
+class AffixProcessor:
+    """Reconnaît les chaînes de préfixes et de suffixes d'un mot.
+
+    Préfixes et suffixes sont compilés en automates minimaux (``Automaton``),
+    les suffixes sur leurs formes inversées : toutes les chaînes possibles se
+    lisent en un parcours du mot depuis chaque bord. Les traits d'un affixe
+    sont complétés par les règles de ``inflection_rules.json`` qui portent
+    sur la catégorie du radical.
+    """
+
+    def __init__(self, arrays):
+        self.prefixes = Automaton.from_arrays(arrays, 'prefix_')
+        self.suffixes = Automaton.from_arrays(arrays, 'suffix_')
+        self.forms = {kind: arrays[f'{kind}_forms'].tolist() for kind in AFFIX_KINDS}
+        self.glosses = {kind: arrays[f'{kind}_glosses'].tolist() for kind in AFFIX_KINDS}
+        self.base_features = {kind: [json.loads(f) for f in arrays[f'{kind}_features'].tolist()]
+                              for kind in AFFIX_KINDS}
+        self.rules = {}
+        for kind, index, pos, features in zip(arrays['rule_kind'].tolist(),
+                                              arrays['rule_index'].tolist(),
+                                              arrays['rule_pos'].tolist(),
+                                              arrays['rule_features'].tolist()):
+            self.rules.setdefault((kind, index), []).append((pos, json.loads(features)))
+
+    @staticmethod
+    def compile(prefixes, suffixes, rules) -> Dict[str, np.ndarray]:
+        """Tableaux des affixes et des règles (données lues des ressources JSON)."""
+        arrays = {}
+        entries = {'prefix': lexicon_entries(prefixes), 'suffix': lexicon_entries(suffixes)}
+        ranks = {}
+        for kind in AFFIX_KINDS:
+            # Le rang d'un suffixe est celui de sa forme inversée
+            key = (lambda form: form[::-1]) if kind == 'suffix' else (lambda form: form)
+            forms = sorted(entries[kind], key=key)
+            ranks[kind] = {form: i for i, form in enumerate(forms)}
+            automaton = Automaton.compile(key(form) for form in forms)
+            arrays.update({f'{kind}_{name}': value for name, value in automaton.items()})
+            arrays[f'{kind}_forms'] = np.array(forms, dtype=str)
+            arrays[f'{kind}_glosses'] = np.array(
+                [str(entries[kind][form].get('gloss', '')) for form in forms], dtype=str)
+            arrays[f'{kind}_features'] = np.array(
+                [json.dumps(entries[kind][form].get('features') or {}, ensure_ascii=False)
+                 for form in forms], dtype=str)
+
+        compiled_rules = []
+        for rule in rules or []:
+            kind = rule.get('type') or ('prefix' if rule['affix'].endswith('-') else 'suffix')
+            index = ranks.get(kind, {}).get(normalize_form(rule['affix']))
+            if index is None:
+                continue
+            pos = rule.get('pos') or ['']
+            for tag in [pos] if isinstance(pos, str) else pos:
+                compiled_rules.append((kind, index, tag,
+                                       json.dumps(rule.get('features') or {}, ensure_ascii=False)))
+        for n, name in enumerate(('rule_kind', 'rule_index', 'rule_pos', 'rule_features')):
+            column = [rule[n] for rule in compiled_rules]
+            arrays[name] = np.array(column, dtype=np.int32 if name == 'rule_index' else str)
+        return arrays
+
+    def lookup(self, kind: str, form: str) -> Optional[int]:
+        """Rang de l'affixe ``form`` (``'prefix'`` ou ``'suffix'``), ou ``None``."""
+        form = normalize_form(form)
+        if kind == 'suffix':
+            return self.suffixes.index(form[::-1])
+        return self.prefixes.index(form)
+
+    def prefix_chains(self, word: str, limit: int) -> List[Tuple[int, tuple]]:
+        """(fin, rangs des préfixes) de chaque chaîne d'au plus ``limit`` préfixes."""
+        chains = frontier = [(0, ())]
+        for _ in range(limit):
+            frontier = [(end, chain + (rank,)) for start, chain in frontier
+                        for end, rank in self.prefixes.prefixes(word, start)]
+            if not frontier:
+                break
+            chains = chains + frontier
+        return chains
+
+    def suffix_chains(self, word: str, limit: int) -> List[Tuple[int, tuple]]:
+        """(début, rangs des suffixes dans l'ordre du mot) des chaînes d'au plus ``limit`` suffixes."""
+        reversed_word = word[::-1]
+        chains = frontier = [(0, ())]
+        for _ in range(limit):
+            frontier = [(end, (rank,) + chain) for start, chain in frontier
+                        for end, rank in self.suffixes.prefixes(reversed_word, start)]
+            if not frontier:
+                break
+            chains = chains + frontier
+        return [(len(word) - end, chain) for end, chain in chains]
+
+    def features(self, kind: str, indices: tuple, pos: str) -> Dict[str, object]:
+        """Traits apportés par des affixes à un radical de catégorie ``pos``."""
+        features = {}
+        for index in indices:
+            features.update(self.base_features[kind][index])
+            for rule_pos, rule_features in self.rules.get((kind, index), ()):
+                if not rule_pos or rule_pos == pos:
+                    features.update(rule_features)
+        return features
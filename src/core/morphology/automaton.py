@@ -0,0 +1,127 @@
+"""Automaton: lexique compilé en automate acyclique minimal (DAFSA)."""
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+class Automaton:
+    """Automate déterministe acyclique minimal reconnaissant un lexique.
+
+    Les sous-arbres identiques du trie (mêmes transitions, même statut
+    final) sont fusionnés, si bien que les formes partageant une fin
+    partagent aussi leurs états. Chaque transition porte le nombre de mots
+    qu'elle saute : la somme le long d'un chemin donne le rang du mot dans
+    l'ordre trié (hachage parfait minimal), qui indexe les tableaux de
+    valeurs associés au lexique.
+
+    L'automate est stocké en tableaux plats (``compile``), relus sans
+    recompilation par ``from_arrays``.
+    """
+
+    FIELDS = ('src', 'label', 'dst', 'skip', 'final', 'size')
+
+    def __init__(self, delta: Dict[Tuple[int, str], Tuple[int, int]], final: frozenset,
+                 size: int):
+        self.delta = delta
+        self.final = final
+        self.size = size
+
+    def __len__(self) -> int:
+        """Nombre de mots reconnus."""
+        return self.size
+
+    @staticmethod
+    def compile(words: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Tableaux de l'automate minimal de ``words`` (rang = ordre trié)."""
+        words = sorted(set(words))
+        # Trie : un état = [final, {caractère: état}]
+        root = [False, {}]
+        for word in words:
+            node = root
+            for char in word:
+                node = node[1].setdefault(char, [False, {}])
+            node[0] = True
+
+        # Minimisation : un état par signature (final, transitions vers des états canoniques)
+        registry: Dict[tuple, int] = {}
+        states = []                         # (final, [(caractère, état)])
+
+        def canonical(node) -> int:
+            edges = tuple((char, canonical(child)) for char, child in sorted(node[1].items()))
+            signature = (node[0], edges)
+            state = registry.get(signature)
+            if state is None:
+                state = registry[signature] = len(states)
+                states.append(signature)
+            return state
+
+        start = canonical(root)
+        # L'état initial prend le numéro 0
+        order = [start] + [s for s in range(len(states)) if s != start]
+        renumber = {old: new for new, old in enumerate(order)}
+        counts = [0] * len(states)
+        for state, (final, edges) in enumerate(states):   # enfants avant parents
+            counts[state] = int(final) + sum(counts[child] for _, child in edges)
+
+        src, label, dst, skip = [], [], [], []
+        final = np.zeros(len(states), dtype=bool)
+        for state in order:
+            is_final, edges = states[state]
+            final[renumber[state]] = is_final
+            passed = int(is_final)
+            for char, child in edges:
+                src.append(renumber[state])
+                label.append(char)
+                dst.append(renumber[child])
+                skip.append(passed)
+                passed += counts[child]
+        return {
+            'src': np.array(src, dtype=np.int32),
+            'label': np.array(label, dtype='<U1'),
+            'dst': np.array(dst, dtype=np.int32),
+            'skip': np.array(skip, dtype=np.int32),
+            'final': final,
+            'size': np.array(len(words)),
+        }
+
+    @classmethod
+    def build(cls, words: Iterable[str]) -> "Automaton":
+        return cls.from_arrays(cls.compile(words))
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix: str = '') -> "Automaton":
+        """Automate relu des tableaux de ``compile`` (clés préfixées par ``prefix``)."""
+        src, label, dst, skip, final, size = (arrays[prefix + field] for field in cls.FIELDS)
+        delta = dict(zip(zip(src.tolist(), label.tolist()), zip(dst.tolist(), skip.tolist())))
+        return cls(delta, frozenset(np.flatnonzero(final).tolist()), int(size))
+
+    def index(self, word: str, start: int = 0, end: Optional[int] = None) -> Optional[int]:
+        """Rang de ``word[start:end]`` dans le lexique, ou ``None``."""
+        delta = self.delta
+        state, rank = 0, 0
+        for char in word[start:end]:
+            step = delta.get((state, char))
+            if step is None:
+                return None
+            state, skip = step
+            rank += skip
+        return rank if state in self.final else None
+
+    def __contains__(self, word: str) -> bool:
+        return self.index(word) is not None
+
+    def prefixes(self, word: str, start: int = 0) -> Iterator[Tuple[int, int]]:
+        """(fin, rang) de chaque mot du lexique qui commence ``word`` en ``start``.
+
+        Un seul parcours de ``word`` depuis ``start``.
+        """
+        delta = self.delta
+        state, rank = 0, 0
+        for position in range(start, len(word)):
+            step = delta.get((state, word[position]))
+            if step is None:
+                return
+            state, skip = step
+            rank += skip
+            if state in self.final:
+                yield position + 1, rank
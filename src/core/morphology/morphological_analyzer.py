@@ -0,0 +1,227 @@
+"""MorphologicalAnalyzer: analyse morphologique des tokens."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from ..base_processor import BaseProcessor
+from ..dialect_handler.variation_mapper import load_resource
+from ..tokenizer.dialect_aware_tokenizer import DEFAULT_RESOURCES
+from ..tokens import TokenSpans
+from ..token_memo import shared_memo
+from .affix_processor import AffixProcessor, normalize_form
+from .automaton import Automaton
+from .stem_extractor import StemExtractor
+
+logger = logging.getLogger(__name__)
+
+# Ressources compilées, relatives à data/linguistic_resources
+MORPHOLOGY_RESOURCES = {
+    'prefixes': "morphology/prefixes.json",
+    'suffixes': "morphology/suffixes.json",
+    'stems': "morphology/stems.json",
+    'inflection_rules': "morphology/inflection_rules.json",
+    'morpheme_boundaries': "morphology/morpheme_boundaries.json",
+}
+# À incrémenter quand le format des tableaux compilés change
+FORMAT_VERSION = 1
+DEFAULT_CACHE_DIR = ".cache/"
+MAX_PREFIXES = 2
+MAX_SUFFIXES = 3
+MIN_STEM_LENGTH = 2
+
+
+def source_key(resources_path) -> str:
+    """Empreinte des ressources morphologiques (contenu des fichiers et format)."""
+    digest = hashlib.sha1(f"morphology-v{FORMAT_VERSION}".encode('utf-8'))
+    for name, relative in sorted(MORPHOLOGY_RESOURCES.items()):
+        path = Path(resources_path) / relative
+        digest.update(name.encode('utf-8'))
+        digest.update(path.read_bytes() if path.exists() else b'')
+    return digest.hexdigest()[:12]
+
+
+def compile_morphology(resources_path) -> Dict[str, np.ndarray]:
+    """Compile les cinq ressources morphologiques en tableaux (automates et valeurs).
+
+    ``morpheme_boundaries.json`` fixe les bornes du découpage
+    (``max_prefixes``, ``max_suffixes``, ``min_stem_length``) et liste les
+    segmentations irrégulières : ``{"exceptions": {"token": ["pré-",
+    "radical", "-suf"]}}``, les affixes y étant marqués par leur tiret.
+    """
+    data = {name: load_resource(Path(resources_path) / relative, name)
+            for name, relative in MORPHOLOGY_RESOURCES.items()}
+    arrays = {'kind': np.array('morphology'), 'source_key': np.array(source_key(resources_path))}
+    arrays.update(AffixProcessor.compile(data['prefixes'], data['suffixes'],
+                                         data['inflection_rules']))
+    arrays.update(StemExtractor.compile(data['stems']))
+
+    boundaries = data['morpheme_boundaries'] or {}
+    arrays['limits'] = np.array([int(boundaries.get('max_prefixes', MAX_PREFIXES)),
+                                 int(boundaries.get('max_suffixes', MAX_SUFFIXES)),
+                                 int(boundaries.get('min_stem_length', MIN_STEM_LENGTH))],
+                                dtype=np.int32)
+    exceptions = {normalize_form(token): morphemes
+                  for token, morphemes in (boundaries.get('exceptions') or {}).items()}
+    forms = sorted(exceptions)
+    arrays.update({f'exception_{name}': value
+                   for name, value in Automaton.compile(forms).items()})
+    arrays['exception_segments'] = np.array(
+        [json.dumps(exceptions[form], ensure_ascii=False) for form in forms], dtype=str)
+    return arrays
+
+
+def load_morphology(resources_path, cache_dir=DEFAULT_CACHE_DIR) -> Dict[str, np.ndarray]:
+    """Tableaux compilés, relus du cache ou recompilés si les ressources ont changé.
+
+    L'artefact ``{cache_dir}/morphology/morphology_{empreinte}.npz`` évite
+    de relire et recompiler le JSON à chaque démarrage ; son nom porte
+    l'empreinte des ressources, si bien qu'une ressource modifiée produit
+    un nouvel artefact.
+    """
+    key = source_key(resources_path)
+    path = Path(cache_dir) / "morphology" / f"morphology_{key}.npz"
+    if path.exists():
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                return {name: npz[name] for name in npz.files}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable morphology artifact {path}, recompiling: {e}")
+
+    arrays = compile_morphology(resources_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        logger.info(f"Compiled morphology resources to {path}")
+    except OSError as e:
+        logger.warning(f"Could not write morphology artifact {path}: {e}")
+    return arrays
+
+
+class MorphologicalAnalyzer(BaseProcessor):
+    """Segmente les tokens en préfixes, radical et suffixes.
+
+    Les lexiques sont compilés en automates minimaux (voir ``Automaton``) :
+    les chaînes d'affixes se lisent depuis chaque bord du mot et chaque
+    radical candidat se vérifie en un parcours, sans relire le JSON.
+    L'analyse porte sur les types uniques d'un lot de tokens, mémoïsés
+    par ``TokenMemo`` sous une clé qui change avec les ressources.
+    """
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.memo = shared_memo(config)
+        self.resources_path = Path(config.data.linguistic_resources_path
+                                   if config is not None else DEFAULT_RESOURCES)
+        self.cache_dir = config.data.cache_dir if config is not None else DEFAULT_CACHE_DIR
+        self.reload()
+
+    def reload(self):
+        arrays = load_morphology(self.resources_path, self.cache_dir)
+        self.key = str(arrays['source_key'])
+        self.affixes = AffixProcessor(arrays)
+        self.stems = StemExtractor(arrays)
+        self.max_prefixes, self.max_suffixes, self.min_stem_length = arrays['limits'].tolist()
+        self.exceptions = Automaton.from_arrays(arrays, 'exception_')
+        self.exception_segments = arrays['exception_segments'].tolist()
+
+    def analyze(self, tokens: list, dialect: str) -> dict:
+        # Le mémo partage des segmentations immuables ; chaque occurrence
+        # reçoit son propre dictionnaire
+        types = tokens.types if isinstance(tokens, TokenSpans) else tokens
+        segments = self._segment_types(types)
+        if isinstance(tokens, TokenSpans):
+            segments = [segments[type_id] for type_id in tokens.ids]
+        return {'analyses': [self._as_dict(token, segment)
+                             for token, segment in zip(tokens, segments)]}
+
+    def analyze_batch(self, token_lists: List[list], dialects: List[str]) -> List[dict]:
+        """Analyse de plusieurs textes en un seul passage sur l'union de leurs types."""
+        types = {}
+        for tokens in token_lists:
+            types.update(dict.fromkeys(tokens.types if isinstance(tokens, TokenSpans) else tokens))
+        segmented = dict(zip(types, self._segment_types(list(types))))
+        return [{'analyses': [self._as_dict(token, segmented[token]) for token in tokens]}
+                for tokens in token_lists]
+
+    def _segment_types(self, types: list) -> list:
+        # Les lexiques ne dépendent pas du dialecte : une seule entrée par type
+        return self.memo.map(f'morphology:{self.key}', types, self.segment)
+
+    def analyze_token(self, token: str, dialect: str) -> dict:
+        return self._as_dict(token, self.segment(token, dialect))
+
+    def segment(self, token: str, dialect: str = None) -> tuple:
+        """Segmentation immuable.
+
+        (préfixes, radical, suffixes, catégorie, traits, gloses, radical connu),
+        les traits et les gloses étant des tuples de paires.
+        """
+        # Les morphèmes sont pris dans le token lui-même (casse et tons d'origine)
+        surface = unicodedata.normalize('NFC', token)
+        word = surface.lower()
+        exception = self.exceptions.index(word)
+        if exception is not None:
+            return self._exception(token, json.loads(self.exception_segments[exception]))
+        if len(word) != len(surface):
+            return ((), token, (), '', (), (), False)
+
+        start, prefixes, end, suffixes, stem = self.stems.extract(
+            word,
+            self.affixes.prefix_chains(word, self.max_prefixes),
+            self.affixes.suffix_chains(word, self.max_suffixes),
+            self.min_stem_length)
+        bounds = [0]
+        for i in prefixes:
+            bounds.append(bounds[-1] + len(self.affixes.forms['prefix'][i]))
+        suffix_bounds = [len(word)]
+        for i in reversed(suffixes):
+            suffix_bounds.insert(0, suffix_bounds[0] - len(self.affixes.forms['suffix'][i]))
+        return self._segment(tuple(surface[a:b] for a, b in zip(bounds, bounds[1:])),
+                             surface[start:end] if prefixes or suffixes else token,
+                             tuple(surface[a:b] for a, b in zip(suffix_bounds,
+                                                                suffix_bounds[1:])),
+                             prefixes, stem, suffixes)
+
+    def _exception(self, token: str, morphemes: list) -> tuple:
+        """Segmentation listée dans ``morpheme_boundaries.json``, analysée par les lexiques."""
+        prefixes = tuple(m.rstrip('-') for m in morphemes if m.endswith('-'))
+        suffixes = tuple(m.lstrip('-') for m in morphemes if m.startswith('-'))
+        stems = [m for m in morphemes if not m.startswith('-') and not m.endswith('-')]
+        stem = stems[0] if stems else token
+        # Un affixe absent des lexiques reste dans la segmentation, sans traits ni glose
+        prefix_ids = tuple(self.affixes.lookup('prefix', m) for m in prefixes)
+        suffix_ids = tuple(self.affixes.lookup('suffix', m) for m in suffixes)
+        return self._segment(prefixes, stem, suffixes,
+                             tuple(i for i in prefix_ids if i is not None),
+                             self.stems.lookup(normalize_form(stem)),
+                             tuple(i for i in suffix_ids if i is not None))
+
+    def _segment(self, prefix_forms: tuple, stem_form: str, suffix_forms: tuple,
+                 prefixes: tuple, stem, suffixes: tuple) -> tuple:
+        """Segmentation immuable à partir des formes et des rangs dans les lexiques."""
+        pos = self.stems.pos[stem] if stem is not None else ''
+        features = self.affixes.features('prefix', prefixes, pos)
+        features.update(self.affixes.features('suffix', suffixes, pos))
+        glosses = ([('prefix', self.affixes.glosses['prefix'][i]) for i in prefixes]
+                   + [('stem', self.stems.glosses[stem] if stem is not None else '')]
+                   + [('suffix', self.affixes.glosses['suffix'][i]) for i in suffixes])
+        return (prefix_forms, stem_form, suffix_forms, pos,
+                tuple(sorted(features.items())), tuple(glosses), stem is not None)
+
+    @staticmethod
+    def _as_dict(token: str, segment: tuple) -> dict:
+        prefixes, stem, suffixes, pos, features, glosses, known = segment
+        return {'token': token, 'prefixes': list(prefixes), 'stem': stem,
+                'suffixes': list(suffixes), 'pos': pos or None, 'features': dict(features),
+                'glosses': [{'type': kind, 'gloss': gloss} for kind, gloss in glosses if gloss],
+                'known': known}
@@ -0,0 +1,58 @@
+"""StemExtractor: radicaux connus et choix de la segmentation."""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .affix_processor import lexicon_entries
+from .automaton import Automaton
+
+
+class StemExtractor:
+    """Lexique des radicaux, compilé en automate minimal, et choix du radical.
+
+    Parmi les découpages possibles d'un mot (chaînes de préfixes et de
+    suffixes), un radical connu l'emporte, avec le moins d'affixes possible ;
+    sinon, le découpage qui retire le plus d'affixes en laissant au moins
+    ``min_stem_length`` caractères.
+    """
+
+    def __init__(self, arrays):
+        self.stems = Automaton.from_arrays(arrays, 'stem_')
+        self.forms = arrays['stem_forms'].tolist()
+        self.pos = arrays['stem_pos'].tolist()
+        self.glosses = arrays['stem_glosses'].tolist()
+
+    @staticmethod
+    def compile(stems) -> Dict[str, np.ndarray]:
+        entries = lexicon_entries(stems)
+        forms = sorted(entries)
+        arrays = {f'stem_{name}': value for name, value in Automaton.compile(forms).items()}
+        arrays['stem_forms'] = np.array(forms, dtype=str)
+        arrays['stem_pos'] = np.array([str(entries[f].get('pos', '')) for f in forms], dtype=str)
+        arrays['stem_glosses'] = np.array([str(entries[f].get('gloss', '')) for f in forms],
+                                          dtype=str)
+        return arrays
+
+    def lookup(self, word: str, start: int = 0, end: Optional[int] = None) -> Optional[int]:
+        """Rang du radical ``word[start:end]``, ou ``None`` s'il est inconnu."""
+        return self.stems.index(word, start, end)
+
+    def extract(self, word: str, prefix_chains, suffix_chains,
+                min_stem_length: int) -> Tuple[int, tuple, int, tuple, Optional[int]]:
+        """Meilleur découpage : (fin des préfixes, préfixes, début des suffixes, suffixes, radical)."""
+        best, best_key = (0, (), len(word), (), None), None
+        for start, prefixes in prefix_chains:
+            for end, suffixes in suffix_chains:
+                if end - start < 1:
+                    continue
+                stem = self.lookup(word, start, end)
+                affixes = len(prefixes) + len(suffixes)
+                if stem is not None:
+                    key = (2, -affixes, end - start)
+                elif end - start >= min_stem_length:
+                    key = (1, len(word) - (end - start), -affixes)
+                else:
+                    continue
+                if best_key is None or key > best_key:
+                    best, best_key = (start, prefixes, end, suffixes, stem), key
+        return best
@@ -0,0 +1,13 @@
+"""Normalization modules."""
+
+from .orthographic_normalizer import OrthographicNormalizer
+from .unicode_normalizer import UnicodeNormalizer
+from .tonal_normalizer import TonalNormalizer
+from .text_normalizer import TextNormalizer
+
+__all__ = [
+    "OrthographicNormalizer",
+    "UnicodeNormalizer",
+    "TonalNormalizer",
+    "TextNormalizer",
+]
@@ -0,0 +1,107 @@
+"""NormalizationPlan: règles de normalisation compilées en une seule passe."""
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def load_rules(path: str) -> dict:
+    """Lit la section 'normalization' d'un fichier YAML de règles."""
+    rules_file = Path(path)
+    if not rules_file.exists():
+        return {}
+    import yaml  # chargé à la première lecture de règles, pas à l'import du CLI
+    with open(rules_file, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    return data.get('normalization') or {}
+
+
+class NormalizationPlan:
+    """Applique minuscules, forme Unicode et remplacements en une passe.
+
+    Le plan est compilé en une seule fonction par token, sans étape
+    intermédiaire. Tous les remplacements s'appliquent en une passe, la
+    séquence la plus longue l'emportant : les séquences de plusieurs
+    caractères passent par une seule expression régulière, et les
+    caractères isolés sans conflit avec elles par ``str.translate``.
+    ``unicodedata.normalize`` vérifie d'abord (en C) si le token est déjà
+    dans la forme cible et le renvoie alors tel quel.
+    """
+
+    def __init__(self, lowercase: bool = False, unicode_form: str = None,
+                 replacements: dict = None):
+        self.lowercase = lowercase
+        self.unicode_form = unicode_form
+        self.replacements = dict(replacements or {})
+        self.apply = self._compile()
+
+    @property
+    def key(self) -> str:
+        """Empreinte des règles, pour distinguer les résultats de plans différents."""
+        payload = json.dumps([self.lowercase, self.unicode_form,
+                              sorted(self.replacements.items())], ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+    @classmethod
+    def from_rules(cls, *rule_sets: dict) -> 'NormalizationPlan':
+        """Fusionne plusieurs jeux de règles (les derniers l'emportent)."""
+        lowercase = False
+        unicode_form = None
+        replacements = {}
+        for rules in rule_sets:
+            lowercase = rules.get('lowercase', lowercase)
+            unicode_form = rules.get('unicode_form', unicode_form)
+            replacements.update(rules.get('replacements') or {})
+        return cls(lowercase, unicode_form, replacements)
+
+    def _compile(self):
+        normalize = unicodedata.normalize
+        lowercase = self.lowercase
+        form = self.unicode_form
+        sequences = {src: dst for src, dst in self.replacements.items()
+                     if len(src) > 1}
+        chars = {src: dst for src, dst in self.replacements.items()
+                 if len(src) == 1}
+        # Un caractère qui commence ou compose une séquence doit passer par
+        # l'expression régulière, sinon la séquence ne serait jamais vue
+        in_sequences = set(''.join(sequences))
+        table = {src: dst for src, dst in chars.items() if src not in in_sequences}
+        produced = set(''.join(sequences.values())) | set(''.join(
+            dst for src, dst in chars.items() if src in in_sequences))
+        if produced & set(table):
+            # translate réécrirait la sortie de l'expression régulière
+            table = {}
+        sequences.update({src: dst for src, dst in chars.items()
+                          if src not in table})
+        table = str.maketrans(table)
+        pattern = None
+        if sequences:
+            # Les séquences les plus longues sont essayées en premier
+            pattern = re.compile('|'.join(
+                re.escape(seq) for seq in sorted(sequences, key=len, reverse=True)))
+
+        if not table and pattern is None:
+            if lowercase and form:
+                return lambda token: normalize(form, token.lower())
+            if form:
+                return lambda token: normalize(form, token)
+            if lowercase:
+                return str.lower
+            return lambda token: token
+
+        def apply(token: str) -> str:
+            if lowercase:
+                token = token.lower()
+            if form:
+                token = normalize(form, token)
+            if pattern is not None:
+                token = pattern.sub(lambda m: sequences[m.group(0)], token)
+            if table:
+                token = token.translate(table)
+            return token
+
+        return apply
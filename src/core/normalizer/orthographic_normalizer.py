@@ -5,5 +5,8 @@ class OrthographicNormalizer(BaseProcessor):
     """Uniformise l'orthographe selon les standards."""
 
     def normalize(self, tokens: list, dialect: str) -> list:
+        return [self.normalize_token(tok, dialect) for tok in tokens]
+
+    def normalize_token(self, token: str, dialect: str) -> str:
         # Exemple trivial: tout en minuscules
-        return [tok.lower() for tok in tokens]
+        return token.lower()
@@ -1,18 +1,57 @@
 """TextNormalizer: normalisation de haut niveau."""
 from ..base_processor import BaseProcessor
-from .orthographic_normalizer import OrthographicNormalizer
-from .unicode_normalizer import UnicodeNormalizer
+from ..tokens import TokenSpans
+from ..token_memo import shared_memo
+from .normalization_plan import NormalizationPlan, load_rules
+
+PREPROCESS_RULES = "configs/preprocess.yaml"
+TONAL_RULES = "configs/tonal_rules.yaml"
+
+# Comportement historique: minuscules puis NFKC
+DEFAULT_RULES = {'lowercase': True, 'unicode_form': 'NFKC'}
+
+
+def normalization_plan() -> NormalizationPlan:
+    """Plan compilé des règles par défaut, orthographiques et tonales."""
+    return NormalizationPlan.from_rules(
+        DEFAULT_RULES, load_rules(PREPROCESS_RULES), load_rules(TONAL_RULES))
+
 
 class TextNormalizer(BaseProcessor):
     """Pipeline de normalisation du texte."""
 
     def __init__(self, config):
         super().__init__(config)
-        self.orthonorm = OrthographicNormalizer(config)
-        self.uninorm = UnicodeNormalizer(config)
+        self.memo = shared_memo(config)
+        self.plan = None
+        self.reload_rules()
+
+    def reload_rules(self):
+        """(Re)compile les règles orthographiques, Unicode et tonales en un plan.
+
+        Les entrées du mémo sont propres à un plan : celles de l'ancien plan
+        sont supprimées.
+        """
+        old_namespace = self.memo_namespace if self.plan is not None else None
+        self.plan = normalization_plan()
+        if old_namespace is not None and old_namespace != self.memo_namespace:
+            self.memo.clear(old_namespace)
+
+    @property
+    def memo_namespace(self) -> str:
+        return f"normalize:{self.plan.key}"
 
     def normalize(self, tokens: list, dialect: str) -> list:
-        # Applique normalisation orthographique puis Unicode
-        tokens = self.orthonorm.normalize(tokens, dialect)
-        tokens = self.uninorm.normalize(tokens, dialect)
-        return tokens
+        # Chaque type de token n'est normalisé qu'une fois (mémo partagé)
+        if isinstance(tokens, TokenSpans):
+            # Seuls les types sont normalisés ; les positions sont partagées
+            return tokens.with_types(self.memo.map(
+                self.memo_namespace, tokens.types, self.plan.apply, dialect))
+        return self.memo.map(self.memo_namespace, tokens, self.plan.apply, dialect)
+
+    def normalize_token(self, token: str, dialect: str) -> str:
+        return self.plan.apply(token)
+
+    def normalize_batch(self, token_lists: list, dialects: list) -> list:
+        return [self.normalize(tokens, dialect)
+                for tokens, dialect in zip(token_lists, dialects)]
@@ -1,13 +1,15 @@
 """TonalNormalizer: normalisation spécifique aux tons."""
 from ..base_processor import BaseProcessor
+from .normalization_plan import NormalizationPlan, load_rules
+from .text_normalizer import TONAL_RULES
 
 class TonalNormalizer(BaseProcessor):
     """Nettoie et unifie les annotations tonales."""
 
+    def __init__(self, config=None):
+        super().__init__(config)
+        # Retire/unifie les diacritiques selon configs/tonal_rules.yaml
+        self.plan = NormalizationPlan.from_rules(load_rules(TONAL_RULES))
+
     def normalize(self, tokens: list, dialect: str) -> list:
-        # Exemple: retirer diacritiques redondants
-        normalized = []
-        for tok in tokens:
-            # TODO: utiliser self.config.models.tone_rules
-            normalized.append(tok)
-        return normalized
+        return [self.plan.apply(tok) for tok in tokens]
@@ -6,4 +6,7 @@ class UnicodeNormalizer(BaseProcessor):
     """Normalisation Unicode NFKC."""
 
     def normalize(self, tokens: list, dialect: str) -> list:
-        return [unicodedata.normalize('NFKC', tok) for tok in tokens]
+        return [self.normalize_token(tok, dialect) for tok in tokens]
+
+    def normalize_token(self, token: str, dialect: str) -> str:
+        return unicodedata.normalize('NFKC', token)
@@ -0,0 +1,86 @@
+"""Multi-process execution of the LexLang pipeline over large corpora."""
+
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..config import LexLangConfig
+from ..exceptions import ProcessingError
+
+logger = logging.getLogger(__name__)
+
+# Pipeline owned by the current worker process, built once by _init_worker.
+_worker_pipeline = None
+
+
+def _init_worker(config: LexLangConfig,
+                 model_versions: Optional[Dict[str, str]] = None,
+                 profile: Optional[str] = None):
+    global _worker_pipeline
+    from .pipeline import Pipeline
+    _worker_pipeline = Pipeline(config, profile=profile, model_versions=model_versions)
+
+
+def _process_chunk(texts: List[str], offset: int, dialect: str,
+                   tasks: List[str], output_format: str) -> list:
+    return _worker_pipeline.process_chunk(texts, offset, dialect, tasks,
+                                           output_format)
+
+
+def parallel_stream(config: LexLangConfig,
+                    texts: Iterable[str],
+                    dialect: str,
+                    tasks: List[str],
+                    output_format: str,
+                    num_workers: int,
+                    model_versions: Optional[Dict[str, str]] = None,
+                    profile: Optional[str] = None) -> Iterator[Union[str, Dict[str, Any]]]:
+    """
+    Process texts on a pool of worker processes, yielding results lazily.
+
+    Each worker builds its own pipeline once, with the caller's
+    ``profile`` and pinned ``model_versions``, and receives chunks of
+    ``processing.batch_size`` texts. At most ``2 * num_workers`` chunks are
+    in flight, so memory stays bounded for unbounded inputs. Results are
+    yielded in input order, with the same per-item error results as
+    ``Pipeline.batch_process``.
+    """
+    batch_size = max(1, config.processing.batch_size)
+    texts = iter(texts)
+    pending = deque()
+    offset = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_init_worker,
+                                 initargs=(config, model_versions, profile)) as pool:
+            while True:
+                chunk = list(islice(texts, batch_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_process_chunk, chunk, offset,
+                                           dialect, tasks, output_format))
+                offset += len(chunk)
+                if len(pending) >= 2 * num_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+    except BrokenProcessPool as e:
+        logger.error(f"Worker process pool failed: {e}")
+        raise ProcessingError(f"Parallel processing failed: {e}")
+
+
+def parallel_batch_process(config: LexLangConfig,
+                           texts: List[str],
+                           dialect: str,
+                           tasks: List[str],
+                           output_format: str,
+                           num_workers: int,
+                           model_versions: Optional[Dict[str, str]] = None,
+                           profile: Optional[str] = None) -> List[Union[str, Dict[str, Any]]]:
+    """Process a list of texts on worker processes, see ``parallel_stream``."""
+    return list(parallel_stream(config, texts, dialect, tasks, output_format,
+                                num_workers, model_versions, profile))
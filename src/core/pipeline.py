@@ -2,85 +2,162 @@
 
 import logging
 import json
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from ..config import LexLangConfig
 from ..exceptions import ProcessingError, ConfigurationError
 from ..utils import timing_decorator, Timer
-from .tokenizer import EweTokenizer, DialectAwareTokenizer
-from .normalizer import TextNormalizer, TonalNormalizer
-from .pos_tagger import POSTagger
-from .tonal_processor import TonalProcessor
-from .dialect_handler import DialectDetector
-from .morphology import MorphologicalAnalyzer
-from .embeddings import WordEmbeddings
+from .tokenizer.dialect_aware_tokenizer import SUPPORTED_DIALECTS
+from .processors import LazyProcessors, TASK_PROCESSORS
+from .token_memo import shared_memo
+from .model_registry import model_registry
+from .scheduler import Stage, StageGraph
+from .cache import ResultCache, model_fingerprint
+from .tokens import TokenSpans, TokenTags
+from .serializers import as_builtin, get_serializer
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TASKS = ["tokenize", "normalize", "pos"]
+
+# Formats whose per-sentence outputs can be concatenated into one document
+STREAM_FORMATS = ("jsonl", "conllu", "text")
+
+# Task name -> (artifact / result key, processing step name)
+TASK_ARTIFACTS = {
+    "tokenize": ("tokens", "tokenization"),
+    "normalize": ("normalized_tokens", "normalization"),
+    "pos": ("pos_tags", "pos_tagging"),
+    "tone": ("tonal_analysis", "tonal_processing"),
+    "morphology": ("morphological_analysis", "morphology"),
+    "dialect": ("dialect_analysis", "dialect_analysis"),
+    "embeddings": ("embeddings", "embeddings"),
+}
+
 
 class Pipeline:
     """Main processing pipeline for Ewe language text."""
     
-    def __init__(self, config: LexLangConfig):
-        """Initialize pipeline with configuration."""
+    def __init__(self, config: LexLangConfig, profile: Optional[str] = None,
+                 model_versions: Optional[Dict[str, str]] = None):
+        """
+        Initialize pipeline with configuration.
+        
+        Processors are built on first use. ``profile`` (default
+        ``processing.profile``) selects which of them may be loaded: 'light'
+        for tokenization and normalization only, 'full' for every task.
+        ``model_versions`` pins processors to registered model versions
+        (the registry's active version otherwise).
+        """
         self.config = config
-        self._processors = {}
-        self._initialize_processors()
-        logger.info("Pipeline initialized successfully")
+        self.profile = profile or config.processing.profile
+        self._processors = LazyProcessors(config, self.profile, model_versions)
+        self._executor = None
+        self._stage_graph = self._build_stage_graph()
+        self._cache = (ResultCache.from_config(config, self._model_fingerprint())
+                       if config.processing.enable_caching else None)
+        if config.processing.preload:
+            self._processors.preload()
+        logger.info(f"Pipeline initialized ({self.profile} profile)")
     
-    def _initialize_processors(self):
-        """Initialize all processors."""
-        try:
-            # Tokenizer
-            self._processors['tokenizer'] = EweTokenizer(
-                dialect_aware=True,
-                config=self.config
-            )
-            
-            # Normalizer
-            self._processors['normalizer'] = TextNormalizer(
-                config=self.config
-            )
-            
-            # POS Tagger
-            self._processors['pos_tagger'] = POSTagger(
-                model_path=self.config.models.pos_model_path,
-                config=self.config
-            )
-            
-            # Tonal Processor
-            self._processors['tonal_processor'] = TonalProcessor(
-                config=self.config
-            )
-            
-            # Dialect Detector
-            self._processors['dialect_detector'] = DialectDetector(
-                model_path=self.config.models.dialect_model_path,
-                config=self.config
-            )
-            
-            # Morphological Analyzer
-            self._processors['morphology'] = MorphologicalAnalyzer(
-                config=self.config
-            )
-            
-            # Word Embeddings
-            self._processors['embeddings'] = WordEmbeddings(
-                model_path=self.config.models.embedding_model_path,
-                config=self.config
+    def preload(self):
+        """Build every processor of the profile now, e.g. before serving traffic."""
+        self._processors.preload()
+    
+    def reload_model(self, processor_name: str,
+                     version: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Load ``processor_name`` again (at model ``version`` if given) and
+        swap it in without interrupting requests in progress.
+        
+        The new processor is built and warmed up first; requests already
+        running finish on the old one. Cached results of the old model are
+        no longer served.
+        """
+        previous = self._processors.reload(processor_name, version)
+        self._refresh_cache_fingerprint()
+        return {"processor": processor_name, "version": version,
+                "previous_version": previous}
+    
+    def rollback_model(self, processor_name: str) -> Dict[str, Optional[str]]:
+        """Swap back the processor replaced by the last ``reload_model``."""
+        version = self._processors.rollback(processor_name)
+        self._refresh_cache_fingerprint()
+        return {"processor": processor_name, "version": version}
+    
+    def get_model_versions(self) -> Dict[str, str]:
+        """Model versions pinned by ``reload_model`` / ``rollback_model``."""
+        return self._processors.versions()
+    
+    def _model_fingerprint(self) -> str:
+        return model_fingerprint(self.config, self._processors.model_paths())
+    
+    def _refresh_cache_fingerprint(self):
+        if self._cache is not None:
+            self._cache.fingerprint = self._model_fingerprint()
+    
+    def _build_stage_graph(self) -> StageGraph:
+        """Declare pipeline stages by the artifacts they consume and produce."""
+        p = self._processors
+        return StageGraph([
+            # Processors are looked up on every call: they are built lazily
+            # and can be replaced while the pipeline runs
+            Stage("dialect_detection", ("text", "location"), "dialect",
+                  lambda text, location: p['dialect_detector'].detect(text, location),
+                  run_batch=lambda texts, locations:
+                      p['dialect_detector'].detect_batch(texts, locations)),
+            Stage("tokenization", ("text", "dialect"), "tokens",
+                  lambda text, dialect: p['tokenizer'].tokenize_spans(text, dialect=dialect),
+                  run_batch=lambda texts, dialects:
+                      p['tokenizer'].tokenize_spans_batch(texts, dialects)),
+            Stage("normalization", ("tokens", "dialect"), "normalized_tokens",
+                  lambda tokens, dialect: p['normalizer'].normalize(tokens, dialect=dialect),
+                  run_batch=lambda token_lists, dialects:
+                      p['normalizer'].normalize_batch(token_lists, dialects)),
+            Stage("pos_tagging", ("analysis_tokens", "dialect"), "pos_tags",
+                  lambda tokens, dialect: p['pos_tagger'].tag(tokens, dialect=dialect),
+                  run_batch=lambda token_lists, dialects:
+                      p['pos_tagger'].tag_batch(token_lists, dialects)),
+            Stage("tonal_processing", ("analysis_tokens", "dialect"), "tonal_analysis",
+                  lambda tokens, dialect: p['tonal_processor'].analyze(tokens, dialect=dialect)),
+            Stage("morphology", ("analysis_tokens", "dialect"), "morphological_analysis",
+                  lambda tokens, dialect: p['morphology'].analyze(tokens, dialect=dialect),
+                  run_batch=lambda token_lists, dialects:
+                      p['morphology'].analyze_batch(token_lists, dialects)),
+            Stage("dialect_analysis", ("text", "location"), "dialect_analysis",
+                  lambda text, location:
+                      p['dialect_detector'].analyze(text, detailed=True, location=location)),
+            Stage("embeddings", ("analysis_tokens",), "embeddings",
+                  lambda tokens: p['embeddings'].get_matrix_batch([tokens])[0],
+                  run_batch=lambda token_lists:
+                      p['embeddings'].get_matrix_batch(token_lists)),
+        ])
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool used to run independent stages concurrently."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self.config.processing.stage_threads),
+                thread_name_prefix="lexlang-stage"
             )
-            
-        except Exception as e:
-            logger.error(f"Error initializing processors: {e}")
-            raise ConfigurationError(f"Failed to initialize pipeline: {e}")
+        return self._executor
+    
+    def close(self):
+        """Release the stage executor."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     @timing_decorator
     def process(self, 
                 text: str,
                 dialect: str = "auto",
                 tasks: List[str] = None,
-                output_format: str = "json") -> Union[str, Dict[str, Any]]:
+                output_format: str = "json",
+                location: Optional[Dict[str, Any]] = None) -> Union[str, bytes, Dict[str, Any]]:
         """
         Process text through the pipeline.
         
@@ -88,124 +165,50 @@ class Pipeline:
             text: Input text to process
             dialect: Target dialect ('auto', 'anlo', 'inland', 'ho', 'kpando')
             tasks: List of tasks to perform
-            output_format: Output format ('json', 'text', 'conllu')
+            output_format: Output format ('json', 'jsonl', 'text', 'conllu',
+                'msgpack', 'npz', 'arrow'), or 'dict' for the structured results
+            location: Where the text comes from, ``{"lat", "lon"}`` and/or
+                ``{"region"}``; its dialect distribution is used as a prior
+                when the dialect is detected
         
         Returns:
             Processed results in specified format
         """
         if not text or not text.strip():
             raise ProcessingError("Input text is empty")
+        self._check_dialect(dialect)
         
         if tasks is None:
-            tasks = ["tokenize", "normalize", "pos"]
-        
-        results = {
-            "input_text": text,
-            "dialect": dialect,
-            "tasks": tasks,
-            "timestamp": datetime.utcnow().isoformat(),
-            "processing_steps": {}
-        }
+            tasks = DEFAULT_TASKS
+        # Checked before the cache, which may hold results of other profiles
+        try:
+            self._processors.check_tasks(tasks)
+        except ConfigurationError as e:
+            raise ProcessingError(f"Processing failed: {e}")
         
         try:
-            with Timer("Full pipeline processing"):
-                # Step 1: Dialect detection (if auto)
-                if dialect == "auto":
-                    detected_dialect = self._processors['dialect_detector'].detect(text)
-                    results["dialect_detected"] = detected_dialect
-                    dialect = detected_dialect
-                
-                results["final_dialect"] = dialect
-                
-                # Step 2: Tokenization
-                if "tokenize" in tasks:
-                    tokens = self._processors['tokenizer'].tokenize(
-                        text, dialect=dialect
-                    )
-                    results["tokens"] = tokens
-                    results["processing_steps"]["tokenization"] = "completed"
-                    logger.debug(f"Tokenized into {len(tokens)} tokens")
-                
-                # Step 3: Normalization
-                if "normalize" in tasks:
-                    if "tokens" not in results:
-                        tokens = self._processors['tokenizer'].tokenize(
-                            text, dialect=dialect
-                        )
-                    
-                    normalized_tokens = self._processors['normalizer'].normalize(
-                        tokens, dialect=dialect
-                    )
-                    results["normalized_tokens"] = normalized_tokens
-                    results["processing_steps"]["normalization"] = "completed"
-                
-                # Step 4: POS Tagging
-                if "pos" in tasks:
-                    input_tokens = results.get("normalized_tokens", 
-                                             results.get("tokens", []))
-                    if not input_tokens:
-                        input_tokens = self._processors['tokenizer'].tokenize(
-                            text, dialect=dialect
-                        )
-                    
-                    pos_tags = self._processors['pos_tagger'].tag(
-                        input_tokens, dialect=dialect
-                    )
-                    results["pos_tags"] = pos_tags
-                    results["processing_steps"]["pos_tagging"] = "completed"
-                
-                # Step 5: Tonal Processing
-                if "tone" in tasks:
-                    input_tokens = results.get("normalized_tokens",
-                                             results.get("tokens", []))
-                    if not input_tokens:
-                        input_tokens = self._processors['tokenizer'].tokenize(
-                            text, dialect=dialect
-                        )
-                    
-                    tonal_analysis = self._processors['tonal_processor'].analyze(
-                        input_tokens, dialect=dialect
-                    )
-                    results["tonal_analysis"] = tonal_analysis
-                    results["processing_steps"]["tonal_processing"] = "completed"
-                
-                # Step 6: Morphological Analysis
-                if "morphology" in tasks:
-                    input_tokens = results.get("normalized_tokens",
-                                             results.get("tokens", []))
-                    if not input_tokens:
-                        input_tokens = self._processors['tokenizer'].tokenize(
-                            text, dialect=dialect
-                        )
-                    
-                    morphology = self._processors['morphology'].analyze(
-                        input_tokens, dialect=dialect
-                    )
-                    results["morphological_analysis"] = morphology
-                    results["processing_steps"]["morphology"] = "completed"
-                
-                # Step 7: Dialect Analysis (detailed)
-                if "dialect" in tasks:
-                    dialect_info = self._processors['dialect_detector'].analyze(
-                        text, detailed=True
-                    )
-                    results["dialect_analysis"] = dialect_info
-                    results["processing_steps"]["dialect_analysis"] = "completed"
-                
-                # Step 8: Word Embeddings
-                if "embeddings" in tasks:
-                    input_tokens = results.get("normalized_tokens",
-                                             results.get("tokens", []))
-                    if not input_tokens:
-                        input_tokens = self._processors['tokenizer'].tokenize(
-                            text, dialect=dialect
-                        )
-                    
-                    embeddings = self._processors['embeddings'].get_embeddings(
-                        input_tokens
+            cache_key = None
+            results = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(text, dialect, tasks, location)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    results = dict(cached,
+                                   input_text=text,
+                                   tasks=tasks,
+                                   timestamp=datetime.utcnow().isoformat())
+            
+            if results is None:
+                with Timer("Full pipeline processing"):
+                    targets, aliases = self._plan_tasks(tasks)
+                    artifacts = self._initial_artifacts(text, dialect, location)
+                    self._stage_graph.execute(
+                        targets, artifacts, aliases=aliases,
+                        executor=self._get_executor()
                     )
-                    results["embeddings"] = embeddings
-                    results["processing_steps"]["embeddings"] = "completed"
+                    results = self._collect_results(text, dialect, tasks, artifacts)
+                if cache_key is not None:
+                    self._cache.put(cache_key, as_builtin(results))
             
             # Format output
             return self._format_output(results, output_format)
@@ -214,121 +217,320 @@ class Pipeline:
             logger.error(f"Pipeline processing error: {e}")
             raise ProcessingError(f"Processing failed: {e}")
     
+    @staticmethod
+    def _check_dialect(dialect: str):
+        if dialect != "auto" and dialect not in SUPPORTED_DIALECTS:
+            raise ProcessingError(f"Unsupported dialect: {dialect!r}")
+    
+    def _plan_tasks(self, tasks: List[str]):
+        """Map requested tasks to target artifacts and input aliases."""
+        self._processors.check_tasks(tasks)
+        # Downstream stages consume normalized tokens when normalization
+        # was requested, raw tokens otherwise.
+        aliases = {
+            "analysis_tokens": ("normalized_tokens" if "normalize" in tasks
+                                else "tokens")
+        }
+        targets = ["dialect"] + [TASK_ARTIFACTS[task][0] for task in tasks
+                                 if task in TASK_ARTIFACTS]
+        if "offsets" in tasks:
+            targets.append("tokens")
+        return targets, aliases
+    
+    @staticmethod
+    def _initial_artifacts(text: str, dialect: str,
+                           location: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        artifacts = {"text": text, "location": location}
+        if dialect != "auto":
+            artifacts["dialect"] = dialect
+        return artifacts
+    
+    @staticmethod
+    def _collect_results(text: str, dialect: str, tasks: List[str],
+                         artifacts: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result dictionary from computed artifacts."""
+        results = {
+            "input_text": text,
+            "dialect": dialect,
+            "tasks": tasks,
+            "timestamp": datetime.utcnow().isoformat(),
+            "processing_steps": {}
+        }
+        if dialect == "auto":
+            results["dialect_detected"] = artifacts["dialect"]
+        results["final_dialect"] = artifacts["dialect"]
+        
+        for task in tasks:
+            if task in TASK_ARTIFACTS:
+                artifact, step = TASK_ARTIFACTS[task]
+                value = artifacts[artifact]
+                # Stages pass compact spans and tag IDs to each other; plain
+                # lists are only built here, for the output
+                if isinstance(value, (TokenSpans, TokenTags)):
+                    value = list(value)
+                results[artifact] = value
+                results["processing_steps"][step] = "completed"
+        
+        tokens = artifacts.get("tokens")
+        if "offsets" in tasks and isinstance(tokens, TokenSpans):
+            results["token_offsets"] = tokens.offsets()
+            results["space_after"] = [tokens.space_after(i)
+                                      for i in range(len(tokens))]
+        return results
+    
     def _format_output(self, results: Dict[str, Any], 
-                      output_format: str) -> Union[str, Dict[str, Any]]:
+                      output_format: str) -> Union[str, bytes, Dict[str, Any]]:
         """Format results according to specified output format."""
+        if output_format == "dict":
+            return as_builtin(results)
+        
+        serializer = get_serializer(output_format)
+        if not serializer.columnar:
+            results = as_builtin(results)
         try:
-            if output_format == "json":
-                return json.dumps(results, ensure_ascii=False, indent=2)
-            
-            elif output_format == "text":
-                return self._format_text_output(results)
-            
-            elif output_format == "conllu":
-                return self._format_conllu_output(results)
-            
-            else:
-                raise ProcessingError(f"Unsupported output format: {output_format}")
-                
+            return serializer.dumps(results)
         except Exception as e:
             logger.error(f"Output formatting error: {e}")
             raise ProcessingError(f"Failed to format output: {e}")
     
-    def _format_text_output(self, results: Dict[str, Any]) -> str:
-        """Format results as readable text."""
-        output_lines = []
-        output_lines.append(f"Input: {results['input_text']}")
-        output_lines.append(f"Dialect: {results.get('final_dialect', 'unknown')}")
-        output_lines.append("")
+    def batch_process(self, 
+                     texts: List[str],
+                     dialect: str = "auto",
+                     tasks: List[str] = None,
+                     output_format: str = "json",
+                     num_workers: Optional[int] = None) -> List[Union[str, Dict[str, Any]]]:
+        """
+        Process multiple texts in batch.
+        
+        Texts are processed in chunks of ``processing.batch_size``: every
+        stage is called once per chunk with all of its documents. If a chunk
+        fails, its texts are reprocessed one by one so that an error only
+        affects the result of the text that caused it.
         
-        if "tokens" in results:
-            output_lines.append("Tokens:")
-            output_lines.append(" ".join(results["tokens"]))
-            output_lines.append("")
+        ``num_workers`` defaults to ``processing.num_workers``. With more
+        than 1, chunks are distributed over a pool of worker processes, each holding its own pipeline with this
+        pipeline's profile and pinned model versions.
+        """
+        if tasks is None:
+            tasks = DEFAULT_TASKS
+        if num_workers is None:
+            num_workers = self.config.processing.num_workers
         
-        if "pos_tags" in results:
-            output_lines.append("POS Tags:")
-            for token, pos in results["pos_tags"]:
-                output_lines.append(f"  {token}\t{pos}")
-            output_lines.append("")
+        if num_workers > 1 and len(texts) > 1:
+            from .parallel import parallel_batch_process
+            with Timer(f"Parallel batch processing of {len(texts)} texts "
+                       f"on {num_workers} workers"):
+                return parallel_batch_process(
+                    self.config, texts, dialect, tasks, output_format,
+                    num_workers, self.get_model_versions(), self.profile
+                )
+        
+        batch_size = max(1, self.config.processing.batch_size)
+        results = []
         
-        if "tonal_analysis" in results:
-            output_lines.append("Tonal Analysis:")
-            for key, value in results["tonal_analysis"].items():
-                output_lines.append(f"  {key}: {value}")
-            output_lines.append("")
+        with Timer(f"Batch processing of {len(texts)} texts"):
+            for offset in range(0, len(texts), batch_size):
+                chunk = texts[offset:offset + batch_size]
+                results.extend(self.process_chunk(
+                    chunk, offset, dialect, tasks, output_format
+                ))
         
-        return "\n".join(output_lines)
+        return results
     
-    def _format_conllu_output(self, results: Dict[str, Any]) -> str:
-        """Format results in CoNLL-U format."""
-        output_lines = []
-        output_lines.append(f"# text = {results['input_text']}")
-        output_lines.append(f"# dialect = {results.get('final_dialect', 'unknown')}")
+    def stream(self,
+               texts: Iterable[str],
+               dialect: str = "auto",
+               tasks: List[str] = None,
+               output_format: str = "jsonl",
+               num_workers: Optional[int] = None) -> Iterator[Union[str, Dict[str, Any]]]:
+        """
+        Process an unbounded stream of text, yielding one result per sentence.
         
-        tokens = results.get("tokens", [])
-        pos_tags = dict(results.get("pos_tags", []))
+        ``texts`` can be any iterable of text fragments, such as an open file.
+        Fragments are split lazily into sentences, which are processed in
+        chunks of ``processing.batch_size``, so memory use does not grow with
+        the size of the input. Only ``STREAM_FORMATS`` are accepted, since
+        one result per line must still form a valid document.
+        ``num_workers`` is handled as in ``batch_process``.
+        """
+        if output_format not in STREAM_FORMATS:
+            raise ProcessingError(
+                f"Output format '{output_format}' cannot be streamed, "
+                f"use one of {', '.join(STREAM_FORMATS)}"
+            )
+        if tasks is None:
+            tasks = DEFAULT_TASKS
+        
+        sentences = self._processors['tokenizer'].sentence_tokenizer.iter_sentences(
+            texts, dialect
+        )
         
-        for i, token in enumerate(tokens, 1):
-            pos = pos_tags.get(token, "_")
-            line = f"{i}\t{token}\t_\t{pos}\t_\t_\t_\t_\t_\t_"
-            output_lines.append(line)
+        if num_workers is None:
+            num_workers = self.config.processing.num_workers
+        if num_workers > 1:
+            from .parallel import parallel_stream
+            yield from parallel_stream(self.config, sentences, dialect, tasks,
+                                       output_format, num_workers,
+                                       self.get_model_versions(), self.profile)
+            return
         
-        output_lines.append("")
-        return "\n".join(output_lines)
+        batch_size = max(1, self.config.processing.batch_size)
+        offset = 0
+        while True:
+            chunk = list(islice(sentences, batch_size))
+            if not chunk:
+                break
+            yield from self.process_chunk(chunk, offset, dialect, tasks,
+                                           output_format)
+            offset += len(chunk)
     
-    def batch_process(self, 
+    def process_many(self,
                      texts: List[str],
                      dialect: str = "auto",
                      tasks: List[str] = None,
-                     output_format: str = "json") -> List[Union[str, Dict[str, Any]]]:
-        """Process multiple texts in batch."""
-        results = []
+                     output_format: str = "json") -> list:
+        """
+        Process independent texts together through the batched stages.
+        
+        Returns one entry per text, in order. Unlike ``batch_process``, a text
+        that fails yields its ``ProcessingError`` in place of a result, so
+        callers serving separate requests can report each failure to its
+        owner. Cached results are reused and new results are cached.
+        """
+        if tasks is None:
+            tasks = DEFAULT_TASKS
+        try:
+            self._check_dialect(dialect)
+            self._processors.check_tasks(tasks)
+        except ConfigurationError as e:
+            return [ProcessingError(f"Processing failed: {e}")] * len(texts)
+        except ProcessingError as e:
+            return [e] * len(texts)
         
+        results: list = [None] * len(texts)
+        pending = []
         for i, text in enumerate(texts):
-            try:
-                result = self.process(
-                    text=text,
-                    dialect=dialect,
-                    tasks=tasks,
-                    output_format=output_format
-                )
-                results.append(result)
-                logger.debug(f"Processed batch item {i+1}/{len(texts)}")
-                
-            except Exception as e:
-                logger.error(f"Error processing batch item {i+1}: {e}")
-                # Add error result
-                error_result = {
-                    "error": str(e),
-                    "input_text": text,
-                    "batch_index": i
-                }
-                if output_format == "json":
-                    results.append(json.dumps(error_result))
-                else:
-                    results.append(f"Error: {e}")
+            if not text or not text.strip():
+                results[i] = ProcessingError("Input text is empty")
+                continue
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(text, dialect, tasks)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    results[i] = self._format_item(
+                        dict(cached, input_text=text, tasks=tasks,
+                             timestamp=datetime.utcnow().isoformat()),
+                        output_format)
+                    continue
+            pending.append((i, cache_key))
+        
+        if not pending:
+            return results
         
+        try:
+            targets, aliases = self._plan_tasks(tasks)
+            batch = [self._initial_artifacts(texts[i], dialect) for i, _ in pending]
+            self._stage_graph.execute_batch(targets, batch, aliases=aliases)
+        except Exception as e:
+            logger.warning(f"Batch of {len(pending)} texts failed ({e}), "
+                           f"falling back to per-item processing")
+            for i, _ in pending:
+                try:
+                    results[i] = self.process(
+                        text=texts[i],
+                        dialect=dialect,
+                        tasks=tasks,
+                        output_format=output_format
+                    )
+                except Exception as item_error:
+                    results[i] = (item_error if isinstance(item_error, ProcessingError)
+                                  else ProcessingError(f"Processing failed: {item_error}"))
+            return results
+        
+        for (i, cache_key), artifacts in zip(pending, batch):
+            item = self._collect_results(texts[i], dialect, tasks, artifacts)
+            if cache_key is not None:
+                self._cache.put(cache_key, as_builtin(item))
+            results[i] = self._format_item(item, output_format)
         return results
     
+    def _format_item(self, results: Dict[str, Any], output_format: str):
+        """``_format_output`` returning the error instead of raising it."""
+        try:
+            return self._format_output(results, output_format)
+        except ProcessingError as e:
+            return e
+    
+    def process_chunk(self, texts: List[str], offset: int, dialect: str,
+                      tasks: List[str], output_format: str) -> list:
+        """
+        Run one chunk of texts through the batched stages.
+        
+        Failed texts get an error result whose ``batch_index`` is counted
+        from ``offset``, the position of the chunk in the whole input.
+        """
+        results = self.process_many(texts, dialect, tasks, output_format)
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing batch item {offset + i + 1}: {result}")
+                results[i] = self._error_result(result, texts[i], offset + i,
+                                                output_format)
+        
+        logger.debug(f"Processed batch items {offset + 1}-{offset + len(texts)}")
+        return results
+    
+    @staticmethod
+    def _error_result(error: Exception, text: str, index: int,
+                      output_format: str) -> Union[str, Dict[str, Any]]:
+        error_result = {
+            "error": str(error),
+            "input_text": text,
+            "batch_index": index
+        }
+        if output_format == "dict":
+            return error_result
+        if output_format in ("json", "jsonl"):
+            return json.dumps(error_result)
+        return f"Error: {error}"
+    
     def get_available_tasks(self) -> List[str]:
-        """Get list of available processing tasks."""
-        return [
+        """Get list of processing tasks available in this pipeline's profile."""
+        tasks = [
             "tokenize",
             "normalize", 
             "pos",
             "tone",
             "morphology",
             "dialect",
-            "embeddings"
+            "embeddings",
+            "offsets"
         ]
+        return [task for task in tasks
+                if all(name in self._processors for name in TASK_PROCESSORS[task])]
     
     def get_supported_dialects(self) -> List[str]:
         """Get list of supported dialects."""
-        return ["auto", "anlo", "inland", "ho", "kpando"]
+        return ["auto", *SUPPORTED_DIALECTS]
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get result cache statistics, or None if caching is disabled."""
+        return self._cache.stats() if self._cache is not None else None
+    
+    def get_token_memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-token memo statistics for each analysis namespace."""
+        return shared_memo(self.config).stats()
     
     def get_processor(self, processor_name: str):
-        """Get specific processor instance."""
+        """Get specific processor instance, building it if needed."""
         if processor_name not in self._processors:
             raise ProcessingError(f"Unknown processor: {processor_name}")
         return self._processors[processor_name]
+    
+    def get_loaded_processors(self) -> List[str]:
+        """Names of the processors built so far."""
+        return list(self._processors.loaded())
+    
+    def get_models(self) -> Dict[str, Dict[str, Any]]:
+        """Registered models with their active version and availability."""
+        return model_registry(self.config).describe()
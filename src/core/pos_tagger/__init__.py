@@ -0,0 +1,7 @@
+"""Part-of-speech tagging modules."""
+
+from .hmm_tagger import HMMTagger
+from .crf_tagger import CRFTagger
+from .pos_tagger import POSTagger
+
+__all__ = ["HMMTagger", "CRFTagger", "POSTagger"]
@@ -1,9 +1,327 @@
-"""CRFTagger: étiquetage POS par CRF."""
+"""CRFTagger: étiquetage POS par CRF linéaire à index de traits entiers."""
+import logging
+import os
+import threading
+import unicodedata
+
+import numpy as np
+
+from ...exceptions import ModelLoadError
 from ..base_processor import BaseProcessor
+from ..tokens import TokenSpans
+from .viterbi import length_batches, viterbi
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAG = 'VERB'
+BOS, EOS = '<s>', '</s>'
+TYPE_CACHE_SIZE = 100000
+
+# Diacritiques combinants des tons (après décomposition NFD)
+TONE_MARKS = {'\u0301': 'H', '\u0300': 'L', '\u0302': 'F', '\u030c': 'R', '\u0304': 'M'}
+NASAL_MARK = '\u0303'
+
+
+def type_features(token: str) -> list:
+    """Traits ne dépendant que du token : affixes, tons, nasalité, forme.
+
+    Calculés une fois par type ; les traits de contexte (voisins, dialecte)
+    sont des tables indexées à part.
+    """
+    word = token.lower()
+    decomposed = unicodedata.normalize('NFD', word)
+    base = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    tones = ''.join(TONE_MARKS[c] for c in decomposed if c in TONE_MARKS)
+    if token[:1].isupper():
+        shape = 'X'
+    elif token.isdigit():
+        shape = 'd'
+    elif not any(c.isalnum() for c in token):
+        shape = 'p'
+    else:
+        shape = 'x'
+    features = ['bias', f'w={word}', f'tone={tones}', f'shape={shape}',
+                f'len={min(len(base), 6)}']
+    for size in range(1, 4):
+        if len(base) >= size:
+            features.append(f'p{size}={base[:size]}')
+            features.append(f's{size}={base[-size:]}')
+    if NASAL_MARK in decomposed:
+        features.append('nasal')
+    return features
+
+
+class FeatureIndex:
+    """Noms de traits -> identifiants entiers, figés après l'entraînement."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def add(self, features: list) -> np.ndarray:
+        ids = self.ids
+        return np.array([ids.setdefault(f, len(ids)) for f in features], dtype=np.int64)
+
+
+def train_crf(sentences, dialects=None, epochs: int = 10, learning_rate: float = 0.1,
+              l2: float = 1e-4, seed: int = 0) -> dict:
+    """Entraîne un CRF linéaire par descente de gradient stochastique.
+
+    ``sentences`` : listes de ``(token, étiquette)`` ; ``dialects`` : un
+    dialecte par phrase (facultatif). Les gradients viennent de
+    forward-backward en espace logarithmique. Renvoie les tableaux du modèle
+    pour ``np.savez``.
+    """
+    sentences = [s for s in sentences if s]
+    if not sentences:
+        raise ValueError("No tagged sentences to train on")
+    dialects = list(dialects) if dialects is not None else ['auto'] * len(sentences)
+
+    tags = sorted({tag for sentence in sentences for _, tag in sentence})
+    tag_index = {tag: i for i, tag in enumerate(tags)}
+    n_tags = len(tags)
+
+    # Un seul index pour l'entraînement : traits de type, voisins, dialecte
+    index = FeatureIndex()
+    type_ids = {}
+    compiled = []
+    for sentence, dialect in zip(sentences, dialects):
+        tokens = [token for token, _ in sentence]
+        words = [BOS] + [token.lower() for token in tokens] + [EOS]
+        feats, offsets = [], [0]
+        for i, token in enumerate(tokens):
+            if token not in type_ids:
+                type_ids[token] = index.add(type_features(token))
+            ids = np.concatenate([type_ids[token], index.add(
+                [f'w-1={words[i]}', f'w+1={words[i + 2]}', f'd={dialect}'])])
+            feats.append(ids)
+            offsets.append(offsets[-1] + len(ids))
+        gold = np.array([tag_index[tag] for _, tag in sentence])
+        compiled.append((np.concatenate(feats), np.array(offsets[:-1]), gold))
+
+    weights = np.zeros((len(index.ids), n_tags))
+    trans = np.zeros((n_tags, n_tags))
+    start = np.zeros(n_tags)
+    rng = np.random.default_rng(seed)
+
+    for epoch in range(epochs):
+        rate = learning_rate / (1 + epoch)
+        for k in rng.permutation(len(compiled)):
+            feats, offsets, gold = compiled[k]
+            emissions = np.add.reduceat(weights[feats], offsets, axis=0)
+            marginals, pair_marginals = _marginals(emissions, start, trans)
+            grad = -marginals
+            grad[np.arange(len(gold)), gold] += 1
+            counts = np.diff(np.append(offsets, len(feats)))
+            np.add.at(weights, feats, rate * np.repeat(grad, counts, axis=0))
+            start += rate * grad[0]
+            trans_grad = -pair_marginals.sum(axis=0)
+            np.add.at(trans_grad, (gold[:-1], gold[1:]), 1)
+            trans += rate * trans_grad
+        weights *= 1 - rate * l2
+
+    return _export(index, weights, start, trans, tags)
+
+
+def _logsumexp(x, axis):
+    top = x.max(axis=axis, keepdims=True)
+    return (top + np.log(np.exp(x - top).sum(axis=axis, keepdims=True))).squeeze(axis)
+
+
+def _marginals(emissions, start, trans):
+    length = len(emissions)
+    alpha = np.empty_like(emissions)
+    beta = np.zeros_like(emissions)
+    alpha[0] = start + emissions[0]
+    for t in range(1, length):
+        alpha[t] = _logsumexp(alpha[t - 1][:, None] + trans, axis=0) + emissions[t]
+    for t in range(length - 2, -1, -1):
+        beta[t] = _logsumexp(trans + (emissions[t + 1] + beta[t + 1])[None, :], axis=1)
+    log_z = _logsumexp(alpha[-1], axis=0)
+    marginals = np.exp(alpha + beta - log_z)
+    pairs = np.exp(alpha[:-1, :, None] + trans[None]
+                   + (emissions[1:] + beta[1:])[:, None, :] - log_z)
+    return marginals, pairs
+
+
+def _export(index, weights, start, trans, tags) -> dict:
+    """Sépare les poids par gabarit et élimine les traits nuls."""
+    by_prefix = {'w-1=': {}, 'w+1=': {}, 'd=': {}}
+    type_names, type_rows = [], []
+    for name, feature_id in index.ids.items():
+        row = weights[feature_id]
+        if not np.any(np.abs(row) > 1e-6):
+            continue
+        for prefix, table in by_prefix.items():
+            if name.startswith(prefix):
+                table[name[len(prefix):]] = row
+                break
+        else:
+            type_names.append(name)
+            type_rows.append(row)
+
+    # Voisins : une même liste de mots pour les deux tables, ligne finale nulle
+    words = sorted(set(by_prefix['w-1=']) | set(by_prefix['w+1=']))
+    zero = np.zeros(len(tags))
+
+    def table(values, keys):
+        return np.array([values.get(key, zero) for key in keys] + [zero], dtype=np.float32)
+
+    dialects = sorted(by_prefix['d='])
+    n_tags = len(tags)
+    return {
+        'kind': np.array('crf'),
+        'tags': np.array(tags),
+        'type_features': np.array(type_names, dtype=str),
+        'type_weights': np.array(type_rows, dtype=np.float32).reshape(-1, n_tags),
+        'words': np.array(words, dtype=str),
+        'prev_weights': table(by_prefix['w-1='], words),
+        'next_weights': table(by_prefix['w+1='], words),
+        'dialects': np.array(dialects, dtype=str),
+        'dialect_weights': table(by_prefix['d='], dialects),
+        'start': start.astype(np.float32),
+        'trans': trans.astype(np.float32),
+    }
+
 
 class CRFTagger(BaseProcessor):
-    """Utilise un modèle CRF pour POS tagging."""
+    """CRF linéaire : traits compilés en index entiers, décodage par lots.
+
+    Le score d'émission d'un type de token (somme des poids de ses traits)
+    est calculé une fois puis mis en cache ; les traits de voisinage et de
+    dialecte sont des lignes de tables indexées par l'identifiant du mot
+    voisin et du dialecte. Une phrase se réduit ainsi à quelques accès
+    indexés avant le Viterbi.
+
+    Sans modèle entraîné, toutes les étiquettes valent ``DEFAULT_TAG``.
+    """
+
+    def __init__(self, config=None, model_path=None):
+        super().__init__(config)
+        from ..model_registry import as_model_entry
+        entry = as_model_entry(model_path)
+        self.model_path = entry.path if entry is not None else None
+        self.tags = None
+        self.arrays = None
+        self._lock = threading.Lock()
+        if entry is not None and entry.available:
+            from ..model_registry import shared_store
+            self.load_arrays(shared_store(config).load_entry(entry))
+        elif entry is not None:
+            logger.warning(f"CRF model not available ({model_path}), "
+                           f"tagging everything as {DEFAULT_TAG}")
+
+    def load_arrays(self, arrays):
+        """Installe un modèle produit par ``train_crf`` (ou relu d'un .npz)."""
+        kind = str(arrays['kind']) if 'kind' in arrays else None
+        if kind != 'crf':
+            raise ModelLoadError(f"Not a CRF model ({kind or 'unknown'} model): "
+                                 f"set models.pos_backend accordingly")
+        self.arrays = arrays
+        self.tags = [str(tag) for tag in arrays['tags']]
+        n_tags = len(self.tags)
+        self.feature_ids = {str(name): i for i, name in enumerate(arrays['type_features'])}
+        self.type_weights = np.asarray(arrays['type_weights'], dtype=np.float32).reshape(-1, n_tags)
+        words = [str(word) for word in arrays['words']]
+        self.word_ids = {word: i for i, word in enumerate(words)}
+        self.unknown_word = len(words)
+        self.prev_weights = np.asarray(arrays['prev_weights'], dtype=np.float32)
+        self.next_weights = np.asarray(arrays['next_weights'], dtype=np.float32)
+        dialects = [str(d) for d in arrays['dialects']]
+        self.dialect_ids = {d: i for i, d in enumerate(dialects)}
+        self.dialect_weights = np.asarray(arrays['dialect_weights'], dtype=np.float32)
+        self.start = np.asarray(arrays['start'], dtype=np.float32)
+        self.trans = np.asarray(arrays['trans'], dtype=np.float32)
+        self._bos = self.word_ids.get(BOS, self.unknown_word)
+        self._eos = self.word_ids.get(EOS, self.unknown_word)
+        # Scores d'émission par type, dans une table qui grandit avec le cache
+        self._type_rows = {}
+        self._type_scores = np.zeros((64, n_tags), dtype=np.float32)
+        self._type_word = np.zeros(64, dtype=np.int64)
+        return self
+
+    @classmethod
+    def train(cls, sentences, dialects=None, config=None, **kwargs) -> "CRFTagger":
+        return cls(config).load_arrays(train_crf(sentences, dialects, **kwargs))
+
+    def save(self, path: str):
+        """Écrit le modèle au format .npz (lu par ``ModelStore``)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, **self.arrays)
+
+    @staticmethod
+    def _call_types(token_lists):
+        """Types uniques d'un appel et, par phrase, l'indice de chaque token parmi eux."""
+        index = {}
+        positions = []
+        for tokens in token_lists:
+            if isinstance(tokens, TokenSpans):
+                type_positions = np.fromiter((index.setdefault(t, len(index)) for t in tokens.types),
+                                             dtype=np.int64, count=len(tokens.types))
+                positions.append(type_positions[np.frombuffer(tokens.ids, dtype=np.uint32)])
+            else:
+                positions.append(np.fromiter((index.setdefault(t, len(index)) for t in tokens),
+                                             dtype=np.int64, count=len(tokens)))
+        return list(index), positions
+
+    def _type_tables(self, types: list):
+        """Scores d'émission et mots des ``types``, copiés hors du cache partagé.
+
+        Le cache est vidé ou agrandi avant toute attribution de ligne, pour
+        les types de tout l'appel à la fois : une ligne attribuée n'est
+        jamais réutilisée pendant l'appel. Appelé sous ``self._lock``.
+        """
+        missing = [t for t in types if t not in self._type_rows]
+        if len(self._type_rows) + len(missing) > TYPE_CACHE_SIZE:
+            self._type_rows = {}
+            missing = types
+        needed = len(self._type_rows) + len(missing)
+        if needed > len(self._type_scores):
+            size = max(needed, 2 * len(self._type_scores))
+            self._type_scores = np.resize(self._type_scores, (size, len(self.tags)))
+            self._type_word = np.resize(self._type_word, size)
+        for token in missing:
+            row = len(self._type_rows)
+            ids = [self.feature_ids[f] for f in type_features(token) if f in self.feature_ids]
+            self._type_scores[row] = self.type_weights[ids].sum(axis=0)
+            self._type_word[row] = self.word_ids.get(token.lower(), self.unknown_word)
+            self._type_rows[token] = row
+        rows = np.fromiter((self._type_rows[t] for t in types), dtype=np.int64, count=len(types))
+        return self._type_scores[rows], self._type_word[rows]
+
+    def predict(self, tokens: list, dialect: str) -> list:
+        """Une étiquette par token."""
+        return self.predict_batch([tokens], [dialect])[0]
+
+    def predict_batch(self, token_lists: list, dialects: list) -> list:
+        """Étiquettes de plusieurs phrases, décodées par lots de longueurs voisines."""
+        if self.tags is None:
+            return [[DEFAULT_TAG] * len(tokens) for tokens in token_lists]
+        # Les lignes renvoient aux types de l'appel, dont les tables sont
+        # copiées sous le verrou : un autre thread peut ensuite vider le cache
+        types, rows = self._call_types(token_lists)
+        with self._lock:
+            type_scores, type_word = self._type_tables(types)
+        results = [None] * len(rows)
+        for batch in length_batches([len(r) for r in rows]):
+            lengths = np.array([len(rows[i]) for i in batch])
+            max_len = int(lengths.max(initial=0))
+            padded = np.zeros((len(batch), max_len), dtype=np.int64)
+            words = np.full((len(batch), max_len + 2), self._eos, dtype=np.int64)
+            words[:, 0] = self._bos
+            for j, i in enumerate(batch):
+                padded[j, :lengths[j]] = rows[i]
+                words[j, 1:lengths[j] + 1] = type_word[rows[i]]
+            dialect_rows = np.array([self.dialect_ids.get(dialects[i], len(self.dialect_ids))
+                                     for i in batch])
+            emissions = (type_scores[padded]
+                         + self.prev_weights[words[:, :-2]]
+                         + self.next_weights[words[:, 2:]]
+                         + self.dialect_weights[dialect_rows][:, None, :])
+            paths = viterbi(emissions, lengths, self.start, self.trans)
+            for i, path in zip(batch, paths):
+                results[i] = [self.tags[tag_id] for tag_id in path]
+        return results
 
     def tag(self, tokens: list, dialect: str) -> list:
-        # TODO: charger crf model et extraire features
-        return [(tok, 'VERB') for tok in tokens]
+        return list(zip(tokens, self.predict(tokens, dialect)))
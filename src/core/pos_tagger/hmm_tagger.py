@@ -1,9 +1,205 @@
-"""HMMTagger: étiquetage POS par modèle HMM."""
+"""HMMTagger: étiquetage POS par modèle de Markov caché (bigrammes)."""
+import logging
+import os
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from ...exceptions import ModelLoadError
 from ..base_processor import BaseProcessor
+from ..tokens import TokenSpans
+from .viterbi import length_batches, viterbi
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAG = 'NOUN'
+MAX_SUFFIX = 3
+# Mots considérés rares (et donc représentatifs des mots inconnus) à l'entraînement
+RARE_COUNT = 2
+ROW_CACHE_SIZE = 100000
+
+
+def train_hmm(sentences, smoothing: float = 0.1, max_suffix: int = MAX_SUFFIX) -> dict:
+    """Estime un HMM bigramme à partir de phrases ``[(token, étiquette), ...]``.
+
+    Renvoie les tableaux du modèle (log-probabilités), prêts pour
+    ``np.savez`` : étiquettes, vocabulaire, probabilités initiales, de
+    transition et d'émission, et émissions des classes de suffixes utilisées
+    pour les mots inconnus.
+    """
+    tag_counts, word_counts = Counter(), Counter()
+    starts, transitions, emissions = Counter(), Counter(), Counter()
+    for sentence in sentences:
+        previous = None
+        for token, tag in sentence:
+            word = token.lower()
+            tag_counts[tag] += 1
+            word_counts[word] += 1
+            emissions[word, tag] += 1
+            if previous is None:
+                starts[tag] += 1
+            else:
+                transitions[previous, tag] += 1
+            previous = tag
+    if not tag_counts:
+        raise ValueError("No tagged sentences to train on")
+
+    tags = sorted(tag_counts)
+    tag_index = {tag: i for i, tag in enumerate(tags)}
+    vocab = sorted(word_counts)
+    n_tags, n_words = len(tags), len(vocab)
+
+    start = np.full(n_tags, smoothing)
+    for tag, count in starts.items():
+        start[tag_index[tag]] += count
+    trans = np.full((n_tags, n_tags), smoothing)
+    for (previous, tag), count in transitions.items():
+        trans[tag_index[previous], tag_index[tag]] += count
+    emit = np.full((n_words, n_tags), smoothing)
+    word_index = {word: i for i, word in enumerate(vocab)}
+    for (word, tag), count in emissions.items():
+        emit[word_index[word], tag_index[tag]] += count
+    tag_totals = np.array([tag_counts[tag] for tag in tags], dtype=np.float64)
+
+    # Mots inconnus : P(étiquette | suffixe) / P(étiquette), estimé sur les
+    # mots rares, la constante P(mot) ne changeant pas le meilleur chemin
+    suffix_counts = defaultdict(lambda: np.zeros(n_tags))
+    rare_counts = np.zeros(n_tags)
+    for (word, tag), count in emissions.items():
+        if word_counts[word] > RARE_COUNT:
+            continue
+        rare_counts[tag_index[tag]] += count
+        for size in range(1, min(max_suffix, len(word)) + 1):
+            suffix_counts[word[-size:]][tag_index[tag]] += count
+    tag_prior = tag_totals / tag_totals.sum()
+    suffixes = sorted(suffix_counts)
+    suffix_emit = np.array([suffix_counts[s] for s in suffixes]).reshape(-1, n_tags)
+    unknown = rare_counts + smoothing
+
+    def log_normalize(counts, axis=-1):
+        return np.log(counts / counts.sum(axis=axis, keepdims=True))
+
+    return {
+        'kind': np.array('hmm'),
+        'tags': np.array(tags),
+        'vocab': np.array(vocab),
+        'suffixes': np.array(suffixes, dtype=str),
+        'start': log_normalize(start).astype(np.float32),
+        'trans': log_normalize(trans).astype(np.float32),
+        'emit': log_normalize(emit, axis=0).astype(np.float32),
+        'suffix_emit': (log_normalize(suffix_emit + smoothing)
+                        - np.log(tag_prior)).astype(np.float32),
+        'unknown_emit': (log_normalize(unknown) - np.log(tag_prior)).astype(np.float32),
+    }
+
 
 class HMMTagger(BaseProcessor):
-    """Implémentation basique d'un HMM POS tagger."""
+    """HMM bigramme décodé par Viterbi vectorisé (NumPy, espace logarithmique).
+
+    Les phrases d'un lot sont triées par longueur et décodées ensemble, un
+    pas de Viterbi portant sur tout le lot à la fois. Les émissions des mots
+    inconnus viennent de leur plus long suffixe connu ; la classe retenue
+    pour chaque mot est mise en cache.
+
+    Sans modèle entraîné, toutes les étiquettes valent ``DEFAULT_TAG``.
+    """
+
+    def __init__(self, config=None, model_path=None):
+        super().__init__(config)
+        from ..model_registry import as_model_entry
+        entry = as_model_entry(model_path)
+        self.model_path = entry.path if entry is not None else None
+        self.tags = None
+        self.arrays = None
+        self._row_cache = {}
+        if entry is not None and entry.available:
+            from ..model_registry import shared_store
+            self.load_arrays(shared_store(config).load_entry(entry))
+        elif entry is not None:
+            logger.warning(f"HMM model not available ({model_path}), "
+                           f"tagging everything as {DEFAULT_TAG}")
+
+    def load_arrays(self, arrays):
+        """Installe un modèle produit par ``train_hmm`` (ou relu d'un .npz)."""
+        kind = str(arrays['kind']) if 'kind' in arrays else 'hmm'
+        if kind != 'hmm':
+            raise ModelLoadError(f"Not an HMM model ({kind} model): "
+                                 f"set models.pos_backend accordingly")
+        self.arrays = arrays
+        self.tags = [str(tag) for tag in arrays['tags']]
+        vocab = [str(word) for word in arrays['vocab']]
+        suffixes = [str(suffix) for suffix in arrays['suffixes']]
+        self.start = np.asarray(arrays['start'], dtype=np.float32)
+        self.trans = np.asarray(arrays['trans'], dtype=np.float32)
+        # Une table d'émission : mots connus, puis classes de suffixes, puis inconnu
+        self.emit = np.concatenate([
+            np.asarray(arrays['emit'], dtype=np.float32),
+            np.asarray(arrays['suffix_emit'], dtype=np.float32).reshape(-1, len(self.tags)),
+            np.asarray(arrays['unknown_emit'], dtype=np.float32)[None, :],
+        ])
+        self.word_rows = {word: i for i, word in enumerate(vocab)}
+        self.suffix_rows = {suffix: len(vocab) + i for i, suffix in enumerate(suffixes)}
+        self.unknown_row = len(self.emit) - 1
+        self.max_suffix = max((len(suffix) for suffix in suffixes), default=0)
+        self._row_cache = {}
+        return self
+
+    @classmethod
+    def train(cls, sentences, config=None, **kwargs) -> "HMMTagger":
+        return cls(config).load_arrays(train_hmm(sentences, **kwargs))
+
+    def save(self, path: str):
+        """Écrit le modèle au format .npz (lu par ``ModelStore``)."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, **self.arrays)
+
+    def _row(self, token: str) -> int:
+        row = self._row_cache.get(token)
+        if row is None:
+            word = token.lower()
+            row = self.word_rows.get(word)
+            if row is None:
+                row = self.unknown_row
+                for size in range(min(self.max_suffix, len(word)), 0, -1):
+                    suffix_row = self.suffix_rows.get(word[-size:])
+                    if suffix_row is not None:
+                        row = suffix_row
+                        break
+            if len(self._row_cache) >= ROW_CACHE_SIZE:
+                self._row_cache.clear()
+            self._row_cache[token] = row
+        return row
+
+    def _rows(self, tokens) -> np.ndarray:
+        if isinstance(tokens, TokenSpans):
+            type_rows = np.fromiter((self._row(t) for t in tokens.types), dtype=np.int64,
+                                    count=len(tokens.types))
+            return type_rows[np.frombuffer(tokens.ids, dtype=np.uint32)]
+        return np.fromiter((self._row(t) for t in tokens), dtype=np.int64,
+                           count=len(tokens))
+
+    def predict(self, tokens: list, dialect: str) -> list:
+        """Une étiquette par token."""
+        return self.predict_batch([tokens], [dialect])[0]
+
+    def predict_batch(self, token_lists: list, dialects: list) -> list:
+        """Étiquettes de plusieurs phrases, décodées par lots de longueurs voisines."""
+        if self.tags is None:
+            return [[DEFAULT_TAG] * len(tokens) for tokens in token_lists]
+        rows = [self._rows(tokens) for tokens in token_lists]
+        results = [None] * len(rows)
+        for batch in length_batches([len(r) for r in rows]):
+            lengths = np.array([len(rows[i]) for i in batch])
+            padded = np.full((len(batch), int(lengths.max(initial=0))),
+                             self.unknown_row, dtype=np.int64)
+            for j, i in enumerate(batch):
+                padded[j, :lengths[j]] = rows[i]
+            # (lot, longueur, étiquettes)
+            paths = viterbi(self.emit[padded], lengths, self.start, self.trans)
+            for i, path in zip(batch, paths):
+                results[i] = [self.tags[tag_id] for tag_id in path]
+        return results
 
     def tag(self, tokens: list, dialect: str) -> list:
-        # TODO: charger modèle HMM via self.config
-        return [(tok, 'NOUN') for tok in tokens]
+        return list(zip(tokens, self.predict(tokens, dialect)))
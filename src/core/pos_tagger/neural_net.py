@@ -0,0 +1,32 @@
+"""Réseau convolutif d'étiquetage POS (importe torch : chargé à la demande)."""
+import torch
+from torch import nn
+
+
+class ConvTaggerNet(nn.Module):
+    """Plongements de mots, convolutions 1D masquées, projection sur les étiquettes.
+
+    Les positions de remplissage sont remises à zéro après chaque couche :
+    la sortie d'une phrase ne dépend donc pas de la longueur du lot, et le
+    champ réceptif (``radius`` tokens de chaque côté) est borné, ce qui
+    permet de découper les longues entrées en fenêtres sans changer le
+    résultat.
+    """
+
+    def __init__(self, vocab_size: int, n_tags: int, embedding_dim: int = 64,
+                 hidden_dim: int = 128, layers: int = 2, kernel_size: int = 3):
+        super().__init__()
+        self.embedding = nn.Embedding(vocab_size, embedding_dim, padding_idx=0)
+        dims = [embedding_dim] + [hidden_dim] * layers
+        self.convs = nn.ModuleList(
+            nn.Conv1d(dims[i], dims[i + 1], kernel_size, padding=kernel_size // 2)
+            for i in range(layers))
+        self.output = nn.Linear(hidden_dim if layers else embedding_dim, n_tags)
+        self.radius = layers * (kernel_size // 2)
+
+    def forward(self, ids: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+        keep = mask.unsqueeze(1).to(torch.float32)
+        x = self.embedding(ids).transpose(1, 2) * keep
+        for conv in self.convs:
+            x = torch.relu(conv(x)) * keep
+        return self.output(x.transpose(1, 2))
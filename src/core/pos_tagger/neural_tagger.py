@@ -1,17 +1,189 @@
-"""NeuralTagger: étiquetage POS par réseau de neurones."""
+"""NeuralTagger: étiquetage POS par réseau de neurones (inférence CPU)."""
+import json
+import logging
+import os
+
+from ...exceptions import ModelLoadError
 from ..base_processor import BaseProcessor
-import torch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAG = 'ADJ'
+PAD, UNK = 0, 1
+# Longueurs arrondies au multiple supérieur : une forme de tenseur par compartiment
+BUCKET_WIDTH = 16
+# Tokens (remplissage compris) par passe avant
+TOKENS_PER_BATCH = 8192
+DEFAULT_MAX_LENGTH = 512
+
 
 class NeuralTagger(BaseProcessor):
-    """Réseau neuronal pour POS tagging."""
+    """Réseau neuronal pour POS tagging.
+
+    Charge un checkpoint ``{"kind": "neural", "vocab", "tags", "params",
+    "state_dict"}`` (``torch.save``) ou un module TorchScript exporté par
+    ``export_torchscript`` (``.ts``). Les phrases sont regroupées par
+    compartiments de longueur, complétées et masquées, puis passées sous
+    ``torch.inference_mode``. Les entrées plus longues que
+    ``processing.max_sequence_length`` sont découpées en fenêtres qui se
+    recouvrent du champ réceptif du réseau.
+
+    Sans modèle, toutes les étiquettes valent ``DEFAULT_TAG``.
+    """
 
-    def __init__(self, model_path: str, config):
+    def __init__(self, model_path=None, config=None):
         super().__init__(config)
-        # Chargement du modèle PyTorch
-        self.model = torch.load(model_path, map_location='cpu')
+        from ..model_registry import as_model_entry
+        entry = as_model_entry(model_path, default_format='torch')
+        self.model_path = entry.path if entry is not None else None
+        self.model = None
+        self.tags = None
+        self.max_length = (config.processing.max_sequence_length
+                           if config is not None else DEFAULT_MAX_LENGTH)
+        if entry is not None and entry.available:
+            # torch n'est importé qu'au chargement d'un modèle
+            import torch
+            self._set_threads(torch)
+            from ..model_registry import shared_store
+            self.load(shared_store(config).load_entry(entry))
+            if config is not None and config.models.pos_quantize:
+                self.quantize()
+        elif model_path:
+            logger.warning(f"Neural POS model not available ({model_path}), "
+                           f"tagging everything as {DEFAULT_TAG}")
+
+    def _set_threads(self, torch):
+        """Threads intra-op : les cœurs partagés entre ``processing.num_workers`` processus."""
+        if self.config is None:
+            return
+        workers = max(1, self.config.processing.num_workers)
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        torch.set_num_threads(threads)
+        logger.info(f"Neural tagger using {threads} intra-op threads")
+
+    def load(self, model):
+        """Installe un checkpoint (dict) ou un module TorchScript chargé."""
+        if isinstance(model, dict) and 'module' in model:
+            meta = model['meta']
+            self.model = model['module']
+        elif isinstance(model, dict) and model.get('kind') == 'neural':
+            from .neural_net import ConvTaggerNet
+            meta = model
+            net = ConvTaggerNet(len(model['vocab']), len(model['tags']), **model['params'])
+            # assign : les poids restent ceux (mappés en mémoire) du checkpoint
+            net.load_state_dict(model['state_dict'], assign=True)
+            self.model = net
+        else:
+            raise ModelLoadError(f"Not a neural POS checkpoint: {self.model_path}")
+        self.vocab = {word: i for i, word in enumerate(meta['vocab'])}
+        self.tags = list(meta['tags'])
+        self.params = dict(meta.get('params', {}))
+        self.radius = int(meta.get('radius', getattr(self.model, 'radius', 0)))
         self.model.eval()
+        return self
+
+    @classmethod
+    def build(cls, vocab: list, tags: list, config=None, **params) -> "NeuralTagger":
+        """Tagger à poids aléatoires (``vocab`` commence par ``<pad>``, ``<unk>``)."""
+        from .neural_net import ConvTaggerNet
+        net = ConvTaggerNet(len(vocab), len(tags), **params)
+        return cls(config=config).load({'kind': 'neural', 'vocab': list(vocab),
+                                        'tags': list(tags), 'params': params,
+                                        'state_dict': net.state_dict()})
+
+    def checkpoint(self) -> dict:
+        return {'kind': 'neural', 'vocab': list(self.vocab), 'tags': self.tags,
+                'params': self.params, 'state_dict': self.model.state_dict()}
+
+    def save(self, path: str):
+        import torch
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        torch.save(self.checkpoint(), path)
+
+    def quantize(self):
+        """Quantification dynamique int8 des couches linéaires (inférence CPU)."""
+        import torch
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        return self
+
+    def _example(self):
+        import torch
+        ids = torch.ones((2, BUCKET_WIDTH), dtype=torch.long)
+        return ids, torch.ones_like(ids, dtype=torch.bool)
+
+    def export_torchscript(self, path: str):
+        """Module TorchScript, avec vocabulaire et étiquettes en fichier annexe."""
+        import torch
+        module = torch.jit.trace(self.model, self._example())
+        meta = {'vocab': list(self.vocab), 'tags': self.tags, 'params': self.params,
+                'radius': self.radius}
+        torch.jit.save(module, path, _extra_files={'meta.json': json.dumps(meta)})
+
+    def export_onnx(self, path: str):
+        """Graphe ONNX à axes dynamiques (lot, longueur) ; métadonnées dans ``path.json``."""
+        import torch
+        torch.onnx.export(self.model, self._example(), path,
+                          input_names=['ids', 'mask'], output_names=['logits'],
+                          dynamic_axes={'ids': {0: 'batch', 1: 'length'},
+                                        'mask': {0: 'batch', 1: 'length'},
+                                        'logits': {0: 'batch', 1: 'length'}},
+                          dynamo=False)
+        with open(f"{path}.json", 'w', encoding='utf-8') as f:
+            json.dump({'vocab': list(self.vocab), 'tags': self.tags,
+                       'radius': self.radius}, f, ensure_ascii=False)
+
+    def _windows(self, length: int):
+        """(début, fin, début gardé, fin gardée) des fenêtres couvrant une phrase."""
+        size = self.max_length
+        if length <= size:
+            return [(0, length, 0, length)]
+        context = min(self.radius, (size - 1) // 2)
+        step = size - 2 * context
+        windows = []
+        for keep_start in range(0, length, step):
+            keep_end = min(keep_start + step, length)
+            start = max(0, keep_start - context)
+            end = min(length, keep_end + context)
+            windows.append((start, end, keep_start, keep_end))
+        return windows
+
+    def predict(self, tokens: list, dialect: str) -> list:
+        """Une étiquette par token."""
+        return self.predict_batch([tokens], [dialect])[0]
+
+    def predict_batch(self, token_lists: list, dialects: list) -> list:
+        """Étiquettes de plusieurs phrases, par compartiments de longueur."""
+        if self.model is None:
+            return [[DEFAULT_TAG] * len(tokens) for tokens in token_lists]
+        import torch
+
+        vocab = self.vocab
+        segments = []                       # (phrase, début gardé, fin gardée, ids, décalage)
+        for n, tokens in enumerate(token_lists):
+            ids = [vocab.get(tok.lower(), UNK) for tok in tokens]
+            for start, end, keep_start, keep_end in self._windows(len(ids)):
+                segments.append((n, keep_start, keep_end, ids[start:end], keep_start - start))
+
+        results = [[None] * len(tokens) for tokens in token_lists]
+        buckets = {}
+        for segment in segments:
+            width = -(-len(segment[3]) // BUCKET_WIDTH) * BUCKET_WIDTH
+            buckets.setdefault(width, []).append(segment)
+
+        with torch.inference_mode():
+            for width, bucket in buckets.items():
+                per_batch = max(1, TOKENS_PER_BATCH // width)
+                for begin in range(0, len(bucket), per_batch):
+                    batch = bucket[begin:begin + per_batch]
+                    ids = torch.zeros((len(batch), width), dtype=torch.long)
+                    for row, segment in enumerate(batch):
+                        ids[row, :len(segment[3])] = torch.tensor(segment[3], dtype=torch.long)
+                    predicted = self.model(ids, ids != PAD).argmax(dim=-1).tolist()
+                    for (n, keep_start, keep_end, _, offset), row in zip(batch, predicted):
+                        results[n][keep_start:keep_end] = [
+                            self.tags[t] for t in row[offset:offset + keep_end - keep_start]]
+        return results
 
     def tag(self, tokens: list, dialect: str) -> list:
-        # TODO: préparer batch, encoder, passer dans self.model
-        tags = ['ADJ' for _ in tokens]
-        return list(zip(tokens, tags))
+        return list(zip(tokens, self.predict(tokens, dialect)))
@@ -0,0 +1,44 @@
+"""POSTagger: point d'entrée de l'étiquetage morphosyntaxique."""
+from ..base_processor import BaseProcessor
+from ..tokens import TokenTags
+from .crf_tagger import CRFTagger
+from .hmm_tagger import HMMTagger
+
+
+class POSTagger(BaseProcessor):
+    """Délègue l'étiquetage au backend choisi ('hmm', 'crf', 'neural')."""
+
+    def __init__(self, model_path=None, config=None, backend: str = "hmm"):
+        super().__init__(config)
+        self.model_path = getattr(model_path, 'path', model_path)
+        self.backend = backend
+        if backend == "hmm":
+            self.tagger = HMMTagger(config, model_path)
+        elif backend == "crf":
+            self.tagger = CRFTagger(config, model_path)
+        elif backend == "neural":
+            # torch n'est importé que si le backend neuronal est demandé
+            from .neural_tagger import NeuralTagger
+            self.tagger = NeuralTagger(model_path, config)
+        else:
+            raise ValueError(f"Unknown POS backend: {backend}")
+
+    def tag(self, tokens: list, dialect: str) -> TokenTags:
+        """Étiquettes des tokens, séquence de paires (token, étiquette)."""
+        return TokenTags.from_tags(tokens, self._predict(tokens, dialect))
+
+    def tag_batch(self, token_lists: list, dialects: list) -> list:
+        """Étiquette plusieurs phrases en un seul appel au backend."""
+        if hasattr(self.tagger, 'predict_batch'):
+            batch = self.tagger.predict_batch(token_lists, dialects)
+        else:
+            batch = [self._predict(tokens, dialect)
+                     for tokens, dialect in zip(token_lists, dialects)]
+        return [TokenTags.from_tags(tokens, tags)
+                for tokens, tags in zip(token_lists, batch)]
+
+    def _predict(self, tokens: list, dialect: str) -> list:
+        # Les backends sans 'predict' renvoient des paires (token, étiquette)
+        if hasattr(self.tagger, 'predict'):
+            return self.tagger.predict(tokens, dialect)
+        return [tag for _, tag in self.tagger.tag(tokens, dialect)]
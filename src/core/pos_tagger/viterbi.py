@@ -0,0 +1,42 @@
+"""Décodage de Viterbi par lots, partagé par les étiqueteurs HMM et CRF."""
+import numpy as np
+
+# Taille des lots de phrases décodées ensemble
+VITERBI_BATCH = 256
+
+
+def length_batches(lengths: list, batch_size: int = VITERBI_BATCH):
+    """Indices des phrases groupés par longueurs voisines, pour limiter le remplissage."""
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    for begin in range(0, len(order), batch_size):
+        yield order[begin:begin + batch_size]
+
+
+def viterbi(emissions: np.ndarray, lengths: np.ndarray,
+            start: np.ndarray, trans: np.ndarray) -> list:
+    """Meilleurs chemins d'un lot, en espace logarithmique.
+
+    ``emissions`` est de forme (lot, longueur, étiquettes), complété au-delà
+    de ``lengths`` ; ``trans[i, j]`` note le passage de l'étiquette i à j.
+    Renvoie une liste d'identifiants d'étiquettes par phrase.
+    """
+    size, max_len, n_tags = emissions.shape
+    if max_len == 0:
+        return [[] for _ in range(size)]
+
+    delta = start + emissions[:, 0]
+    back = np.zeros((size, max_len, n_tags), dtype=np.int32)
+    for t in range(1, max_len):
+        scores = delta[:, :, None] + trans                  # précédente x courante
+        back[:, t] = scores.argmax(axis=1)
+        step = scores.max(axis=1) + emissions[:, t]
+        delta = np.where((t < lengths)[:, None], step, delta)
+
+    batch = np.arange(size)
+    current = delta.argmax(axis=1)
+    paths = np.zeros((size, max_len), dtype=np.int32)
+    for t in range(max_len - 1, -1, -1):
+        paths[:, t] = current
+        if t > 0:
+            current = np.where(t < lengths, back[batch, t, current], current)
+    return [paths[i, :n].tolist() for i, n in enumerate(lengths)]
@@ -0,0 +1,266 @@
+"""Lazy construction of pipeline processors and named pipeline profiles."""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..config import LexLangConfig
+from ..exceptions import ConfigurationError, ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+
+# Processors backed by a model file: processor -> (registry name, config path)
+MODEL_FILES: Dict[str, Tuple[str, str]] = {
+    "pos_tagger": ("pos_tagger", "pos_model_path"),
+    "dialect_detector": ("dialect_classifier", "dialect_model_path"),
+    "embeddings": ("embeddings", "embedding_model_path"),
+}
+
+
+def model_path(config: LexLangConfig, processor: str,
+               version: Optional[str] = None):
+    """Model of ``processor`` as a ``ModelEntry``: the registered version, or the configured path.
+
+    Processors load it with ``ModelStore.load_entry``, so the recorded
+    checksum is checked on first load.
+    """
+    from .model_registry import model_registry
+    model, attr = MODEL_FILES[processor]
+    return model_registry(config).entry_for(model, getattr(config.models, attr), version)
+
+
+def _tokenizer(config: LexLangConfig):
+    from .tokenizer import EweTokenizer
+    return EweTokenizer(dialect_aware=True, config=config)
+
+
+def _normalizer(config: LexLangConfig):
+    from .normalizer import TextNormalizer
+    return TextNormalizer(config=config)
+
+
+def _pos_tagger(config: LexLangConfig, version: Optional[str] = None):
+    from .pos_tagger import POSTagger
+    return POSTagger(model_path=model_path(config, "pos_tagger", version), config=config,
+                     backend=config.models.pos_backend)
+
+
+def _tonal_processor(config: LexLangConfig):
+    from .tonal_processor import TonalProcessor
+    return TonalProcessor(config=config)
+
+
+def _dialect_detector(config: LexLangConfig, version: Optional[str] = None):
+    from .dialect_handler import DialectDetector
+    return DialectDetector(model_path=model_path(config, "dialect_detector", version),
+                           config=config)
+
+
+def _morphology(config: LexLangConfig):
+    from .morphology import MorphologicalAnalyzer
+    return MorphologicalAnalyzer(config=config)
+
+
+def _embeddings(config: LexLangConfig, version: Optional[str] = None):
+    from .embeddings import WordEmbeddings
+    return WordEmbeddings(model_path=model_path(config, "embeddings", version),
+                          config=config)
+
+
+# Processor name -> factory. Each factory imports its own module, so that
+# unused processors (and their dependencies) are never imported.
+PROCESSOR_FACTORIES: Dict[str, Callable[[LexLangConfig], object]] = {
+    "tokenizer": _tokenizer,
+    "normalizer": _normalizer,
+    "pos_tagger": _pos_tagger,
+    "tonal_processor": _tonal_processor,
+    "dialect_detector": _dialect_detector,
+    "morphology": _morphology,
+    "embeddings": _embeddings,
+}
+
+# Processors a profile may load. "light" covers tokenization and
+# normalization (plus dialect detection for dialect="auto").
+PROFILES: Dict[str, Tuple[str, ...]] = {
+    "light": ("tokenizer", "normalizer", "dialect_detector"),
+    "full": tuple(PROCESSOR_FACTORIES),
+}
+
+# Small call run on a freshly built processor before it is swapped in, so
+# that lazy loading and first-call costs are not paid by live requests
+WARMUP_TOKENS = ["Ame", "si", "le", "afi", "ma", "."]
+WARMUPS: Dict[str, Callable[[object], object]] = {
+    "tokenizer": lambda p: p.tokenize_spans("Ame si le afi ma.", "anlo"),
+    "normalizer": lambda p: p.normalize(WARMUP_TOKENS, "anlo"),
+    "pos_tagger": lambda p: p.tag(WARMUP_TOKENS, "anlo"),
+    "tonal_processor": lambda p: p.analyze(WARMUP_TOKENS, "anlo"),
+    "dialect_detector": lambda p: p.detect("Ame si le afi ma."),
+    "morphology": lambda p: p.analyze(WARMUP_TOKENS, "anlo"),
+    "embeddings": lambda p: p.get_matrix_batch([WARMUP_TOKENS]),
+}
+
+# Processors each task needs, besides the tokenizer and dialect detector
+TASK_PROCESSORS: Dict[str, Tuple[str, ...]] = {
+    "tokenize": (),
+    "offsets": (),
+    "normalize": ("normalizer",),
+    "pos": ("pos_tagger",),
+    "tone": ("tonal_processor",),
+    "morphology": ("morphology",),
+    "dialect": (),
+    "embeddings": ("embeddings",),
+}
+
+
+class LazyProcessors:
+    """
+    Mapping of processor name to processor, built on first access.
+
+    Only the processors of the selected profile can be built; asking for
+    another one raises ``ConfigurationError``. Construction is guarded by a
+    lock so concurrent first requests build each processor once.
+
+    ``reload`` builds and warms up a replacement (e.g. another model
+    version) while the current processor keeps serving, then swaps it in.
+    Callers that already hold the old processor finish with it; the next
+    lookup gets the new one. The replaced processor is kept for
+    ``rollback``.
+    """
+
+    def __init__(self, config: LexLangConfig, profile: str = "full",
+                 versions: Optional[Dict[str, str]] = None):
+        if profile not in PROFILES:
+            raise ConfigurationError(
+                f"Unknown pipeline profile '{profile}', expected one of {list(PROFILES)}")
+        self.config = config
+        self.profile = profile
+        self.allowed = PROFILES[profile]
+        self._loaded: Dict[str, object] = {}
+        self._versions: Dict[str, Optional[str]] = dict(versions or {})
+        self._previous: Dict[str, Tuple[object, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+
+    def __getitem__(self, name: str):
+        processor = self._loaded.get(name)
+        if processor is not None:
+            return processor
+        if name not in PROCESSOR_FACTORIES:
+            raise KeyError(name)
+        if name not in self.allowed:
+            raise ConfigurationError(
+                f"Processor '{name}' is not part of the '{self.profile}' profile")
+        with self._lock:
+            processor = self._loaded.get(name)
+            if processor is None:
+                processor = self._build(name, self._versions.get(name))
+                self._loaded[name] = processor
+        return processor
+
+    def _build(self, name: str, version: Optional[str] = None):
+        logger.info(f"Loading processor '{name}'"
+                    + (f" (model {version})" if version else ""))
+        try:
+            if name in MODEL_FILES:
+                return PROCESSOR_FACTORIES[name](self.config, version)
+            return PROCESSOR_FACTORIES[name](self.config)
+        except ModelLoadError as e:
+            # An unreadable file or a checksum mismatch is not a configuration problem
+            logger.error(f"Error loading the model of processor '{name}': {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error initializing processor '{name}': {e}")
+            raise ConfigurationError(f"Failed to initialize {name}: {e}")
+
+    def __setitem__(self, name: str, processor):
+        with self._lock:
+            self._loaded[name] = processor
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.allowed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.allowed)
+
+    def __len__(self) -> int:
+        return len(self.allowed)
+
+    def loaded(self) -> Tuple[str, ...]:
+        """Names of the processors built so far."""
+        return tuple(self._loaded)
+
+    def preload(self, names: Optional[Iterable[str]] = None):
+        """Build processors ahead of the first request (all of the profile by default)."""
+        for name in names if names is not None else self.allowed:
+            self[name]
+
+    def reload(self, name: str, version: Optional[str] = None) -> Optional[str]:
+        """Build, warm up and swap in ``name`` (at model ``version`` if given).
+
+        Returns the version that was replaced. On failure the current
+        processor stays in place.
+        """
+        if name not in PROCESSOR_FACTORIES or name not in self.allowed:
+            raise ConfigurationError(
+                f"Processor '{name}' is not part of the '{self.profile}' profile")
+        if version is not None and name not in MODEL_FILES:
+            raise ConfigurationError(f"Processor '{name}' has no model versions")
+        with self._reload_lock:
+            try:
+                processor = self._build(name, version)
+            except ModelLoadError as e:
+                raise ConfigurationError(f"Failed to reload {name}: {e}") from e
+            warmup = WARMUPS.get(name)
+            if warmup is not None:
+                try:
+                    warmup(processor)
+                except Exception as e:
+                    raise ConfigurationError(f"Warm-up of {name} failed: {e}")
+            return self._swap(name, processor, version)
+
+    def rollback(self, name: str) -> Optional[str]:
+        """Swap back the processor replaced by the last ``reload``; returns its version."""
+        with self._reload_lock:
+            previous = self._previous.get(name)
+            if previous is None:
+                raise ConfigurationError(f"No previous version of '{name}' to roll back to")
+            processor, version = previous
+            self._swap(name, processor, version)
+            return version
+
+    def _swap(self, name: str, processor, version: Optional[str]) -> Optional[str]:
+        with self._lock:
+            old = self._loaded.get(name)
+            old_version = self._versions.get(name)
+            if old is not None:
+                self._previous[name] = (old, old_version)
+            self._loaded[name] = processor
+            self._versions[name] = version
+        logger.info(f"Swapped in processor '{name}'"
+                    + (f" (model {version})" if version else ""))
+        return old_version
+
+    def versions(self) -> Dict[str, Optional[str]]:
+        """Model versions pinned by ``reload``/``rollback`` (None: the registry's active one)."""
+        with self._lock:
+            return {name: version for name, version in self._versions.items()
+                    if version is not None}
+
+    def model_paths(self) -> Dict[str, str]:
+        """Configured model paths, with registry-backed processors resolved."""
+        paths = {attr: path for attr, path in vars(self.config.models).items()
+                 if attr.endswith("_model_path")}
+        for name, (_, attr) in MODEL_FILES.items():
+            entry = model_path(self.config, name, self._versions.get(name))
+            paths[attr] = entry.path if entry is not None else None
+        return paths
+
+    def check_tasks(self, tasks: Iterable[str]):
+        """Raise ``ConfigurationError`` if a task needs a processor outside the profile."""
+        for task in tasks:
+            for name in TASK_PROCESSORS.get(task, ()):
+                if name not in self.allowed:
+                    raise ConfigurationError(
+                        f"Task '{task}' is not available in the '{self.profile}' "
+                        f"profile")
@@ -0,0 +1,141 @@
+"""Declarative stage graph and scheduler for the LexLang pipeline."""
+
+import logging
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import ConfigurationError, ProcessingError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A processing step that turns named input artifacts into one output.
+
+    ``run`` takes one value per input.  ``run_batch``, when given, takes one
+    list per input (one entry per document) and returns a list of outputs.
+    """
+    name: str
+    inputs: Tuple[str, ...]
+    output: str
+    run: Callable[..., Any]
+    run_batch: Optional[Callable[..., List[Any]]] = None
+
+
+class StageGraph:
+    """Resolves requested artifacts into stages and runs each stage once.
+
+    Stages are grouped into dependency levels; stages on the same level do
+    not depend on each other and are submitted to the executor together.
+    """
+
+    def __init__(self, stages: Iterable[Stage]):
+        self._producers: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.output in self._producers:
+                raise ConfigurationError(
+                    f"Artifact '{stage.output}' produced by both "
+                    f"'{self._producers[stage.output].name}' and '{stage.name}'"
+                )
+            self._producers[stage.output] = stage
+
+    @property
+    def stages(self) -> List[Stage]:
+        return list(self._producers.values())
+
+    def plan(self,
+             targets: Iterable[str],
+             available: Iterable[str] = (),
+             aliases: Optional[Dict[str, str]] = None) -> List[List[Stage]]:
+        """Return the stages needed for ``targets``, grouped by level."""
+        aliases = aliases or {}
+        available = set(available)
+        levels: Dict[str, int] = {}
+        visiting = set()
+
+        def resolve(artifact: str) -> int:
+            artifact = aliases.get(artifact, artifact)
+            if artifact in available:
+                return -1
+            if artifact in levels:
+                return levels[artifact]
+            if artifact not in self._producers:
+                raise ProcessingError(f"No stage produces artifact '{artifact}'")
+            if artifact in visiting:
+                raise ConfigurationError(f"Cycle detected at artifact '{artifact}'")
+            visiting.add(artifact)
+            stage = self._producers[artifact]
+            level = 1 + max((resolve(name) for name in stage.inputs), default=-1)
+            visiting.discard(artifact)
+            levels[artifact] = level
+            return level
+
+        for target in targets:
+            resolve(target)
+
+        plan: List[List[Stage]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for artifact, level in levels.items():
+            plan[level].append(self._producers[artifact])
+        return plan
+
+    def execute(self,
+                targets: Iterable[str],
+                artifacts: Dict[str, Any],
+                aliases: Optional[Dict[str, str]] = None,
+                executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """Compute ``targets`` into ``artifacts`` and return it.
+
+        Artifacts already present are reused; every missing one is computed
+        exactly once.  When an executor is given, independent stages of the
+        same level run concurrently.
+        """
+        aliases = aliases or {}
+        plan = self.plan(targets, artifacts.keys(), aliases)
+
+        for level in plan:
+            if executor is not None and len(level) > 1:
+                futures = [(stage, executor.submit(self._run_stage, stage, artifacts, aliases))
+                           for stage in level]
+                for stage, future in futures:
+                    artifacts[stage.output] = future.result()
+            else:
+                for stage in level:
+                    artifacts[stage.output] = self._run_stage(stage, artifacts, aliases)
+        return artifacts
+
+    def execute_batch(self,
+                      targets: Iterable[str],
+                      batch: List[Dict[str, Any]],
+                      aliases: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Compute ``targets`` for every artifact dict in ``batch``.
+
+        All documents must start with the same set of artifacts.  Each stage
+        is called once for the whole batch through ``run_batch``; stages
+        without a batch implementation fall back to ``run`` per document.
+        """
+        if not batch:
+            return batch
+        aliases = aliases or {}
+        plan = self.plan(targets, batch[0].keys(), aliases)
+
+        for level in plan:
+            for stage in level:
+                columns = [[item[aliases.get(name, name)] for item in batch]
+                           for name in stage.inputs]
+                logger.debug(f"Running stage {stage.name} on {len(batch)} documents")
+                if stage.run_batch is not None:
+                    outputs = stage.run_batch(*columns)
+                else:
+                    outputs = [stage.run(*args) for args in zip(*columns)]
+                for item, output in zip(batch, outputs):
+                    item[stage.output] = output
+        return batch
+
+    @staticmethod
+    def _run_stage(stage: Stage, artifacts: Dict[str, Any],
+                   aliases: Dict[str, str]) -> Any:
+        args = [artifacts[aliases.get(name, name)] for name in stage.inputs]
+        logger.debug(f"Running stage {stage.name}")
+        return stage.run(*args)
@@ -0,0 +1,198 @@
+"""Output serializers for pipeline results."""
+
+import importlib.util
+import io
+import json
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..exceptions import ProcessingError
+
+_HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+
+class Serializer:
+    """Turns a structured result dictionary into an output payload."""
+
+    def __init__(self, name: str, dumps: Callable[[Dict[str, Any]], Union[str, bytes]],
+                 media_type: str, binary: bool = False,
+                 requires: Optional[str] = None, columnar: bool = False):
+        self.name = name
+        self.dumps = dumps
+        self.media_type = media_type
+        self.binary = binary
+        self.requires = requires
+        # Columnar serializers take the embedding matrix as a NumPy array
+        self.columnar = columnar
+
+    @property
+    def available(self) -> bool:
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+
+_SERIALIZERS: Dict[str, Serializer] = {}
+
+
+def register_serializer(serializer: Serializer):
+    """Register (or replace) the serializer for an output format."""
+    _SERIALIZERS[serializer.name] = serializer
+
+
+def get_serializer(output_format: str) -> Serializer:
+    serializer = _SERIALIZERS.get(output_format)
+    if serializer is None:
+        raise ProcessingError(f"Unsupported output format: {output_format}")
+    if not serializer.available:
+        raise ProcessingError(
+            f"Output format '{output_format}' requires the "
+            f"'{serializer.requires}' package"
+        )
+    return serializer
+
+
+def available_formats() -> List[str]:
+    return [name for name, serializer in _SERIALIZERS.items() if serializer.available]
+
+
+def as_builtin(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Results with the embedding matrix as lists (None for unknown tokens)."""
+    embeddings = results.get("embeddings")
+    if embeddings is None or isinstance(embeddings, list):
+        return results
+    import numpy as np
+    unknown = np.isnan(embeddings).all(axis=1)
+    rows = embeddings.tolist()
+    return dict(results, embeddings=[None if missing else row
+                                     for row, missing in zip(rows, unknown)])
+
+
+def to_json(results: Dict[str, Any]) -> str:
+    if _HAS_ORJSON:
+        import orjson
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(results, ensure_ascii=False, indent=2)
+
+
+def to_compact_json(results: Dict[str, Any]) -> str:
+    if _HAS_ORJSON:
+        import orjson
+        return orjson.dumps(results).decode("utf-8")
+    return json.dumps(results, ensure_ascii=False, separators=(",", ":"))
+
+
+def to_text(results: Dict[str, Any]) -> str:
+    """Format results as readable text."""
+    output_lines = []
+    output_lines.append(f"Input: {results['input_text']}")
+    output_lines.append(f"Dialect: {results.get('final_dialect', 'unknown')}")
+    output_lines.append("")
+
+    if "tokens" in results:
+        output_lines.append("Tokens:")
+        output_lines.append(" ".join(results["tokens"]))
+        output_lines.append("")
+
+    if "pos_tags" in results:
+        output_lines.append("POS Tags:")
+        for token, pos in results["pos_tags"]:
+            output_lines.append(f"  {token}\t{pos}")
+        output_lines.append("")
+
+    if "tonal_analysis" in results:
+        output_lines.append("Tonal Analysis:")
+        for key, value in results["tonal_analysis"].items():
+            output_lines.append(f"  {key}: {value}")
+        output_lines.append("")
+
+    return "\n".join(output_lines)
+
+
+def to_conllu(results: Dict[str, Any]) -> str:
+    """Format results in CoNLL-U format."""
+    output_lines = []
+    output_lines.append(f"# text = {results['input_text']}")
+    output_lines.append(f"# dialect = {results.get('final_dialect', 'unknown')}")
+
+    tokens = results.get("tokens", [])
+    # Tags are aligned with tokens by position, so repeated forms keep
+    # their own tag
+    pos_tags = results.get("pos_tags", [])
+    space_after = results.get("space_after", [])
+
+    for i, token in enumerate(tokens):
+        pos = pos_tags[i][1] if i < len(pos_tags) else "_"
+        misc = "SpaceAfter=No" if i < len(space_after) and not space_after[i] else "_"
+        line = f"{i + 1}\t{token}\t_\t{pos}\t_\t_\t_\t_\t_\t{misc}"
+        output_lines.append(line)
+
+    output_lines.append("")
+    return "\n".join(output_lines)
+
+
+def to_msgpack(results: Dict[str, Any]) -> bytes:
+    import msgpack
+    return msgpack.packb(results, use_bin_type=True)
+
+
+def _embedding_matrix(results: Dict[str, Any]):
+    """Embeddings as a float32 matrix (NaN rows for unknown tokens)."""
+    import numpy as np
+    vectors = results.get("embeddings")
+    if isinstance(vectors, np.ndarray):
+        return vectors.astype(np.float32, copy=False)
+    vectors = vectors or []
+    dim = next((len(v) for v in vectors if v is not None), 0)
+    matrix = np.full((len(vectors), dim), np.nan, dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        if vector is not None:
+            matrix[i] = vector
+    return matrix
+
+
+def to_npz(results: Dict[str, Any]) -> bytes:
+    """Columnar NumPy archive: tokens, offsets, tags and embedding matrix."""
+    import numpy as np
+    columns = {"embeddings": _embedding_matrix(results)}
+    if "tokens" in results:
+        columns["tokens"] = np.array(results["tokens"], dtype=str)
+    if "token_offsets" in results:
+        columns["token_offsets"] = np.array(results["token_offsets"],
+                                            dtype=np.uint32).reshape(-1, 2)
+    if "pos_tags" in results:
+        columns["pos_tags"] = np.array([tag for _, tag in results["pos_tags"]],
+                                       dtype=str)
+    buffer = io.BytesIO()
+    np.savez(buffer, **columns)
+    return buffer.getvalue()
+
+
+def to_arrow(results: Dict[str, Any]) -> bytes:
+    """Arrow IPC stream with one row per token."""
+    import pyarrow as pa
+    columns = {}
+    if "tokens" in results:
+        columns["token"] = pa.array(results["tokens"], type=pa.string())
+    if "pos_tags" in results:
+        columns["pos"] = pa.array([tag for _, tag in results["pos_tags"]],
+                                  type=pa.string())
+    if "embeddings" in results:
+        matrix = _embedding_matrix(results)
+        columns["embedding"] = pa.FixedSizeListArray.from_arrays(
+            pa.array(matrix.ravel(), type=pa.float32()), matrix.shape[1])
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+register_serializer(Serializer("json", to_json, "application/json"))
+register_serializer(Serializer("jsonl", to_compact_json, "application/x-ndjson"))
+register_serializer(Serializer("text", to_text, "text/plain"))
+register_serializer(Serializer("conllu", to_conllu, "text/plain"))
+register_serializer(Serializer("msgpack", to_msgpack, "application/msgpack",
+                               binary=True, requires="msgpack"))
+register_serializer(Serializer("npz", to_npz, "application/octet-stream",
+                               binary=True, requires="numpy", columnar=True))
+register_serializer(Serializer("arrow", to_arrow,
+                               "application/vnd.apache.arrow.stream",
+                               binary=True, requires="pyarrow", columnar=True))
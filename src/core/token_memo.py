@@ -0,0 +1,90 @@
+"""Bounded memo of per-token-type analyses shared by the processors."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+DEFAULT_MEMO_SIZE = 50000
+
+
+class TokenMemo:
+    """
+    LRU tables, one per namespace ('normalize', 'tone', 'morphology'...),
+    mapping a token type and dialect to the result of a per-token analysis.
+
+    Text is highly repetitive at the token level, so looking results up by
+    type makes long documents cost roughly in proportion to their
+    vocabulary rather than their length.
+
+    The same value is handed out for every occurrence of a type, across
+    documents and threads, so values must be immutable (strings, numbers,
+    tuples). A namespace should identify the rules that produced its values,
+    so that processors with different rules never share entries.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MEMO_SIZE):
+        self.max_entries = max_entries
+        self._tables: Dict[str, "OrderedDict[Hashable, Any]"] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def map(self, namespace: str, tokens: List[str],
+            compute: Callable[[str], Any], dialect: str = "") -> List[Any]:
+        """Return ``compute(token)`` for every token, computing each type once."""
+        types = dict.fromkeys(tokens)
+
+        with self._lock:
+            table = self._tables.setdefault(namespace, OrderedDict())
+            stats = self._stats.setdefault(
+                namespace, {"hits": 0, "misses": 0, "evictions": 0})
+            values = {}
+            for tok in types:
+                key = (tok, dialect)
+                if key in table:
+                    table.move_to_end(key)
+                    values[tok] = table[key]
+            stats["hits"] += len(values)
+
+        missing = {tok: compute(tok) for tok in types if tok not in values}
+
+        if missing:
+            with self._lock:
+                for tok, value in missing.items():
+                    table[(tok, dialect)] = value
+                stats["misses"] += len(missing)
+                while len(table) > self.max_entries:
+                    table.popitem(last=False)
+                    stats["evictions"] += 1
+            values.update(missing)
+
+        return [values[tok] for tok in tokens]
+
+    def clear(self, namespace: Optional[str] = None):
+        with self._lock:
+            if namespace is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(namespace, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                namespace: dict(stats, entries=len(self._tables.get(namespace, ())))
+                for namespace, stats in self._stats.items()
+            }
+
+
+_shared_memo: Optional[TokenMemo] = None
+_shared_lock = threading.Lock()
+
+
+def shared_memo(config=None) -> TokenMemo:
+    """Process-wide memo, sized by the largest ``processing.token_memo_size`` requested."""
+    global _shared_memo
+    size = config.processing.token_memo_size if config is not None else DEFAULT_MEMO_SIZE
+    with _shared_lock:
+        if _shared_memo is None:
+            _shared_memo = TokenMemo(size)
+        elif size > _shared_memo.max_entries:
+            _shared_memo.max_entries = size
+        return _shared_memo
@@ -0,0 +1,15 @@
+"""Tokenization modules."""
+
+from .base_tokenizer import BaseTokenizer
+from .word_tokenizer import WordTokenizer
+from .sentence_tokenizer import SentenceTokenizer
+from .dialect_aware_tokenizer import DialectAwareTokenizer
+from .ewe_tokenizer import EweTokenizer
+
+__all__ = [
+    "BaseTokenizer",
+    "WordTokenizer",
+    "SentenceTokenizer",
+    "DialectAwareTokenizer",
+    "EweTokenizer",
+]
@@ -1,6 +1,7 @@
 """BaseTokenizer: classe de base pour tokeniseurs."""
 from abc import ABC, abstractmethod
 from ..base_processor import BaseProcessor
+from ..tokens import TokenSpans
 
 class BaseTokenizer(BaseProcessor, ABC):
     """Interface pour tokenisation."""
@@ -9,3 +10,8 @@ class BaseTokenizer(BaseProcessor, ABC):
     def tokenize(self, text: str, dialect: str) -> list:
         """Retourne la liste des tokens."""
         pass
+
+    def tokenize_spans(self, text: str, dialect: str) -> TokenSpans:
+        """Retourne les tokens sous forme de positions dans le texte."""
+        return TokenSpans.from_offsets(
+            text, ((start, end) for _, start, end in self.tokenize_with_offsets(text, dialect)))
@@ -1,12 +1,148 @@
 """DialectAwareTokenizer: détection de tokens adaptée au dialecte."""
-from .base_tokenizer import BaseTokenizer
+import hashlib
+import json
+import logging
 import re
+from pathlib import Path
+
+from ...exceptions import TokenizationError
+from ..tokens import TokenSpans
+from .base_tokenizer import BaseTokenizer
+from .token_trie import TokenTrie
+
+logger = logging.getLogger(__name__)
+
+# Lettres, chiffres et diacritiques combinants (tons, nasalisation)
+WORD_CHARS = r"\w\u0300-\u036f"
+BASE_PATTERN = rf"[{WORD_CHARS}]+|[^\w\s]"
+TOKEN_PATTERN = re.compile(BASE_PATTERN)
+
+TOKENIZER_RULES = "configs/tokenizer.yaml"
+SUPPORTED_DIALECTS = ("anlo", "inland", "ho", "kpando")
+DEFAULT_RESOURCES = "data/linguistic_resources/"
+
+
+def load_tokenization_rules(path) -> dict:
+    """Lit la section 'tokenization' d'un fichier YAML ou JSON (vide accepté)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if not content.strip():
+        return {}
+    if path.suffix == '.json':
+        data = json.loads(content)
+    else:
+        import yaml  # chargé à la première lecture de règles, pas à l'import du CLI
+        data = yaml.safe_load(content)
+    return (data or {}).get('tokenization') or {}
+
+
+def rules_digest(resources_path=DEFAULT_RESOURCES) -> str:
+    """Empreinte des règles de tokenisation : fichier global et fichiers des dialectes."""
+    digest = hashlib.sha1()
+    dialects_path = Path(resources_path) / "dialects"
+    for path in [Path(TOKENIZER_RULES)] + [dialects_path / f"{d}.json"
+                                           for d in SUPPORTED_DIALECTS]:
+        digest.update(str(path.name).encode('utf-8'))
+        digest.update(path.read_bytes() if path.exists() else b'')
+    return digest.hexdigest()[:12]
+
 
 class DialectAwareTokenizer(BaseTokenizer):
-    """Word tokenizer tenant compte des particularités dialectales."""
+    """Word tokenizer tenant compte des particularités dialectales.
+
+    Les expressions multimots, élisions et clitiques de ``configs/tokenizer.yaml``
+    et de ``dialects/<dialecte>.json`` sont compilés une fois par dialecte en
+    une seule expression régulière (tries pour les formes listées), appliquée
+    en un seul parcours du texte.
+    """
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        resources = (config.data.linguistic_resources_path
+                     if config is not None else DEFAULT_RESOURCES)
+        self.dialects_path = Path(resources) / "dialects"
+        self.global_rules = load_tokenization_rules(TOKENIZER_RULES)
+        self._compiled = {}
+
+    def rules_for(self, dialect: str) -> dict:
+        """Règles globales complétées par celles du dialecte."""
+        rules = {
+            'multiword_expressions': list(self.global_rules.get('multiword_expressions') or []),
+            'elisions': list(self.global_rules.get('elisions') or []),
+            'clitics': dict(self.global_rules.get('clitics') or {}),
+        }
+        if dialect and dialect != "auto":
+            if dialect not in SUPPORTED_DIALECTS:
+                raise TokenizationError(f"Unsupported dialect: {dialect!r}")
+            local = load_tokenization_rules(self.dialects_path / f"{dialect}.json")
+            rules['multiword_expressions'] += local.get('multiword_expressions') or []
+            rules['elisions'] += local.get('elisions') or []
+            rules['clitics'].update(local.get('clitics') or {})
+        return rules
+
+    def compile(self, dialect: str):
+        """Retourne (motif compilé, table des clitiques) pour un dialecte.
+
+        Seuls les dialectes de ``SUPPORTED_DIALECTS`` (et 'auto') sont acceptés :
+        le nom sert de chemin de fichier et de clé d'un cache sans éviction.
+        """
+        dialect = dialect or "auto"
+        compiled = self._compiled.get(dialect)
+        if compiled is not None:
+            return compiled
+
+        rules = self.rules_for(dialect)
+        alternatives = []
+        mwe = TokenTrie(form.lower() for form in rules['multiword_expressions'])
+        if mwe:
+            alternatives.append(
+                rf"(?<![{WORD_CHARS}])(?:{mwe.pattern()})(?![{WORD_CHARS}])")
+        elisions = TokenTrie(form.lower() for form in rules['elisions'])
+        if elisions:
+            alternatives.append(rf"(?<![{WORD_CHARS}])(?:{elisions.pattern()})")
+        alternatives.append(BASE_PATTERN)
+        pattern = (re.compile('|'.join(alternatives), re.IGNORECASE)
+                   if len(alternatives) > 1 else TOKEN_PATTERN)
+
+        clitics = {}
+        for form, parts in rules['clitics'].items():
+            if ''.join(parts) != form:
+                logger.warning(f"Ignoring clitic rule {form!r} -> {parts!r}: "
+                               f"parts must spell the form")
+                continue
+            clitics[form.lower()] = [len(part) for part in parts]
+
+        compiled = (pattern, clitics)
+        self._compiled[dialect] = compiled
+        return compiled
 
     def tokenize(self, text: str, dialect: str) -> list:
-        # Exemple simple: segmentation par espaces et ponctuation
-        tokens = re.findall(r"\w+|[^\w\s]", text, flags=re.UNICODE)
-        # TODO: appliquer règles dialectales spécifiques via self.config
+        pattern, clitics = self.compile(dialect)
+        if not clitics:
+            return pattern.findall(text)
+        return [tok for tok, _, _ in self.tokenize_with_offsets(text, dialect)]
+
+    def tokenize_spans(self, text: str, dialect: str) -> TokenSpans:
+        pattern, clitics = self.compile(dialect)
+        if not clitics:
+            return TokenSpans.from_offsets(
+                text, (match.span() for match in pattern.finditer(text)))
+        return super().tokenize_spans(text, dialect)
+
+    def tokenize_with_offsets(self, text: str, dialect: str) -> list:
+        """Retourne les tokens avec leurs positions: [(token, début, fin)]."""
+        pattern, clitics = self.compile(dialect)
+        tokens = []
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            lengths = clitics.get(match.group().lower()) if clitics else None
+            if lengths is None:
+                tokens.append((match.group(), start, end))
+                continue
+            for length in lengths:
+                tokens.append((text[start:start + length], start, start + length))
+                start += length
         return tokens
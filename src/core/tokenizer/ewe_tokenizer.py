@@ -0,0 +1,32 @@
+"""EweTokenizer: point d'entrée de la tokenisation."""
+from ..tokens import TokenSpans
+from .base_tokenizer import BaseTokenizer
+from .dialect_aware_tokenizer import DialectAwareTokenizer
+from .sentence_tokenizer import SentenceTokenizer
+from .word_tokenizer import WordTokenizer
+
+
+class EweTokenizer(BaseTokenizer):
+    """Tokeniseur principal, avec ou sans règles dialectales."""
+
+    def __init__(self, dialect_aware: bool = True, config=None):
+        super().__init__(config)
+        self.dialect_aware = dialect_aware
+        if dialect_aware:
+            self.word_tokenizer = DialectAwareTokenizer(config)
+        else:
+            self.word_tokenizer = WordTokenizer(config)
+        self.sentence_tokenizer = SentenceTokenizer(config)
+
+    def tokenize(self, text: str, dialect: str = "auto") -> list:
+        return self.word_tokenizer.tokenize(text, dialect)
+
+    def tokenize_spans(self, text: str, dialect: str = "auto") -> TokenSpans:
+        return self.word_tokenizer.tokenize_spans(text, dialect)
+
+    def tokenize_spans_batch(self, texts: list, dialects: list) -> list:
+        return [self.word_tokenizer.tokenize_spans(text, dialect)
+                for text, dialect in zip(texts, dialects)]
+
+    def sentences(self, text: str, dialect: str = "auto") -> list:
+        return self.sentence_tokenizer.tokenize(text, dialect)
@@ -2,10 +2,39 @@
 from .base_tokenizer import BaseTokenizer
 import re
 
+SENTENCE_BOUNDARY = re.compile(r'(?<=[\.\?\!])\s+')
+SENTENCE_END = re.compile(r'[\.\?\!]\s*$')
+
+
 class SentenceTokenizer(BaseTokenizer):
     """Découpe le texte en phrases."""
 
     def tokenize(self, text: str, dialect: str) -> list:
         # Sépare sur points, points d'interrogation/exclamation
-        sentences = re.split(r'(?<=[\.\?\!])\s+', text.strip())
+        sentences = SENTENCE_BOUNDARY.split(text.strip())
         return [s for s in sentences if s]
+
+    def iter_sentences(self, chunks, dialect: str = "auto",
+                       max_buffer: int = 10000):
+        """Découpe un flux de fragments (ex. lignes d'un fichier) en phrases.
+
+        Une phrase peut s'étendre sur plusieurs fragments; un fragment vide
+        (fin de paragraphe) ou un tampon de plus de ``max_buffer`` caractères
+        force la fin de la phrase en cours.
+        """
+        buffer = ""
+        for chunk in chunks:
+            chunk = chunk.strip()
+            if not chunk:
+                if buffer:
+                    yield buffer
+                    buffer = ""
+                continue
+            buffer = f"{buffer} {chunk}" if buffer else chunk
+            *complete, buffer = self.tokenize(buffer, dialect)
+            yield from complete
+            if SENTENCE_END.search(buffer) or len(buffer) > max_buffer:
+                yield buffer
+                buffer = ""
+        if buffer:
+            yield buffer
@@ -0,0 +1,44 @@
+"""TokenTrie: compile des listes de formes en expression régulière de trie."""
+import re
+
+
+class TokenTrie:
+    """Trie de caractères rendu sous forme d'expression régulière.
+
+    Les alternatives partagent leurs préfixes, si bien que le moteur `re`
+    n'explore qu'une branche par caractère au lieu d'essayer chaque forme
+    l'une après l'autre. Une espace dans une forme correspond à ``\\s+``.
+    """
+
+    END = ''
+
+    def __init__(self, forms=()):
+        self.root = {}
+        for form in forms:
+            self.add(form)
+
+    def add(self, form: str):
+        node = self.root
+        for char in form:
+            node = node.setdefault(char, {})
+        node[self.END] = True
+
+    def __bool__(self):
+        return bool(self.root)
+
+    def pattern(self) -> str:
+        return self._render(self.root) if self.root else ''
+
+    def _render(self, node: dict) -> str:
+        optional = self.END in node
+        branches = []
+        for char in sorted(c for c in node if c != self.END):
+            atom = r'\s+' if char.isspace() else re.escape(char)
+            branches.append(atom + self._render(node[char]))
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if optional:
+            # La forme courte n'est retenue que si la plus longue échoue
+            return '(?:' + body + ')?'
+        return body
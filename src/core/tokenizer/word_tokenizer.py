@@ -1,11 +1,14 @@
 """WordTokenizer: découpe de phrases en mots."""
 from .base_tokenizer import BaseTokenizer
-import re
+from .dialect_aware_tokenizer import TOKEN_PATTERN
 
 class WordTokenizer(BaseTokenizer):
     """Tokenisation simple des mots d'une phrase."""
 
     def tokenize(self, sentence: str, dialect: str) -> list:
-        # Sépare sur les espaces et enlève la ponctuation isolée
-        tokens = re.findall(r"\w+|[^\w\s]", sentence, flags=re.UNICODE)
-        return tokens
+        # Sépare sur les espaces et isole la ponctuation
+        return TOKEN_PATTERN.findall(sentence)
+
+    def tokenize_with_offsets(self, sentence: str, dialect: str) -> list:
+        return [(m.group(), m.start(), m.end())
+                for m in TOKEN_PATTERN.finditer(sentence)]
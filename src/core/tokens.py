@@ -0,0 +1,128 @@
+"""Compact token representation shared by the pipeline stages."""
+
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Tuple
+
+
+class TokenSpans(Sequence):
+    """
+    Tokens of a text stored as character offsets plus interned type IDs.
+
+    Offsets and IDs live in ``array`` buffers; each distinct token form is
+    stored once per document in ``types``. The object behaves as a read-only
+    sequence of token strings, so stages written against plain token lists
+    accept it unchanged.
+    """
+
+    __slots__ = ("text", "starts", "ends", "ids", "types")
+
+    def __init__(self, text: str, starts: array, ends: array, ids: array,
+                 types: List[str]):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.ids = ids
+        self.types = types
+
+    @classmethod
+    def from_offsets(cls, text: str,
+                     offsets: Iterable[Tuple[int, int]]) -> "TokenSpans":
+        """Build spans from ``(start, end)`` pairs into ``text``."""
+        starts = array("I")
+        ends = array("I")
+        ids = array("I")
+        types: List[str] = []
+        index = {}
+        for start, end in offsets:
+            form = text[start:end]
+            type_id = index.get(form)
+            if type_id is None:
+                type_id = index[form] = len(types)
+                types.append(form)
+            starts.append(start)
+            ends.append(end)
+            ids.append(type_id)
+        return cls(text, starts, ends, ids, types)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.types[type_id] for type_id in self.ids[i]]
+        return self.types[self.ids[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        types = self.types
+        return (types[type_id] for type_id in self.ids)
+
+    def __repr__(self) -> str:
+        return f"TokenSpans({list(self)!r})"
+
+    def span(self, i: int) -> Tuple[int, int]:
+        return self.starts[i], self.ends[i]
+
+    def offsets(self) -> List[List[int]]:
+        """Offsets as ``[start, end]`` pairs, for serialization."""
+        return [[start, end] for start, end in zip(self.starts, self.ends)]
+
+    def space_after(self, i: int) -> bool:
+        """Whether the token is followed by whitespace (or ends the text)."""
+        end = self.ends[i]
+        return end >= len(self.text) or self.text[end].isspace()
+
+    def with_types(self, types: List[str]) -> "TokenSpans":
+        """Same spans with each type replaced, e.g. by its normalized form.
+
+        The offset and ID buffers are shared, not copied; ``types`` must be
+        aligned with ``self.types``.
+        """
+        return TokenSpans(self.text, self.starts, self.ends, self.ids, types)
+
+
+class TokenTags(Sequence):
+    """
+    One tag per token, stored as IDs into a small tag set.
+
+    Behaves as a read-only sequence of ``(token, tag)`` pairs, the format
+    the taggers historically returned, without materializing the pairs.
+    """
+
+    __slots__ = ("tokens", "ids", "tagset")
+
+    def __init__(self, tokens: Sequence, ids: array, tagset: List[str]):
+        self.tokens = tokens
+        self.ids = ids
+        self.tagset = tagset
+
+    @classmethod
+    def from_tags(cls, tokens: Sequence, tags: Iterable[str]) -> "TokenTags":
+        ids = array("H")
+        tagset: List[str] = []
+        index = {}
+        for tag in tags:
+            tag_id = index.get(tag)
+            if tag_id is None:
+                tag_id = index[tag] = len(tagset)
+                tagset.append(tag)
+            ids.append(tag_id)
+        return cls(tokens, ids, tagset)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(zip(self.tokens[i], self.tags()[i]))
+        return self.tokens[i], self.tagset[self.ids[i]]
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        tagset = self.tagset
+        return zip(self.tokens, (tagset[tag_id] for tag_id in self.ids))
+
+    def __repr__(self) -> str:
+        return f"TokenTags({list(self)!r})"
+
+    def tags(self) -> List[str]:
+        return [self.tagset[tag_id] for tag_id in self.ids]
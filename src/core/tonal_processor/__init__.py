@@ -0,0 +1,15 @@
+"""Tonal processing modules."""
+
+from .tone_analyzer import ToneAnalyzer
+from .tone_marker import ToneMarker
+from .tone_validator import ToneValidator
+from .sandhi_processor import SandhiProcessor
+from .tonal_processor import TonalProcessor
+
+__all__ = [
+    "ToneAnalyzer",
+    "ToneMarker",
+    "ToneValidator",
+    "SandhiProcessor",
+    "TonalProcessor",
+]
@@ -0,0 +1,21 @@
+"""TonalProcessor: analyse tonale de haut niveau."""
+from ..base_processor import BaseProcessor
+from .sandhi_processor import SandhiProcessor
+from .tone_analyzer import ToneAnalyzer
+from .tone_validator import ToneValidator
+
+
+class TonalProcessor(BaseProcessor):
+    """Enchaîne sandhi, analyse et validation des tons."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.sandhi = SandhiProcessor(config)
+        self.analyzer = ToneAnalyzer(config)
+        self.validator = ToneValidator(config)
+
+    def analyze(self, tokens: list, dialect: str) -> dict:
+        tokens = self.sandhi.process(tokens, dialect)
+        analysis = self.analyzer.analyze(tokens, dialect)
+        analysis['valid'] = self.validator.validate(tokens, dialect)
+        return analysis
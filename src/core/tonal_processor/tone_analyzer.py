@@ -1,10 +1,29 @@
 """ToneAnalyzer: détection et classification de tons."""
 from ..base_processor import BaseProcessor
+from ..tokens import TokenSpans
+
+HIGH_TONE = '́'
+LOW_TONE = '̀'
+
 
 class ToneAnalyzer(BaseProcessor):
     """Analyse les tonalités des tokens."""
 
+    def __init__(self, config=None):
+        super().__init__(config)
+
     def analyze(self, tokens: list, dialect: str) -> dict:
-        # Ex: compter tons aigus/graves
-        return {'high_tones': len([t for t in tokens if '́' in t]),
-                'low_tones': len([t for t in tokens if '̀' in t])}
+        # Deux tests d'appartenance : moins cher à recalculer qu'à mémoïser
+        if isinstance(tokens, TokenSpans):
+            # Un profil par type, pondéré par le nombre d'occurrences
+            counts = [0] * len(tokens.types)
+            for type_id in tokens.ids:
+                counts[type_id] += 1
+            profiles = zip(tokens.types, counts)
+        else:
+            profiles = ((token, 1) for token in tokens)
+        high = low = 0
+        for token, count in profiles:
+            high += count * (HIGH_TONE in token)
+            low += count * (LOW_TONE in token)
+        return {'high_tones': high, 'low_tones': low}
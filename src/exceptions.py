@@ -46,6 +46,11 @@ class DialectDetectionError(ProcessingError):
     pass
 
 
+class DialectConversionError(ProcessingError):
+    """Dialect conversion specific errors."""
+    pass
+
+
 class MorphologyError(ProcessingError):
     """Morphological analysis errors."""
     pass
@@ -81,6 +86,14 @@ class RateLimitError(APIError):
     pass
 
 
+class ServiceOverloadedError(APIError):
+    """Too many requests already queued for processing."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class TrainingError(LexLangError):
     """Model training errors."""
     pass
@@ -4,11 +4,12 @@
 import argparse
 import logging
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
 from .config import load_config
-from .core.pipeline import Pipeline
+from .core.pipeline import Pipeline, STREAM_FORMATS
 from .utils import setup_logging
 from .exceptions import LexLangError
 
@@ -46,7 +47,7 @@ def main():
     )
     parser.add_argument(
         "-f", "--format",
-        choices=["json", "text", "conllu"],
+        choices=["json", "jsonl", "text", "conllu"],
         default="json",
         help="Output format"
     )
@@ -72,30 +73,44 @@ def main():
         pipeline = Pipeline(config)
         logger.info("Initialized processing pipeline")
         
-        # Read input
-        if Path(args.input).exists():
-            with open(args.input, 'r', encoding='utf-8') as f:
-                text = f.read()
-            logger.info(f"Read input from file: {args.input}")
+        # Files are streamed sentence by sentence in line-oriented formats;
+        # otherwise the input is processed as a single document
+        if Path(args.input).exists() and args.format in STREAM_FORMATS:
+            with open(args.input, 'r', encoding='utf-8') as f, \
+                    (open(args.output, 'w', encoding='utf-8') if args.output
+                     else nullcontext(sys.stdout)) as out:
+                logger.info(f"Streaming input from file: {args.input}")
+                for result in pipeline.stream(
+                    f,
+                    dialect=args.dialect,
+                    tasks=args.tasks,
+                    output_format=args.format
+                ):
+                    out.write(result)
+                    out.write("\n")
         else:
-            text = args.input
-            logger.info("Processing input string")
-        
-        # Process text
-        results = pipeline.process(
-            text=text,
-            dialect=args.dialect,
-            tasks=args.tasks,
-            output_format=args.format
-        )
+            if Path(args.input).exists():
+                with open(args.input, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                logger.info(f"Read input from file: {args.input}")
+            else:
+                text = args.input
+                logger.info("Processing input string")
+            results = pipeline.process(
+                text=text,
+                dialect=args.dialect,
+                tasks=args.tasks,
+                output_format=args.format
+            )
+            
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(results)
+            else:
+                print(results)
         
-        # Write output
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(results)
             logger.info(f"Results written to {args.output}")
-        else:
-            print(results)
             
     except LexLangError as e:
         logger.error(f"LexLang error: {e}")
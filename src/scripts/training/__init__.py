@@ -0,0 +1,24 @@
+"""Model training entry points."""
+
+from datetime import datetime
+from typing import Optional
+
+from ...config import LexLangConfig
+from ...exceptions import TrainingError
+
+
+def train_model(model_type: str, training_data: str, config: LexLangConfig,
+                output_dir: Optional[str] = None) -> str:
+    """Train ``model_type`` on ``training_data``, register it and return its path.
+
+    The new version is named after the training time, e.g. ``v20240101120000``.
+    """
+    version = datetime.now().strftime("v%Y%m%d%H%M%S")
+    if model_type == 'pos':
+        from .train_pos_tagger import train_pos_tagger
+        return train_pos_tagger(training_data, version, config, output_dir,
+                                backend=config.models.pos_backend)
+    if model_type == 'dialect':
+        from .train_dialect_classifier import train_dialect_classifier
+        return train_dialect_classifier(training_data, version, config, output_dir)
+    raise TrainingError(f"Training of '{model_type}' models is not supported yet")
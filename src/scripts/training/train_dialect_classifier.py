@@ -0,0 +1,102 @@
+"""
+Train the character n-gram dialect classifier.
+
+The corpus is JSON lines, one labelled text per line:
+``{"text": "...", "dialect": "anlo"}``. The model is written as a .npz
+file and registered as a new version of ``dialect_classifier`` in the model
+registry.
+
+Usage::
+
+    python -m src.scripts.training.train_dialect_classifier \\
+        data/corpora/annotated/dialect_labeled.jsonl --version v3.1
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections import Counter
+from typing import Iterator, Optional, Tuple
+
+from ...config import LexLangConfig, load_config
+from ...exceptions import TrainingError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS = "data/corpora/annotated/dialect_labeled.jsonl"
+
+
+def read_labeled_corpus(path: str) -> Iterator[Tuple[str, str]]:
+    """``(text, dialect)`` pairs of a dialect-labelled JSONL corpus."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                text, dialect = record['text'], record['dialect']
+            except (ValueError, KeyError, TypeError) as e:
+                raise TrainingError(f"{path}:{line_number}: invalid record: {e}")
+            if text.strip():
+                yield text, dialect
+
+
+def train_dialect_classifier(corpus_path: str,
+                             version: str,
+                             config: Optional[LexLangConfig] = None,
+                             output_dir: Optional[str] = None,
+                             register: bool = True,
+                             **params) -> str:
+    """Train a classifier on ``corpus_path`` and return the model path.
+
+    ``params`` go to ``train_ngram_classifier`` (epochs, learning_rate, l2,
+    holdout, bits).
+    """
+    from ...core.dialect_handler.dialect_detector import DialectDetector
+    from ...core.model_registry import model_registry
+
+    config = config or LexLangConfig()
+    records = list(read_labeled_corpus(corpus_path))
+    if not records:
+        raise TrainingError(f"No labelled texts in {corpus_path}")
+    texts = [text for text, _ in records]
+    labels = [dialect for _, dialect in records]
+
+    detector = DialectDetector.train(texts, labels, config=config, **params)
+    output_dir = output_dir or os.path.dirname(config.models.dialect_model_path)
+    model_path = os.path.join(output_dir, f"dialect_ngram_{version}.npz")
+    detector.save(model_path)
+    logger.info(f"Trained dialect classifier on {len(texts)} texts "
+                f"({dict(Counter(labels))}), temperature {detector.temperature:.3f}: "
+                f"{model_path}")
+
+    if register:
+        model_registry(config).register("dialect_classifier", version, model_path, "npz")
+    return model_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS)
+    parser.add_argument('--version', required=True, help='Version to register, e.g. v3.1')
+    parser.add_argument('--config', default='configs/default.yaml')
+    parser.add_argument('--output-dir', default=None)
+    parser.add_argument('--epochs', type=int, default=None)
+    parser.add_argument('--bits', type=int, default=None,
+                        help='log2 of the number of hashed n-gram columns')
+    parser.add_argument('--no-register', action='store_true',
+                        help='Write the model without registering it')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    params = {name: value for name, value in
+              (('epochs', args.epochs), ('bits', args.bits)) if value is not None}
+    path = train_dialect_classifier(args.corpus, args.version, load_config(args.config),
+                                    args.output_dir, register=not args.no_register,
+                                    **params)
+    print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Train the HMM or CRF part-of-speech tagger.
+
+The corpus is JSON lines, one sentence per line, either as parallel lists
+``{"tokens": [...], "tags": [...]}`` or as pairs ``{"pairs": [[token, tag], ...]}``,
+with an optional ``"dialect"``. The model is written as a .npz file and
+registered as a new version of ``pos_tagger`` in the model registry; serve
+it with ``models.pos_backend`` set to the same backend.
+
+Usage::
+
+    python -m src.scripts.training.train_pos_tagger \\
+        data/corpora/annotated/pos_tagged.jsonl --version v1.3 [--backend crf]
+"""
+
+import argparse
+import json
+import logging
+import os
+from typing import Iterator, Optional
+
+from ...config import LexLangConfig, load_config
+from ...exceptions import TrainingError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS = "data/corpora/annotated/pos_tagged.jsonl"
+
+
+def read_tagged_corpus(path: str, with_dialects: bool = False) -> Iterator:
+    """Sentences of a POS-tagged JSONL corpus, as lists of (token, tag).
+
+    With ``with_dialects``, yields ``(sentence, dialect)`` pairs instead.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if 'pairs' in record:
+                    sentence = [(token, tag) for token, tag in record['pairs']]
+                else:
+                    if len(record['tokens']) != len(record['tags']):
+                        raise ValueError("tokens and tags differ in length")
+                    sentence = list(zip(record['tokens'], record['tags']))
+            except (ValueError, KeyError, TypeError) as e:
+                raise TrainingError(f"{path}:{line_number}: invalid sentence: {e}")
+            if sentence:
+                yield (sentence, record.get('dialect', 'auto')) if with_dialects else sentence
+
+
+def train_pos_tagger(corpus_path: str,
+                     version: str,
+                     config: Optional[LexLangConfig] = None,
+                     output_dir: Optional[str] = None,
+                     register: bool = True,
+                     backend: str = "hmm",
+                     **params) -> str:
+    """Train a tagger on ``corpus_path`` and return the model path.
+
+    ``params`` go to ``train_hmm`` (smoothing) or ``train_crf`` (epochs,
+    learning_rate, l2).
+    """
+    from ...core.model_registry import model_registry
+
+    config = config or LexLangConfig()
+    records = list(read_tagged_corpus(corpus_path, with_dialects=True))
+    if not records:
+        raise TrainingError(f"No tagged sentences in {corpus_path}")
+    sentences = [sentence for sentence, _ in records]
+
+    if backend == "hmm":
+        from ...core.pos_tagger.hmm_tagger import HMMTagger
+        tagger = HMMTagger.train(sentences, config=config, **params)
+    elif backend == "crf":
+        from ...core.pos_tagger.crf_tagger import CRFTagger
+        tagger = CRFTagger.train(sentences, [dialect for _, dialect in records],
+                                 config=config, **params)
+    else:
+        raise TrainingError(f"Cannot train POS backend '{backend}'")
+    output_dir = output_dir or os.path.dirname(config.models.pos_model_path)
+    model_path = os.path.join(output_dir, f"pos_{backend}_{version}.npz")
+    tagger.save(model_path)
+    logger.info(f"Trained {backend.upper()} tagger on {len(sentences)} sentences "
+                f"({len(tagger.tags)} tags): {model_path}")
+
+    if register:
+        model_registry(config).register("pos_tagger", version, model_path, "npz")
+    return model_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS)
+    parser.add_argument('--version', required=True, help='Version to register, e.g. v1.3')
+    parser.add_argument('--config', default='configs/default.yaml')
+    parser.add_argument('--output-dir', default=None)
+    parser.add_argument('--backend', choices=['hmm', 'crf'], default='hmm')
+    parser.add_argument('--smoothing', type=float, default=None, help='HMM only')
+    parser.add_argument('--epochs', type=int, default=None, help='CRF only')
+    parser.add_argument('--no-register', action='store_true',
+                        help='Write the model without registering it')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    params = {name: value for name, value in
+              (('smoothing', args.smoothing), ('epochs', args.epochs)) if value is not None}
+    path = train_pos_tagger(args.corpus, args.version, load_config(args.config),
+                            args.output_dir, register=not args.no_register,
+                            backend=args.backend, **params)
+    print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,6 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from functools import wraps
-import numpy as np
 
 
 def setup_logging(level: Union[str, int] = logging.INFO, 
@@ -166,6 +165,7 @@ def calculate_f1_score(predictions: List[str], labels: List[str],
 def split_train_test(data: List[Any], test_size: float = 0.2, 
                     random_state: Optional[int] = None) -> tuple:
     """Split data into train and test sets."""
+    import numpy as np
     if random_state:
         np.random.seed(random_state)
     
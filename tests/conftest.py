@@ -0,0 +1,10 @@
+import pytest
+
+from src.config import LexLangConfig
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = LexLangConfig()
+    config.data.cache_dir = str(tmp_path / "cache")
+    return config
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.api.auth import get_current_user
+from src.api.batching import RequestBatcher
+from src.api.executor import PipelineExecutor
+from src.core.pipeline import Pipeline
+from src.exceptions import ProcessingError, ServiceOverloadedError
+
+
+@pytest.fixture
+def client(config):
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: "test_user"
+    routes.set_pipeline_instance(Pipeline(config))
+    yield TestClient(app)
+    routes.executor_instance.shutdown()
+
+
+def test_process_endpoint_runs_on_executor(client):
+    response = client.post("/api/v1/process", json={
+        "text": "Ame si le afi ma.", "dialect": "anlo", "tasks": ["tokenize"]})
+    assert response.status_code == 200
+    assert response.json()["results"]["tokens"][0] == "Ame"
+
+
+def test_full_queue_returns_503_with_retry_after(client):
+    executor = routes.executor_instance
+    executor._admitted = executor.capacity
+    response = client.post("/api/v1/process", json={
+        "text": "Ame si le afi ma.", "dialect": "anlo", "tasks": ["tokenize"]})
+    executor._admitted = 0
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(executor.retry_after)
+
+
+def test_executor_bounds_admitted_requests(config):
+    config.api.max_concurrency = 1
+    config.api.max_queue = 1
+    release = threading.Event()
+
+    class SlowPipeline:
+        def process(self, **kwargs):
+            release.wait(5)
+            return kwargs["text"]
+
+    executor = PipelineExecutor(SlowPipeline(), config)
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.process(text="a"))
+        second = asyncio.ensure_future(executor.process(text="b"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ServiceOverloadedError):
+            await executor.process(text="c")
+        release.set()
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert executor.stats()["rejected"] == 1
+    executor.shutdown()
+
+
+def test_batcher_coalesces_concurrent_requests(config):
+    pipeline = Pipeline(config)
+    executor = PipelineExecutor(pipeline, config)
+    batcher = RequestBatcher(executor, max_batch=8, max_wait=0.05)
+    texts = ["Ame si le afi ma.", "Ɖevi la dzo.", "", "Ame si le afi ma."]
+
+    async def scenario():
+        return await asyncio.gather(
+            *(batcher.process(text=text, dialect="anlo", tasks=["tokenize", "pos"],
+                              output_format="dict") for text in texts),
+            return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert batcher.stats()["batches"] == 1
+    assert isinstance(results[2], ProcessingError)
+    expected = pipeline.process(texts[1], dialect="anlo", tasks=["tokenize", "pos"],
+                                output_format="dict")
+    assert results[1]["pos_tags"] == expected["pos_tags"]
+    assert results[0]["tokens"] == results[3]["tokens"]
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_batcher_admits_by_batch_not_by_request(config):
+    config.api.max_concurrency = 1
+    config.api.max_queue = 0
+    executor = PipelineExecutor(Pipeline(config), config)
+    batcher = RequestBatcher(executor, max_batch=64, max_wait=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(batcher.process(text=f"Ame {i}.", dialect="anlo", tasks=["tokenize"],
+                              output_format="dict") for i in range(40)))
+
+    assert len(asyncio.run(scenario())) == 40
+    assert executor.stats()["rejected"] == 0
+    executor.shutdown()
+
+
+def test_batch_and_stream_endpoints(client):
+    texts = ["Ame si le afi ma.", "", "Ɖevi la dzo."]
+    batch = client.post("/api/v1/process/batch", json={
+        "texts": texts, "dialect": "anlo", "tasks": ["tokenize"]}).json()
+    assert batch["errors"] == 1
+    assert batch["results"][0]["tokens"][0] == "Ame"
+    assert batch["results"][1]["batch_index"] == 1
+
+    body = "\n".join([json.dumps({"text": texts[0]}), "not json", json.dumps(texts[2])])
+    response = client.post("/api/v1/process/stream?dialect=anlo&tasks=tokenize",
+                           content=body.encode("utf-8"))
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("tokens") for line in lines] == [
+        batch["results"][0]["tokens"], None, batch["results"][2]["tokens"]]
+    assert lines[1]["batch_index"] == 1
+    assert routes.executor_instance.stats()["in_flight"] == 0
+
+    routes.pipeline_instance.config.api.max_line_bytes = 8
+    response = client.post("/api/v1/process/stream", content=json.dumps(texts[0]).encode())
+    assert response.status_code == 413
+
+
+def test_aborted_stream_releases_its_slot(client):
+    body = json.dumps("Ame si le afi ma.").encode("utf-8")
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    scope = {"type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"},
+             "http_version": "1.1", "method": "POST", "scheme": "http",
+             "path": "/api/v1/process/stream", "raw_path": b"/api/v1/process/stream",
+             "root_path": "", "query_string": b"tasks=tokenize",
+             "headers": [(b"content-length", str(len(body)).encode())],
+             "client": ("test", 1), "server": ("test", 80)}
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        # the client is already gone: nothing can be sent
+        raise OSError("connection reset")
+
+    async def request():
+        try:
+            await client.app(scope, receive, send)
+        except Exception:
+            pass
+
+    asyncio.run(request())
+    assert routes.executor_instance.stats()["in_flight"] == 0
+
+
+def test_models_are_listed_from_registry(client):
+    response = client.get("/api/v1/models")
+    assert response.status_code == 200
+    models = response.json()["available_models"]
+    assert models["pos_tagger"]["version"] == "v1.2"
+    assert models["embeddings"]["format"] == "word2vec"
+
+
+def test_admin_reload_and_rollback(client):
+    pipeline = routes.pipeline_instance
+    old = pipeline.get_processor("pos_tagger")
+    response = client.post("/api/v1/admin/models/pos_tagger/reload", json={})
+    assert response.status_code == 403
+
+    client.app.dependency_overrides[get_current_user] = lambda: "user_admin"
+    response = client.post("/api/v1/admin/models/pos_tagger/reload", json={})
+    assert response.status_code == 200
+    assert pipeline.get_processor("pos_tagger") is not old
+    assert client.post("/api/v1/admin/models/pos_tagger/rollback").status_code == 200
+    assert pipeline.get_processor("pos_tagger") is old
+    response = client.post("/api/v1/admin/models/pos_tagger/reload", json={"version": "v9"})
+    assert response.status_code == 400
+
+
+def test_process_endpoint_uses_location_prior(config, tmp_path):
+    (tmp_path / "dialects").mkdir()
+    (tmp_path / "dialects" / "geo_distribution.json").write_text(json.dumps(
+        {"geo_distribution": {"points": [{"lat": 6.6, "lon": 0.47, "dialects": {"ho": 1.0}}]}}),
+        encoding="utf-8")
+    config.data.linguistic_resources_path = str(tmp_path)
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: "test_user"
+    routes.set_pipeline_instance(Pipeline(config))
+    client = TestClient(app)
+
+    body = {"text": "Ame si le afi ma.", "tasks": ["tokenize", "dialect"]}
+    assert client.post("/api/v1/process", json=body).json()["dialect_detected"] == "anlo"
+    response = client.post("/api/v1/process", json=dict(body, location={"lat": 6.6, "lon": 0.47}))
+    assert response.json()["dialect_detected"] == "ho"
+    assert response.json()["results"]["dialect_analysis"]["prior"]["ho"] > 0.9
+    assert client.post("/api/v1/process", json=dict(body, location={"lat": 120})).status_code == 422
+    routes.executor_instance.shutdown()
@@ -0,0 +1,280 @@
+import json
+
+import pytest
+
+from src.core.pipeline import Pipeline
+from src.exceptions import ConfigurationError, ProcessingError
+
+
+def test_tokenizer_runs_once_for_all_tasks(config):
+    pipeline = Pipeline(config)
+    tokenizer = pipeline.get_processor('tokenizer')
+    calls = []
+    original = tokenizer.tokenize_spans
+    tokenizer.tokenize_spans = lambda text, dialect: calls.append(text) or original(text, dialect)
+
+    results = json.loads(pipeline.process(
+        "Ame si le afi ma.", dialect="anlo",
+        tasks=["normalize", "pos", "tone", "morphology", "embeddings"]))
+
+    assert len(calls) == 1
+    assert "tokens" not in results
+    assert results["pos_tags"][0] == ["ame", "NOUN"]
+    assert results["final_dialect"] == "anlo"
+
+
+def test_auto_dialect_is_detected(config):
+    pipeline = Pipeline(config)
+    results = json.loads(pipeline.process("Ame si le afi ma.", tasks=["tokenize"]))
+    assert results["dialect_detected"] == results["final_dialect"]
+    assert results["tokens"] == ["Ame", "si", "le", "afi", "ma", "."]
+
+
+def test_batch_process_matches_single_and_isolates_errors(config):
+    config.processing.batch_size = 2
+    pipeline = Pipeline(config)
+    texts = ["Ame si le afi ma.", "", "Ɖeka, eve, etɔ̃."]
+    tasks = ["tokenize", "normalize", "pos", "embeddings"]
+
+    results = [json.loads(r) for r in pipeline.batch_process(texts, tasks=tasks)]
+
+    assert results[1]["batch_index"] == 1 and "error" in results[1]
+    single = json.loads(pipeline.process(texts[2], tasks=tasks))
+    assert results[2]["pos_tags"] == single["pos_tags"]
+    assert results[2]["embeddings"] == single["embeddings"]
+
+
+def test_parallel_batch_process_preserves_order(config):
+    config.processing.batch_size = 1
+    pipeline = Pipeline(config)
+    texts = ["Ame si le afi ma.", "", "Mia yi."]
+
+    parallel = pipeline.batch_process(texts, output_format="text", num_workers=2)
+
+    assert parallel[0] == pipeline.process(texts[0], output_format="text")
+    assert parallel[1].startswith("Error:")
+    assert parallel[2] == pipeline.process(texts[2], output_format="text")
+
+
+def test_parallel_workers_use_the_pipeline_profile_and_versions(config, tmp_path):
+    from src.core import parallel
+
+    registry = tmp_path / "MODEL_REGISTRY.json"
+    registry.write_text(json.dumps({"models": {"pos_tagger": {"active": "v1", "versions": {
+        "v1": {"path": "pos_v1.pkl"}, "v2": {"path": "pos_v2.pkl"}}}}}))
+    config.models.registry_path = str(registry)
+    pipeline = Pipeline(config, profile="light")
+    texts = ["Ame si le afi ma.", "Mia yi."]
+    results = pipeline.batch_process(texts, tasks=["pos"], output_format="text", num_workers=2)
+    assert all(result.startswith("Error:") and "light" in result for result in results)
+
+    parallel._init_worker(config, {"pos_tagger": "v2"}, "light")
+    try:
+        assert parallel._worker_pipeline.profile == "light"
+        assert parallel._worker_pipeline.get_model_versions() == {"pos_tagger": "v2"}
+    finally:
+        parallel._worker_pipeline = None
+
+
+def test_stream_yields_one_result_per_sentence(config):
+    pipeline = Pipeline(config)
+    lines = iter(["Ame si le", "afi ma. Mia yi.", "", "Ɖeka"])
+
+    results = [json.loads(r) for r in pipeline.stream(lines, tasks=["tokenize"])]
+
+    assert [r["input_text"] for r in results] == ["Ame si le afi ma.", "Mia yi.", "Ɖeka"]
+
+    with pytest.raises(ProcessingError):
+        next(pipeline.stream(lines, output_format="json"))
+
+
+def test_repeated_text_is_served_from_cache(config):
+    pipeline = Pipeline(config)
+    first = json.loads(pipeline.process("Ŋdi na wo.", tasks=["tokenize", "pos"]))
+    second = json.loads(pipeline.process("Ŋdi na wo.", tasks=["pos", "tokenize"]))
+
+    assert second["pos_tags"] == first["pos_tags"]
+    assert second["tasks"] == ["pos", "tokenize"]
+    assert pipeline.get_cache_stats()["memory_hits"] == 1
+
+    restarted = Pipeline(config)
+    restarted.process("Ŋdi na wo.", tasks=["tokenize", "pos"])
+    assert restarted.get_cache_stats()["disk_hits"] == 1
+
+
+def test_cache_fingerprint_follows_backend_and_resources(config, tmp_path):
+    import shutil
+    from src.core.cache import model_fingerprint
+
+    resources = tmp_path / "resources"
+    shutil.copytree(config.data.linguistic_resources_path, resources)
+    config.data.linguistic_resources_path = str(resources)
+    fingerprint = model_fingerprint(config)
+
+    config.models.pos_backend = "crf"
+    assert model_fingerprint(config) != fingerprint
+    config.models.pos_backend = "hmm"
+    assert model_fingerprint(config) == fingerprint
+
+    (resources / "morphology" / "stems.json").write_text('{"stems": ["ame"]}')
+    morphology = model_fingerprint(config)
+    assert morphology != fingerprint
+    (resources / "dialects" / "geo_distribution.json").write_text('{"geo_distribution": {}}')
+    assert model_fingerprint(config) != morphology
+
+
+def test_cached_results_are_private_and_exact(config):
+    import unicodedata
+    pipeline = Pipeline(config)
+    nfc = "Étɔ̃ é ame."
+    pipeline.process(unicodedata.normalize("NFD", nfc), tasks=["tokenize", "offsets"])
+    results = pipeline.process(nfc, tasks=["tokenize", "offsets"], output_format="dict")
+    assert [nfc[a:b] for a, b in results["token_offsets"]] == results["tokens"]
+
+    results["tokens"].append("X")
+    again = pipeline.process(nfc, tasks=["tokenize", "offsets"], output_format="dict")
+    assert "X" not in again["tokens"]
+
+
+def test_conllu_keeps_tags_of_repeated_tokens(config):
+    pipeline = Pipeline(config)
+    pipeline.get_processor('pos_tagger').tag = \
+        lambda tokens, dialect: [(tok, f"T{i}") for i, tok in enumerate(tokens)]
+
+    output = pipeline.process("si si.", dialect="anlo",
+                              tasks=["tokenize", "pos", "offsets"], output_format="conllu")
+
+    assert output.splitlines()[2:5] == [
+        "1\tsi\t_\tT0\t_\t_\t_\t_\t_\t_",
+        "2\tsi\t_\tT1\t_\t_\t_\t_\t_\tSpaceAfter=No",
+        "3\t.\t_\tT2\t_\t_\t_\t_\t_\t_",
+    ]
+
+
+def test_structured_and_columnar_output(config):
+    import io
+    import numpy as np
+    pipeline = Pipeline(config)
+
+    results = pipeline.process("Ame si.", dialect="anlo", tasks=["tokenize", "pos"],
+                               output_format="dict")
+    assert results["tokens"] == ["Ame", "si", "."]
+    assert "token_offsets" not in results
+
+    archive = np.load(io.BytesIO(pipeline.process(
+        "Ame si.", dialect="anlo", tasks=["tokenize", "pos", "offsets"],
+        output_format="npz")))
+    assert list(archive["tokens"]) == ["Ame", "si", "."]
+    assert archive["token_offsets"].tolist() == [[0, 3], [4, 6], [6, 7]]
+
+
+def test_embeddings_are_gathered_per_type_and_kept_as_arrays(config):
+    import io
+    import numpy as np
+
+    class Vectors:
+        key_to_index = {"ame": 0, "si": 1}
+        vectors = np.array([[1, 0], [0, 1]], dtype=np.float32)
+        vector_size = 2
+
+    pipeline = Pipeline(config)
+    pipeline.get_processor('embeddings').vectors = Vectors()
+    results = pipeline.batch_process(["ame si ame.", "si"], dialect="anlo",
+                                     tasks=["embeddings"], output_format="dict")
+    assert results[0]["embeddings"] == [[1, 0], [0, 1], [1, 0], None]
+    assert results[1]["embeddings"] == [[0, 1]]
+
+    archive = np.load(io.BytesIO(pipeline.process(
+        "si ame", dialect="anlo", tasks=["embeddings"], output_format="npz")))
+    assert archive["embeddings"].tolist() == [[0, 1], [1, 0]]
+
+
+def test_light_profile_loads_processors_on_first_use(config):
+    pipeline = Pipeline(config, profile="light")
+    assert pipeline.get_loaded_processors() == []
+
+    pipeline.process("Ame si.", dialect="anlo", tasks=["tokenize", "normalize"])
+    assert sorted(pipeline.get_loaded_processors()) == ["normalizer", "tokenizer"]
+    assert "pos" not in pipeline.get_available_tasks()
+    with pytest.raises(ProcessingError):
+        pipeline.process("Ame si.", dialect="anlo", tasks=["pos"])
+
+
+def test_reload_swaps_model_version_and_rolls_back(config, tmp_path):
+    registry = tmp_path / "MODEL_REGISTRY.json"
+    registry.write_text(json.dumps({"models": {"pos_tagger": {"active": "v1", "versions": {
+        "v1": {"path": "pos_v1.pkl"}, "v2": {"path": "pos_v2.pkl"}}}}}))
+    config.models.registry_path = str(registry)
+    pipeline = Pipeline(config)
+    old = pipeline.get_processor('pos_tagger')
+    fingerprint = pipeline._cache.fingerprint
+
+    assert pipeline.reload_model('pos_tagger', 'v2') == {
+        "processor": "pos_tagger", "version": "v2", "previous_version": None}
+    new = pipeline.get_processor('pos_tagger')
+    assert new is not old and new.model_path.endswith("pos_v2.pkl")
+    assert pipeline.get_model_versions() == {"pos_tagger": "v2"}
+    assert pipeline._cache.fingerprint != fingerprint
+
+    with pytest.raises(ConfigurationError):
+        pipeline.reload_model('pos_tagger', 'v3')
+    assert pipeline.get_processor('pos_tagger') is new
+
+    assert pipeline.rollback_model('pos_tagger')["version"] is None
+    assert pipeline.get_processor('pos_tagger') is old
+    assert pipeline._cache.fingerprint == fingerprint
+
+
+def test_registered_model_with_wrong_checksum_is_refused(config, tmp_path):
+    from src.core.dialect_handler import DialectDetector
+    from src.core.model_registry import model_registry, shared_store
+    from src.exceptions import ModelLoadError
+
+    detector = DialectDetector.train(["ame si le afi ma", "ame si le afi"] * 5,
+                                     ["anlo", "inland"] * 5, epochs=1)
+    detector.save(str(tmp_path / "dialect_v1.npz"))
+    config.models.registry_path = str(tmp_path / "MODEL_REGISTRY.json")
+    model_registry(config).register("dialect_classifier", "v1", str(tmp_path / "dialect_v1.npz"))
+    assert model_registry(config).describe()["dialect_classifier"]["verified"] is False
+
+    pipeline = Pipeline(config)
+    assert pipeline.get_processor('dialect_detector').weights is not None
+    assert model_registry(config).describe()["dialect_classifier"]["verified"] is True
+
+    data = json.loads((tmp_path / "MODEL_REGISTRY.json").read_text())
+    data["models"]["dialect_classifier"]["versions"]["v1"]["sha256"] = "0" * 64
+    (tmp_path / "MODEL_REGISTRY.json").write_text(json.dumps(data))
+    model_registry(config).reload()
+    shared_store().evict(str(tmp_path / "dialect_v1.npz"))
+    with pytest.raises(ModelLoadError, match="Checksum mismatch"):
+        Pipeline(config).get_processor('dialect_detector')
+
+
+def test_worker_count_defaults_to_processing_num_workers(config, tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from src.cli import cli
+    from src.core import parallel
+
+    calls = []
+    monkeypatch.setattr(parallel, "parallel_batch_process",
+                        lambda config, texts, dialect, tasks, output_format, num_workers, *args:
+                        calls.append(num_workers) or [])
+    texts = ["Ame si le afi ma.", "Mia yi."]
+    assert len(Pipeline(config).batch_process(texts)) == 2
+    config.processing.num_workers = 3
+    Pipeline(config).batch_process(texts)
+    assert calls == [3]
+
+    calls = []
+    monkeypatch.setattr(Pipeline, "stream",
+                        lambda self, texts, num_workers=None, **kwargs:
+                        calls.append(num_workers) or iter(()))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("Ame si le afi ma.", encoding="utf-8")
+
+    runner = CliRunner()
+    runner.invoke(cli, ["process", str(input_file), "-f", "jsonl"], catch_exceptions=False)
+    runner.invoke(cli, ["process", str(input_file), "-f", "jsonl", "-w", "3"],
+                  catch_exceptions=False)
+
+    assert calls == [None, 3]
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import time of the CLI, in milliseconds. Shell pipelines call
+# `lexlang` once per job, so startup must stay well under 200 ms.
+IMPORT_BUDGET_MS = float(os.environ.get("LEXLANG_IMPORT_BUDGET_MS", 150))
+
+HEAVY_MODULES = ("numpy", "torch", "gensim", "fastapi", "pydantic")
+
+
+def import_time_ms(module):
+    """Cumulative import time of ``module`` reported by ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000.0
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+def test_cli_import_time_budget():
+    # best of three, to keep a cold disk cache from failing the run
+    elapsed = min(import_time_ms("src.cli") for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_MS, (
+        f"import src.cli took {elapsed:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+
+def test_cli_import_skips_heavy_backends():
+    code = ("import sys, src.cli; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+# Tokens per second of the HMM tagger on one core (default low-latency tagger)
+HMM_MIN_TOKENS_PER_SECOND = float(os.environ.get("LEXLANG_HMM_MIN_TPS", 20000))
+
+
+def test_hmm_tagger_throughput():
+    import random
+    import time
+
+    from src.core.pos_tagger.hmm_tagger import HMMTagger
+
+    rng = random.Random(0)
+    tags = ["NOUN", "VERB", "PRON", "DET", "ADV", "ADP", "PUNCT"]
+    words = [f"w{i}{rng.choice('aeiouɔɛ')}" for i in range(3000)]
+    sentences = [[(rng.choice(words), rng.choice(tags)) for _ in range(rng.randint(5, 30))]
+                 for _ in range(2000)]
+    tagger = HMMTagger.train(sentences)
+    docs = [[rng.choice(words + ["unseenwordɔ"]) for _ in range(rng.randint(5, 30))]
+            for _ in range(2000)]
+    total = sum(map(len, docs))
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for doc in docs:
+            tagger.predict(doc, "anlo")
+        best = min(best, time.perf_counter() - start)
+    assert total / best > HMM_MIN_TOKENS_PER_SECOND, f"{total / best:.0f} tokens/s"
+
+
+# Milliseconds per detection of a typical sentence: auto-detection runs on
+# every request with dialect="auto"
+DIALECT_MAX_MS = float(os.environ.get("LEXLANG_DIALECT_MAX_MS", 1.0))
+
+
+def test_dialect_detector_latency():
+    import random
+    import time
+
+    from src.core.dialect_handler import DialectDetector
+
+    rng = random.Random(0)
+    words = [f"w{i}{rng.choice('aeiouɔɛ')}" for i in range(2000)]
+    labels = [rng.choice(["anlo", "inland", "ho", "kpando"]) for _ in range(500)]
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 25))) for _ in labels]
+    detector = DialectDetector.train(texts, labels, epochs=2)
+    sentence = "Ame si le afi ma la, eya ŋutɔ dzo yi aƒeme kple viawo katã."
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(200):
+            detector.detect(sentence)
+        best = min(best, (time.perf_counter() - start) / 200 * 1000)
+    assert best < DIALECT_MAX_MS, f"{best:.3f} ms per detection"
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+
+from src.core.dialect_handler import DialectDetector
+
+# Formes propres à chaque dialecte, mêlées à un vocabulaire commun
+MARKERS = {
+    "anlo": ["ɖe", "nye", "lɔ̃", "eʋe"],
+    "inland": ["ɖo", "nyee", "ŋu", "amewo"],
+    "ho": ["hoɛ", "kpɔ", "dzi", "vɔ"],
+    "kpando": ["kpa", "ndo", "xɔ", "gbe"],
+}
+COMMON = ["ame", "si", "le", "afi", "ma", "la", "dzo", "nu"]
+
+
+def labelled_texts(count):
+    import random
+    rng = random.Random(0)
+    texts = []
+    for _ in range(count):
+        dialect = rng.choice(sorted(MARKERS))
+        words = [rng.choice(COMMON) if rng.random() < 0.6 else rng.choice(MARKERS[dialect])
+                 for _ in range(rng.randint(5, 12))]
+        texts.append((" ".join(words), dialect))
+    return texts
+
+
+def test_dialect_detector_is_trained_and_loaded_from_registry(tmp_path):
+    from src.config import LexLangConfig
+    from src.core.model_registry import model_registry
+    from src.scripts.training.train_dialect_classifier import train_dialect_classifier
+
+    corpus = tmp_path / "dialect_labeled.jsonl"
+    corpus.write_text("\n".join(json.dumps({"text": text, "dialect": dialect}, ensure_ascii=False)
+                                for text, dialect in labelled_texts(400)), encoding="utf-8")
+    config = LexLangConfig()
+    config.models.registry_path = str(tmp_path / "MODEL_REGISTRY.json")
+    path = train_dialect_classifier(str(corpus), "v9", config, output_dir=str(tmp_path))
+    assert path.endswith("dialect_ngram_v9.npz")
+
+    detector = DialectDetector(model_registry(config).path_for("dialect_classifier"), config)
+    texts = [" ".join(MARKERS[d] + COMMON[:3]) for d in sorted(MARKERS)]
+    assert detector.detect_batch(texts) == sorted(MARKERS)
+    assert [detector.detect(text) for text in texts] == sorted(MARKERS)
+
+    info = detector.analyze(texts[0], detailed=True)
+    assert info["predicted"] == "anlo"
+    assert abs(sum(info["scores"].values()) - 1.0) < 1e-6
+    assert info["confidence"] == max(info["scores"].values())
+
+
+def test_dialect_detector_without_model_is_uniform():
+    detector = DialectDetector(model_path=None)
+    assert detector.detect("Ame si le afi ma.") == "anlo"
+    assert set(detector.analyze("", detailed=True)["scores"].values()) == {0.25}
+
+
+def test_incremental_detection_and_segments():
+    texts = labelled_texts(400)
+    detector = DialectDetector.train([t for t, _ in texts], [d for _, d in texts])
+
+    def sentence(dialect):
+        return " ".join(MARKERS[dialect] + COMMON[:4]) + "."
+
+    # un livre entier : la lecture s'arrête dès que l'écart est atteint
+    book = " ".join(sentence("ho") for _ in range(5000))
+    result = detector.detect_incremental(book, margin=0.5)
+    assert result["predicted"] == "ho"
+    assert result["sentences"] < 10 and not result["complete"]
+    assert detector.detect_incremental(book, margin=1.1, max_chars=500)["chars_read"] < 600
+    detector.incremental_chars = 100
+    assert detector.detect(book) == "ho"
+
+    mixed = "\n".join([sentence("anlo")] * 3 + ["Ee."] + [sentence("kpando")] * 2)
+    segments = detector.segments(mixed)
+    assert [(s["dialect"], s["sentences"]) for s in segments] == [("anlo", 4), ("kpando", 2)]
+    assert mixed[segments[1]["start"]:segments[1]["end"]].startswith("kpa")
+    assert detector.analyze(mixed, detailed=True)["segments"] == segments
+
+
+def test_dialect_converter_applies_compiled_rules(tmp_path):
+    from src.config import LexLangConfig
+    from src.core.dialect_handler import DialectConverter
+    from src.exceptions import DialectConversionError
+
+    (tmp_path / "phonetics").mkdir()
+    (tmp_path / "dialects").mkdir()
+    (tmp_path / "phonetics" / "sound_correspondences.json").write_text(json.dumps(
+        {"sound_correspondences": [{"anlo": "ɣ", "inland": "g"},
+                                   {"anlo": "^ts", "inland": "^tɕ"},
+                                   {"anlo": "ɔ$", "inland": "o$"}]}), encoding="utf-8")
+    (tmp_path / "dialects" / "variation_rules.json").write_text(json.dumps(
+        {"variation_rules": {"anlo>inland": {"words": {"nye": "nyee"},
+                                             "rewrites": {"dz": "z", "dze": "ze"}}}}),
+        encoding="utf-8")
+    config = LexLangConfig()
+    config.data.linguistic_resources_path = str(tmp_path)
+    converter = DialectConverter(config)
+
+    # début / fin de mot, plus longue séquence, pas de réécriture en chaîne, casse
+    assert converter.convert_text("Nye ɣe tsitsi dzɔ, TSA dzedze!", "anlo", "inland") == \
+        "Nyee ge tɕitsi zo, TɕA zeze!"
+    assert converter.convert(["ɣɔ", "ame"], "anlo", "ho") == ["ɣɔ", "ame"]
+    assert list(converter.convert_lines(["ɣe\n", "\n", "dzɔ\n"], "anlo", "inland",
+                                        batch_size=2)) == ["ge\n", "\n", "zo\n"]
+    assert converter.mapper.variants("ɣɔ", "anlo")["inland"] == "go"
+    with pytest.raises(DialectConversionError):
+        converter.convert_text("ɣe", "anlo", "fon")
+
+    # la plus longue séquence l'emporte aussi sur une règle de début de mot plus courte
+    from src.core.dialect_handler.variation_mapper import ConversionPlan
+    plan = ConversionPlan(rewrites={"^x": "a", "xyz": "b", "e$": "c", "ee": "d"})
+    assert [plan.apply(w) for w in ["xyzee", "xa", "exe"]] == ["bd", "aa", "exc"]
+
+
+GEO = {"geo_distribution": {
+    "points": [{"lat": 5.92, "lon": 0.99, "region": "GH-TV", "dialects": {"anlo": 0.9, "inland": 0.1}},
+               {"lat": 6.60, "lon": 0.47, "region": "GH-TV", "dialects": {"ho": 0.8, "inland": 0.2}},
+               {"lat": 6.60, "lon": 0.30, "dialects": {"ho": 1.0}}],
+    "regions": {"TG-M": {"inland": 1.0}}}}
+
+
+def test_geo_prior_is_fused_with_text_scores(tmp_path):
+    from src.config import LexLangConfig
+    from src.core.dialect_handler.geo_classifier import GeoClassifier
+    from src.exceptions import ValidationError
+
+    (tmp_path / "dialects").mkdir()
+    (tmp_path / "dialects" / "geo_distribution.json").write_text(json.dumps(GEO), encoding="utf-8")
+    config = LexLangConfig()
+    config.data.linguistic_resources_path = str(tmp_path)
+
+    geo = GeoClassifier(config)
+    near_ho = geo.prior({"lat": 6.61, "lon": 0.45})
+    assert max(near_ho, key=near_ho.get) == "ho" and min(near_ho.values()) > 0
+    assert geo.prior({"lat": 9.0, "lon": 0.0}) is None                  # aucun point proche
+    assert max(geo.prior({"lat": 9.0, "lon": 0.0, "region": "tg-m"}).items(),
+               key=lambda item: item[1])[0] == "inland"
+    with pytest.raises(ValidationError):
+        geo.prior({"lat": 95.0, "lon": 0.0})
+
+    # sans modèle de texte, le prior décide ; avec un modèle, il départage
+    detector = DialectDetector(config=config)
+    assert detector.detect("Ame si le afi ma.") == "anlo"
+    assert detector.detect("Ame si le afi ma.", {"lat": 6.61, "lon": 0.45}) == "ho"
+    texts = labelled_texts(400)
+    detector = DialectDetector.train([t for t, _ in texts], [d for _, d in texts], config=config)
+    text = " ".join(MARKERS["kpando"] + COMMON)
+    info = detector.analyze(text, detailed=True, location={"lat": 5.92, "lon": 0.99})
+    assert info["predicted"] == "kpando" and info["prior"]["anlo"] > 0.5
+    assert info["scores"]["anlo"] > detector.scores(text)["anlo"]
+    assert detector.detect_batch(["ame si", "ame si"], [None, {"region": "TG-M"}])[1] == "inland"
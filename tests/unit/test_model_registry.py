@@ -0,0 +1,60 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from src.core.model_registry import ModelRegistry, ModelStore, parse_checksums
+from src.exceptions import ModelLoadError
+
+
+def write_registry(tmp_path, spec):
+    registry = tmp_path / "MODEL_REGISTRY.json"
+    registry.write_text(json.dumps({"models": spec}))
+    return str(registry)
+
+
+def test_registry_resolves_versions_and_checksums(tmp_path):
+    np.save(tmp_path / "tags_v2.npy", np.arange(6, dtype=np.float32))
+    path = write_registry(tmp_path, {"hmm": {"active": "v2", "versions": {
+        "v1": {"path": "tags_v1.npy"}, "v2": {"path": "tags_v2.npy"}}}})
+    checksums = tmp_path / "MODEL_CHECKSUMS.md"
+    checksums.write_text("| File | SHA-256 |\n|---|---|\n| tags_v2.npy | " + "a" * 64 + " |\n")
+
+    registry = ModelRegistry(path, str(checksums))
+    entry = registry.resolve("hmm")
+    assert (entry.version, entry.format, entry.sha256) == ("v2", "npy", "a" * 64)
+    assert registry.resolve("hmm", "v1").sha256 is None
+    with pytest.raises(ModelLoadError):
+        registry.resolve("hmm", "v3")
+    with pytest.raises(ModelLoadError, match="Checksum mismatch"):
+        ModelStore().load_entry(entry)
+
+    registered = registry.register("hmm", "v2", entry.path)
+    assert ModelRegistry(path, str(checksums)).resolve("hmm").sha256 == registered.sha256
+    assert registry.describe()["hmm"]["status"] == "active"
+
+
+def test_store_shares_memory_mapped_arrays(tmp_path):
+    np.save(tmp_path / "vectors.npy", np.ones((4, 3), dtype=np.float32))
+    store = ModelStore()
+    first = store.load(str(tmp_path / "vectors.npy"))
+    assert store.load(str(tmp_path / "vectors.npy")) is first
+    assert isinstance(first, np.memmap) and not first.flags.writeable
+    assert store.stats() == {"loads": 1, "hits": 1, "models": 1}
+
+
+def test_safetensors_are_memory_mapped(tmp_path):
+    data = np.arange(6, dtype=np.float32).tobytes()
+    header = json.dumps({"w": {"dtype": "F32", "shape": [2, 3],
+                               "data_offsets": [0, len(data)]}}).encode()
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(struct.pack("<Q", len(header)) + header + data)
+
+    tensors = ModelStore().load(str(path))
+    assert tensors["w"].shape == (2, 3)
+    assert tensors["w"][1, 2] == 5.0
+
+
+def test_parse_sha256sum_output():
+    assert parse_checksums("b" * 64 + "  pos/model.pkl\n") == {"pos/model.pkl": "b" * 64}
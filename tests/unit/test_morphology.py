@@ -0,0 +1,79 @@
+import json
+
+from src.config import LexLangConfig
+from src.core.morphology import Automaton, MorphologicalAnalyzer
+from src.core.morphology.morphological_analyzer import load_morphology
+
+RESOURCES = {
+    "prefixes.json": {"prefixes": {"a-": "NMLZ", "e-": {"gloss": "3SG"}}},
+    "suffixes.json": {"suffixes": [{"form": "-wo", "gloss": "PL", "features": {"number": "pl"}},
+                                   {"form": "-a", "gloss": "DEF"}, "-e"]},
+    "stems.json": {"stems": [{"form": "ŋkɔ", "pos": "NOUN", "gloss": "name"},
+                             {"form": "devi", "pos": "NOUN", "gloss": "child"},
+                             {"form": "dzi", "pos": "VERB", "gloss": "bear"}]},
+    "inflection_rules.json": {"inflection_rules": [
+        {"affix": "-a", "pos": "NOUN", "features": {"definite": True}},
+        {"affix": "e-", "pos": "VERB", "features": {"person": 3}}]},
+    "morpheme_boundaries.json": {"morpheme_boundaries": {
+        "max_suffixes": 2, "exceptions": {"ameawo": ["ame", "-a", "-wo"]}}},
+}
+
+
+def make_config(tmp_path):
+    morphology = tmp_path / "resources" / "morphology"
+    morphology.mkdir(parents=True)
+    for name, data in RESOURCES.items():
+        (morphology / name).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    config = LexLangConfig()
+    config.data.linguistic_resources_path = str(tmp_path / "resources")
+    config.data.cache_dir = str(tmp_path / "cache")
+    return config
+
+
+def test_automaton_ranks_words_in_sorted_order():
+    words = ["dzi", "devi", "dzo", "ŋkɔ", "de"]
+    automaton = Automaton.build(words)
+    assert len(automaton) == 5
+    assert [automaton.index(w) for w in sorted(words)] == list(range(5))
+    assert "dz" not in automaton
+    assert list(automaton.prefixes("devia")) == [(2, 0), (4, 1)]
+
+
+def test_segments_tokens_with_compiled_lexicons(tmp_path):
+    analyzer = MorphologicalAnalyzer(make_config(tmp_path))
+
+    analyses = analyzer.analyze(["Deviawo", "edzi", "ameawo", "xyz"], "anlo")["analyses"]
+    devi, edzi, ame, unknown = analyses
+    assert (devi["prefixes"], devi["stem"], devi["suffixes"]) == ([], "Devi", ["a", "wo"])
+    assert devi["pos"] == "NOUN" and devi["known"]
+    assert devi["features"] == {"definite": True, "number": "pl"}
+    assert [g["gloss"] for g in devi["glosses"]] == ["child", "DEF", "PL"]
+    assert (edzi["prefixes"], edzi["stem"], edzi["features"]) == (["e"], "dzi", {"person": 3})
+    assert (ame["stem"], ame["suffixes"]) == ("ame", ["a", "wo"])
+    # segmentation listée : radical inconnu, affixes résolus par les lexiques
+    assert (ame["known"], ame["pos"], ame["features"]) == (False, None, {"number": "pl"})
+    assert [g["gloss"] for g in ame["glosses"]] == ["DEF", "PL"]
+    assert unknown == {"token": "xyz", "prefixes": [], "stem": "xyz", "suffixes": [],
+                       "pos": None, "features": {}, "glosses": [], "known": False}
+
+    batch = analyzer.analyze_batch([["edzi"], ["Deviawo", "edzi"]], ["anlo", "ho"])
+    assert batch[1]["analyses"] == [devi, edzi]
+
+
+def test_compiled_artifact_is_reused_until_resources_change(tmp_path):
+    config = make_config(tmp_path)
+    resources = config.data.linguistic_resources_path
+    first = load_morphology(resources, config.data.cache_dir)
+    artifacts = list((tmp_path / "cache" / "morphology").glob("*.npz"))
+    assert len(artifacts) == 1
+
+    modified = artifacts[0].stat().st_mtime_ns
+    again = load_morphology(resources, config.data.cache_dir)
+    assert artifacts[0].stat().st_mtime_ns == modified
+    assert str(again["source_key"]) == str(first["source_key"])
+
+    stems = tmp_path / "resources" / "morphology" / "stems.json"
+    stems.write_text(json.dumps({"stems": ["ame"]}), encoding="utf-8")
+    changed = load_morphology(resources, config.data.cache_dir)
+    assert str(changed["source_key"]) != str(first["source_key"])
+    assert len(list((tmp_path / "cache" / "morphology").glob("*.npz"))) == 2
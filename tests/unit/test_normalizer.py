@@ -0,0 +1,31 @@
+from src.core.normalizer.text_normalizer import TextNormalizer
+from src.core.token_memo import TokenMemo
+
+
+def test_normalize_computes_each_type_once():
+    normalizer = TextNormalizer(config=None)
+    normalizer.memo = TokenMemo(max_entries=2)
+    tokens = normalizer.normalize(["Ame", "AME", "Ame", "Afi"], "anlo")
+    assert tokens == ["ame", "ame", "ame", "afi"]
+    stats = normalizer.memo.stats()[normalizer.memo_namespace]
+    assert (stats["misses"], stats["evictions"], stats["entries"]) == (3, 1, 2)
+
+
+def test_normalization_plan_fuses_rules():
+    from src.core.normalizer.normalization_plan import NormalizationPlan
+    plan = NormalizationPlan.from_rules(
+        {'lowercase': True, 'unicode_form': 'NFKC'},
+        {'replacements': {'ɛ': 'e', 'ŋm': 'm'}})
+    assert plan.apply("ƐŊMƐ") == "eme"
+    assert plan.apply("ﬁ") == "fi"
+    overlapping = NormalizationPlan(replacements={'ɔ': 'o', 'ɔɔ': 'X', 'a': 'ɔ'})
+    assert overlapping.apply("ɔɔɔa") == "Xoɔ"
+
+
+def test_memo_entries_are_scoped_to_the_rule_plan():
+    from src.core.normalizer.normalization_plan import NormalizationPlan
+    first = TextNormalizer(config=None)
+    second = TextNormalizer(config=None)
+    second.plan = NormalizationPlan(replacements={'a': 'X'})
+    assert first.normalize(["a"], "anlo") == ["a"]
+    assert second.normalize(["a"], "anlo") == ["X"]
@@ -1,6 +1,101 @@
+import pytest
+
+from src.core.pos_tagger.hmm_tagger import HMMTagger
 from src.core.pos_tagger.neural_tagger import NeuralTagger
 
 def test_pos_tagger():
     tagger = NeuralTagger(model_path="models/pos/pos_model_v1.2.pkl", config=None)
     tags = tagger.tag(["Ame", "si"], "anlo")
     assert all(len(pair) == 2 for pair in tags)
+
+
+SENTENCES = [
+    [("Ame", "NOUN"), ("si", "PRON"), ("le", "VERB"), ("afi", "ADV"), ("ma", "DET"), (".", "PUNCT")],
+    [("Ɖevi", "NOUN"), ("la", "DET"), ("dzo", "VERB"), (".", "PUNCT")],
+    [("Nyɔnuvi", "NOUN"), ("la", "DET"), ("fia", "VERB"), ("nu", "NOUN"), (".", "PUNCT")],
+]
+
+
+def test_hmm_tagger_is_trained_and_loaded_from_registry(tmp_path):
+    import json
+    from src.config import LexLangConfig
+    from src.core.model_registry import model_registry
+    from src.core.pos_tagger import POSTagger
+    from src.scripts.training.train_pos_tagger import train_pos_tagger
+
+    corpus = tmp_path / "pos_tagged.jsonl"
+    corpus.write_text("\n".join(
+        json.dumps({"tokens": [t for t, _ in s], "tags": [g for _, g in s]})
+        for s in SENTENCES * 5 + [[("Ŋutsuwo", "NOUN"), ("dzo", "VERB")]]),
+        encoding="utf-8")
+    config = LexLangConfig()
+    config.models.registry_path = str(tmp_path / "MODEL_REGISTRY.json")
+    path = train_pos_tagger(str(corpus), "v9", config, output_dir=str(tmp_path))
+
+    tagger = POSTagger(model_registry(config).path_for("pos_tagger"), config)
+    assert tagger.tag(["Ame", "si", "le", "afi", "ma", "."], "anlo").tags() == \
+        ["NOUN", "PRON", "VERB", "ADV", "DET", "PUNCT"]
+    # mot inconnu : classé par son suffixe
+    batch = tagger.tag_batch([["Ɖevi", "la", "dzo", "."], [], ["Ɖeviwo", "la"]], ["anlo"] * 3)
+    assert [tags.tags() for tags in batch] == [["NOUN", "DET", "VERB", "PUNCT"], [], ["NOUN", "DET"]]
+    assert path.endswith("pos_hmm_v9.npz")
+
+
+def test_crf_tagger_uses_compiled_features(tmp_path):
+    from src.core.pos_tagger.crf_tagger import CRFTagger
+    from src.exceptions import ModelLoadError
+
+    sentences = SENTENCES * 5 + [[("Ŋutsuwo", "NOUN"), ("dzo", "VERB")]]
+    CRFTagger.train(sentences, ["anlo"] * len(sentences), epochs=5).save(str(tmp_path / "crf.npz"))
+    tagger = CRFTagger(model_path=str(tmp_path / "crf.npz"))
+    assert tagger.predict_batch(
+        [["Ame", "si", "le", "afi", "ma", "."], [], ["Ɖeviwo", "la", "dzo"]], ["anlo", "anlo", "ho"]) == \
+        [["NOUN", "PRON", "VERB", "ADV", "DET", "PUNCT"], [], ["NOUN", "DET", "VERB"]]
+    # une seule ligne de scores par type, quel que soit le nombre d'occurrences
+    assert len(tagger._type_rows) == 9
+
+    HMMTagger.train(sentences).save(str(tmp_path / "hmm.npz"))
+    with pytest.raises(ModelLoadError):
+        CRFTagger(model_path=str(tmp_path / "hmm.npz"))
+
+
+def test_crf_type_cache_limit_keeps_rows_of_the_call(tmp_path, monkeypatch):
+    from src.core.pos_tagger import crf_tagger
+
+    words = [f"a{i}" for i in range(5)] + [f"b{i}" for i in range(5)]
+    sentences = [[(w, "NOUN" if w[0] == "a" else "VERB") for w in words]] * 5
+    tagger = crf_tagger.CRFTagger.train(sentences, epochs=5)
+    expected = ["NOUN"] * 5 + ["VERB"] * 5
+    assert tagger.predict(words, "anlo") == expected
+
+    monkeypatch.setattr(crf_tagger, "TYPE_CACHE_SIZE", 4)
+    small = crf_tagger.CRFTagger.train(sentences, epochs=5)
+    assert small.predict(words, "anlo") == expected
+    assert small.predict_batch([words[:3], words[3:]], ["anlo"] * 2) == [expected[:3], expected[3:]]
+
+
+def test_neural_tagger_buckets_windows_and_exports(tmp_path):
+    pytest.importorskip("torch")
+    from src.config import LexLangConfig
+
+    vocab = ["<pad>", "<unk>"] + [f"w{i}" for i in range(50)]
+    tagger = NeuralTagger.build(vocab, ["NOUN", "VERB", "DET"])
+    docs = [[f"w{(i * 7 + j) % 60}" for j in range(1 + i % 37)] for i in range(40)]
+    batched = tagger.predict_batch(docs, ["anlo"] * len(docs))
+    # le remplissage des compartiments ne change pas le résultat
+    assert batched == [tagger.predict(doc, "anlo") for doc in docs]
+
+    long_doc = [f"w{j % 50}" for j in range(300)]
+    whole = tagger.predict(long_doc, "anlo")
+    tagger.max_length = 32
+    assert tagger.predict(long_doc, "anlo") == whole
+
+    config = LexLangConfig()
+    tagger.save(str(tmp_path / "pos.pt"))
+    tagger.export_torchscript(str(tmp_path / "pos.ts"))
+    for path in ("pos.pt", "pos.ts"):
+        loaded = NeuralTagger(str(tmp_path / path), config)
+        assert loaded.predict_batch(docs, ["anlo"] * len(docs)) == batched
+    quantized = NeuralTagger(str(tmp_path / "pos.pt"), config).quantize()
+    assert [len(tags) for tags in quantized.predict_batch(docs, [""] * len(docs))] == \
+        [len(doc) for doc in docs]
@@ -4,3 +4,24 @@ def test_basic_tokenization():
     tokenizer = WordTokenizer(config=None)
     tokens = tokenizer.tokenize("Ame si le afi ma.", "anlo")
     assert tokens == ["Ame", "si", "le", "afi", "ma", "."]
+
+
+def test_dialect_rules_and_offsets():
+    from src.core.tokenizer.dialect_aware_tokenizer import DialectAwareTokenizer
+    tokenizer = DialectAwareTokenizer(config=None)
+    tokenizer.global_rules = {'multiword_expressions': ['le eme'],
+                              'clitics': {'nyea': ['nye', 'a']}}
+    text = "Nyea le eme etɔ̃."
+    tokens = tokenizer.tokenize_with_offsets(text, "anlo")
+    assert [t for t, _, _ in tokens] == ["Nye", "a", "le eme", "etɔ̃", "."]
+    assert all(text[start:end] == t for t, start, end in tokens)
+
+
+def test_unknown_dialect_is_rejected_before_loading_rules():
+    import pytest
+    from src.core.tokenizer.dialect_aware_tokenizer import DialectAwareTokenizer
+    from src.exceptions import TokenizationError
+    tokenizer = DialectAwareTokenizer(config=None)
+    with pytest.raises(TokenizationError):
+        tokenizer.tokenize("Ame.", "../../configs/default")
+    assert "../../configs/default" not in tokenizer._compiled